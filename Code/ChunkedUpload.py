@@ -0,0 +1,259 @@
+import io
+import os
+import re
+import json
+import threading
+from pathlib import Path
+from typing import Union, List
+import pyexcel
+
+# size of the chunks which the clients are asked to send, it has to stay below the MAX_CONTENT_LENGTH of a request
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+UPLOAD_ID_REGEX = re.compile('[0-9a-f]{32}')
+# seconds to wait for a background parser to parse the last records before the file is parsed again instead
+PARSER_FINISH_TIMEOUT = 60
+
+# background parsers of the uploads of this process which are in progress
+active_parsers = dict()
+active_parsers_lock = threading.Lock()
+
+
+class ChunkedUpload:
+	def __init__(self, upload_folder: Union[str, Path], upload_id: str):
+		"""
+		An upload which is received a chunk at a time and written straight to a part file on the disk.
+		The number of bytes received so far is the size of the part file, so an interrupted upload is resumed
+		from there, even after the server restarted
+		:param upload_folder: folder which holds the uploads in progress of a project
+		:param upload_id:
+		"""
+		if not UPLOAD_ID_REGEX.fullmatch(upload_id):
+			raise ValueError("Upload not found")
+		self.folder = Path(upload_folder) / upload_id
+		self.upload_id = upload_id
+		self.part_path = str(self.folder / "data.part")
+		self.meta_path = str(self.folder / "upload.json")
+		if not os.path.exists(self.meta_path):
+			raise ValueError("Upload not found")
+		with open(self.meta_path, 'r') as meta_file:
+			meta = json.load(meta_file)
+		self.filename = meta['filename']
+		self.size = meta['size']
+
+	@staticmethod
+	def create(upload_folder: Union[str, Path], upload_id: str, filename: str, size: int) -> 'ChunkedUpload':
+		"""
+		This function starts a new upload with an empty part file
+		:param upload_folder:
+		:param upload_id:
+		:param filename: name of the file on the client
+		:param size: size of the whole file in bytes
+		:return:
+		"""
+		folder = Path(upload_folder) / upload_id
+		folder.mkdir(parents=True, exist_ok=True)
+		open(str(folder / "data.part"), 'wb').close()
+		with open(str(folder / "upload.json"), 'w') as meta_file:
+			json.dump({'filename': filename, 'size': size}, meta_file)
+		return ChunkedUpload(upload_folder, upload_id)
+
+	def get_received_bytes(self) -> int:
+		"""
+		This function returns the number of bytes received so far
+		:return:
+		"""
+		return os.path.getsize(self.part_path)
+
+	def write_chunk(self, offset: int, chunk: bytes) -> int:
+		"""
+		This function writes a chunk at its offset in the part file. A chunk may be sent again after an interruption,
+		it then overwrites the bytes already received, but no bytes may be skipped
+		:param offset:
+		:param chunk:
+		:return: number of bytes received so far
+		"""
+		received_bytes = self.get_received_bytes()
+		if offset < 0 or offset > received_bytes:
+			raise ValueError("Chunk at byte " + str(offset) + " does not follow the " + str(received_bytes) + " bytes received")
+		if offset + len(chunk) > self.size:
+			raise ValueError("Chunk at byte " + str(offset) + " goes past the end of the file")
+		with open(self.part_path, 'r+b') as part_file:
+			part_file.seek(offset)
+			is_modified = part_file.read(received_bytes - offset)[:len(chunk)] != chunk[:received_bytes - offset]
+			part_file.seek(offset)
+			part_file.write(chunk)
+		if is_modified:
+			# bytes which may have been parsed already have changed, the file is parsed again from the start
+			cancel_upload_parser(self)
+		received_bytes = max(received_bytes, offset + len(chunk))
+		parser = get_upload_parser(self)
+		if parser:
+			parser.notify(received_bytes)
+		return received_bytes
+
+	def is_complete(self) -> bool:
+		"""
+		This function checks if all the bytes of the file have been received
+		:return:
+		"""
+		return self.get_received_bytes() == self.size
+
+	def finish(self, file_path: str) -> Union[List[list], None]:
+		"""
+		This function moves the received file to its destination and removes the upload
+		:param file_path:
+		:return: rows of the file if they were parsed while the chunks arrived, else None
+		"""
+		rows = None
+		with active_parsers_lock:
+			parser = active_parsers.pop(self.upload_id, None)
+		if parser:
+			rows = parser.finish()
+		os.replace(self.part_path, file_path)
+		os.remove(self.meta_path)
+		os.rmdir(str(self.folder))
+		return rows
+
+
+class CsvUploadParser:
+	def __init__(self, part_path: str, size: int):
+		"""
+		Parses the records of a csv upload in a background thread as its chunks arrive, so that the rows are ready
+		when the last chunk has been received. The bytes are parsed in batches which end at a record boundary, i.e.
+		a line break preceded by an even number of quotes, with the same type detection as a csv file read by pyexcel
+		:param part_path:
+		:param size:
+		"""
+		self.part_path = part_path
+		self.size = size
+		self.rows = list()
+		self.parsed_bytes = 0
+		# the parser of an upload which is resumed may be started after some or all of its bytes have been received
+		self.received_bytes = os.path.getsize(part_path)
+		self.error = None
+		self.is_cancelled = False
+		self.condition = threading.Condition()
+		self.thread = threading.Thread(target=self.run, daemon=True)
+		self.thread.start()
+
+	def notify(self, received_bytes: int) -> None:
+		"""
+		This function wakes up the parser when more bytes have been received
+		:param received_bytes:
+		:return:
+		"""
+		with self.condition:
+			self.received_bytes = max(self.received_bytes, received_bytes)
+			self.condition.notify()
+
+	def cancel(self) -> None:
+		"""
+		This function stops the parser, its rows are dropped
+		:return:
+		"""
+		with self.condition:
+			self.is_cancelled = True
+			self.condition.notify()
+
+	def run(self) -> None:
+		"""
+		This function parses the batches of records as they arrive until the whole file has been parsed
+		:return:
+		"""
+		try:
+			while self.parsed_bytes < self.size:
+				with self.condition:
+					while self.received_bytes <= self.parsed_bytes and not self.is_cancelled:
+						self.condition.wait()
+					if self.is_cancelled:
+						return
+					received_bytes = self.received_bytes
+				with open(self.part_path, 'rb') as part_file:
+					part_file.seek(self.parsed_bytes)
+					data = part_file.read(received_bytes - self.parsed_bytes)
+				end = len(data) if received_bytes == self.size else get_last_record_end(data)
+				if end:
+					self.parse_records(data[:end])
+					self.parsed_bytes += end
+				elif received_bytes < self.size:
+					# the received bytes hold no complete record yet
+					with self.condition:
+						while self.received_bytes == received_bytes and not self.is_cancelled:
+							self.condition.wait()
+		except Exception as e:
+			self.error = e
+
+	def parse_records(self, data: bytes) -> None:
+		"""
+		This function parses a batch of complete records
+		:param data:
+		:return:
+		"""
+		# decoded with universal newlines like a file opened in text mode by pyexcel
+		text = io.TextIOWrapper(io.BytesIO(data), encoding='utf-8').read()
+		self.rows.extend(list(row_values) for row_values in pyexcel.iget_array(file_content=text, file_type='csv'))
+		pyexcel.free_resources()
+
+	def finish(self) -> Union[List[list], None]:
+		"""
+		This function waits for the parser to parse the last records and returns the rows padded with empty cells
+		to the width of the widest row, like the rows of a csv file read by pyexcel
+		:return: None if the file could not be parsed in time
+		"""
+		# all the bytes have been received when the upload is finished
+		self.notify(self.size)
+		self.thread.join(PARSER_FINISH_TIMEOUT)
+		if self.thread.is_alive():
+			self.cancel()
+			return None
+		if self.error or self.is_cancelled:
+			return None
+		width = max((len(row_values) for row_values in self.rows), default=0)
+		return [row_values + [''] * (width - len(row_values)) for row_values in self.rows]
+
+
+def get_last_record_end(data: bytes) -> int:
+	"""
+	This function returns the offset just after the last line break which ends a record, line breaks inside quoted
+	fields are skipped by keeping track of the parity of the quotes before them
+	:param data:
+	:return: 0 if the data holds no complete record
+	"""
+	end = 0
+	position, quotes = 0, 0
+	line_break = data.find(b"\n")
+	while line_break != -1:
+		quotes += data[position:line_break].count(b'"')
+		if quotes % 2 == 0:
+			end = line_break + 1
+		position = line_break
+		line_break = data.find(b"\n", line_break + 1)
+	return end
+
+
+def get_upload_parser(upload: ChunkedUpload) -> Union[CsvUploadParser, None]:
+	"""
+	This function returns the background parser of a csv upload, the parser is started with the first chunk
+	or when an upload is resumed after the server restarted.
+	xlsx and xls files cannot be parsed before they have been received completely, they have no parser
+	:param upload:
+	:return:
+	"""
+	if not upload.filename.lower().endswith(".csv"):
+		return None
+	with active_parsers_lock:
+		if upload.upload_id not in active_parsers:
+			active_parsers[upload.upload_id] = CsvUploadParser(upload.part_path, upload.size)
+		return active_parsers[upload.upload_id]
+
+
+def cancel_upload_parser(upload: ChunkedUpload) -> None:
+	"""
+	This function stops the background parser of an upload
+	:param upload:
+	:return:
+	"""
+	with active_parsers_lock:
+		parser = active_parsers.pop(upload.upload_id, None)
+	if parser:
+		parser.cancel()
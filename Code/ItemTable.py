@@ -1,47 +1,99 @@
 from typing import Union
-import csv
-import pyexcel
-from copy import deepcopy
 from collections import OrderedDict
-from Code.utility_functions import get_actual_cell_index, check_if_string_is_invalid, natural_sort_key, split_cell
+from Code.utility_functions import get_actual_cell_index, check_if_string_is_invalid, split_cell, \
+	get_indexed_sheet, get_sheet_with_cell_value_index, cell_sort_key, insert_sorted_cell
+from Code.WikifierCache import get_wikifier_cache
 
 
 class ItemTable:
 	def __init__(self, region_qnodes=None):
-		if not region_qnodes:
-			self.other = {'region': list(), 'qnodes': dict()}
-			self.region_qnodes = {'regions': OrderedDict(), 'qnodes': dict()}
-		else:
-			if 'Other' in region_qnodes['regions']:
-				self.other = {'region': region_qnodes['regions']['Other'], 'qnodes': dict()}
-				del region_qnodes['regions']['Other']
-				for i in self.other['region']:
-					self.other['qnodes'][i] = region_qnodes['qnodes'][i]
-					del region_qnodes['qnodes'][i]
-			else:
-				self.other = {'region': list(), 'qnodes': dict()}
-			self.region_qnodes = region_qnodes
+		"""
+		The qnodes are stored against the (column, row) indices of the cells,
+		excel cell notation is only used by the region_qnodes json and by the methods which take cells from the GUI.
+		The cells of the regions are kept sorted by cell_sort_key, self.other['region'] holds all the cells of self.other
+		:param region_qnodes:
+		"""
+		self.other = {'region': list(), 'qnodes': dict()}
+		self.region_qnodes = {'regions': OrderedDict(), 'qnodes': dict()}
+		self.snapshot = None
+		# cells of the named regions as sets, built when a region is first searched
+		self.region_cell_sets = dict()
+		self.saved_region_qnodes = region_qnodes if region_qnodes else {'regions': dict(), 'qnodes': dict()}
+		if region_qnodes:
+			for region, cells in region_qnodes['regions'].items():
+				if region == 'Other':
+					for cell in cells:
+						cell_index = split_cell(cell)
+						self.other['region'].append(cell_index)
+						self.other['qnodes'][cell_index] = region_qnodes['qnodes'][cell]
+					self.other['region'].sort(key=cell_sort_key)
+				else:
+					self.region_qnodes['regions'][region] = sorted([split_cell(cell) for cell in cells], key=cell_sort_key)
+			other_cells = set(region_qnodes['regions'].get('Other', list()))
+			for cell, qnode in region_qnodes['qnodes'].items():
+				if cell not in other_cells:
+					self.region_qnodes['qnodes'][split_cell(cell)] = qnode
 
 	def get_region_qnodes(self) -> dict:
 		"""
-		This function combines self.region_qnodes and self.other and returns the output
+		This function combines self.region_qnodes and self.other and returns the output.
+		The output is built once and shared by all the calls until the ItemTable is modified,
+		so its regions and qnodes must not be modified by the caller
 		:return:
 		"""
-		response = deepcopy(self.region_qnodes)
-		if self.other["region"]:
-			response["regions"]["Other"] = list()
-			redundant_cells = list()
-			for cell, qnode in self.other["qnodes"].items():
-				if cell not in response["qnodes"]:
-					response["regions"]["Other"].append(cell)
-					response["qnodes"][cell] = qnode
-				else:
-					redundant_cells.append(cell)
+		if self.snapshot is None:
+			response = {'regions': OrderedDict(), 'qnodes': self.serialize_cell_to_qnode(self.region_qnodes['qnodes'])}
+			for region, cells in self.region_qnodes['regions'].items():
+				response['regions'][region] = [get_actual_cell_index(cell) for cell in cells]
+			if self.other["region"]:
+				response["regions"]["Other"] = [get_actual_cell_index(cell) for cell in self.other["region"]]
+				response["qnodes"].update(self.serialize_cell_to_qnode(self.other["qnodes"]))
+			self.snapshot = response
+		return dict(self.snapshot)
+
+	def get_changes(self) -> Union[dict, None]:
+		"""
+		This function compares the output of get_region_qnodes with the region_qnodes the ItemTable was created with,
+		or with the output of the previous call, and returns the differences to be appended to the wikifier journal
+		:return: changes or None if nothing has changed
+		"""
+		saved, current = self.saved_region_qnodes, self.get_region_qnodes()
+		changes = dict()
+		qnodes = {cell: qnode for cell, qnode in current['qnodes'].items() if cell not in saved['qnodes'] or saved['qnodes'][cell] != qnode}
+		if qnodes:
+			changes['qnodes'] = qnodes
+		deleted_cells = [cell for cell in saved['qnodes'] if cell not in current['qnodes']]
+		if deleted_cells:
+			changes['deleted_cells'] = deleted_cells
+		regions = dict()
+		for region, cells in current['regions'].items():
+			saved_cells = saved['regions'].get(region, list())
+			if cells != saved_cells:
+				saved_cells, current_cells = set(saved_cells), set(cells)
+				regions[region] = {'added': [cell for cell in cells if cell not in saved_cells], 'removed': [cell for cell in saved_cells if cell not in current_cells]}
+		if regions:
+			changes['regions'] = regions
+		deleted_regions = [region for region in saved['regions'] if region not in current['regions']]
+		if deleted_regions:
+			changes['deleted_regions'] = deleted_regions
+		self.saved_region_qnodes = current
+		return changes if changes else None
+
+	def remove_redundant_cells(self, cells=None) -> None:
+		"""
+		This function removes the cells which also belong to a region from self.other
+		and marks the output of get_region_qnodes as outdated
+		:param cells: cells which have been added to the regions, all the cells of self.other are checked if None
+		:return:
+		"""
+		if cells is None:
+			cells = list(self.other["qnodes"].keys())
+		redundant_cells = {cell for cell in cells if cell in self.other["qnodes"] and cell in self.region_qnodes["qnodes"]}
+		if redundant_cells:
 			for cell in redundant_cells:
-				self.other["region"].remove(cell)
 				del self.other["qnodes"][cell]
-			response["regions"]["Other"] = sorted(list(response["regions"]["Other"]), key=natural_sort_key)
-		return response
+			self.other["region"] = [cell for cell in self.other["region"] if cell not in redundant_cells]
+		self.snapshot = None
 
 	def generate_hash_tables(self, file_path: str, excel_filepath: str, sheet_name: str = None, header: bool = True) -> None:
 		"""
@@ -52,39 +104,40 @@ class ItemTable:
 		:param header:
 		:return:
 		"""
-		cell_to_qnode = dict()
+		wikifier_cache = get_wikifier_cache(file_path, header)
+		cell_to_qnode = dict(wikifier_cache.get_cells())
+
+		# values of the wikified cells which are not in the wikifier file are only known to this project
 		value_to_qnode = dict()
-		with open(file_path, encoding='utf-8') as file:
-			csv_reader = csv.reader(file, delimiter=',')
-			for row in csv_reader:
-				if header:
-					header = False
-					continue
-				if not check_if_string_is_invalid(row[0]) and not check_if_string_is_invalid(row[1]):
-					cell_to_qnode[(int(row[0]), int(row[1]))] = row[3]
-				if row[2] is not None:
-					value_to_qnode[str(row[2]).strip()] = row[3]
-
-		sheet = pyexcel.get_sheet(sheet_name=sheet_name, file_name=excel_filepath)
+		sheet, value_index = get_indexed_sheet(excel_filepath, sheet_name)
 		for cell, qnode in cell_to_qnode.items():
 			try:
 				cell_value = str(sheet[cell[1], cell[0]]).strip()
-				if not check_if_string_is_invalid(cell_value) and cell_value not in value_to_qnode:
+				if not check_if_string_is_invalid(cell_value) and cell_value not in value_to_qnode \
+						and wikifier_cache.get(cell_value) is None:
 					value_to_qnode[cell_value] = qnode
 			except IndexError:
 				pass
 
-		for row in range(len(sheet)):
-			for col in range(len(sheet[0])):
-				try:
-					cell_value = str(sheet[row, col]).strip()
-					if value_to_qnode.get(cell_value, None):
-						cell_to_qnode[(col, row)] = value_to_qnode[cell_value]
-				except IndexError:
-					pass
-		cell_to_qnode = self.serialize_cell_to_qnode(cell_to_qnode)
+		# only the cells having the wikified values are visited, in the same row major order as the sheet
+		matched_cells = list()
+		if wikifier_cache.value_count < len(value_index):
+			for value, qnode in wikifier_cache.get_values():
+				if qnode:
+					matched_cells.extend((cell, qnode) for cell in value_index.get(value, list()))
+		else:
+			for value, cells in value_index.items():
+				qnode = wikifier_cache.get(value)
+				if qnode:
+					matched_cells.extend((cell, qnode) for cell in cells)
+		for value, qnode in value_to_qnode.items():
+			if qnode:
+				matched_cells.extend((cell, qnode) for cell in value_index.get(value, list()))
+		for cell, qnode in sorted(matched_cells, key=lambda match: (match[0][1], match[0][0])):
+			cell_to_qnode[cell] = qnode
 		self.other["qnodes"] = cell_to_qnode
-		self.other["region"] = list(cell_to_qnode.keys())
+		self.other["region"] = sorted(cell_to_qnode.keys(), key=cell_sort_key)
+		self.remove_redundant_cells()
 
 	def get_item(self, column: int, row: int) -> Union[str, Exception]:
 		"""
@@ -94,18 +147,18 @@ class ItemTable:
 		:param row:
 		:return: qnode or exception
 		"""
-		cell_index = get_actual_cell_index((column, row))
-		if self.region_qnodes['qnodes'].get(cell_index, None):
-			return self.region_qnodes['qnodes'][cell_index]
-		elif self.other["qnodes"].get(cell_index, None):
-			return self.other["qnodes"][cell_index]
-		else:
-			return None
+		qnode = self.region_qnodes['qnodes'].get((column, row), None)
+		if qnode:
+			return qnode
+		qnode = self.other["qnodes"].get((column, row), None)
+		if qnode:
+			return qnode
+		return None
 			# raise Exception('No QNode Exists for the cell: ', get_actual_cell_index((column, row)))
 
 	def serialize_cell_to_qnode(self, cell_to_qnode: dict) -> dict:
 		"""
-		This function serializes the cell_to_qnode dictionary
+		This function serializes the cell_to_qnode dictionary by converting the cell indices to excel cell notation
 		:return:
 		"""
 		serialized_dict = dict()
@@ -121,7 +174,9 @@ class ItemTable:
 		:return:
 		"""
 		if 'Other' in self.region_qnodes['regions'] and region != 'Other':
-			self.region_qnodes['regions']['Other'] = sorted(list(set(self.other.keys()) - set(self.region_qnodes['regions'][region])), key=natural_sort_key)
+			other_cells = set(self.other.keys()) - set(self.region_qnodes['regions'][region])
+			self.region_qnodes['regions']['Other'] = sorted(other_cells, key=cell_sort_key)
+			self.region_cell_sets.pop('Other', None)
 
 	def add_region(self, region: str, cell_qnode_map: dict) -> None:
 		"""
@@ -130,8 +185,11 @@ class ItemTable:
 		:param cell_qnode_map:
 		:return:
 		"""
-		self.region_qnodes['regions'][region] = sorted(list(cell_qnode_map.keys()), key=natural_sort_key)
-		self.region_qnodes['qnodes'].update(cell_qnode_map)
+		self.region_qnodes['regions'][region] = sorted([split_cell(cell) for cell in cell_qnode_map], key=cell_sort_key)
+		self.region_cell_sets.pop(region, None)
+		for cell, qnode in cell_qnode_map.items():
+			self.region_qnodes['qnodes'][split_cell(cell)] = qnode
+		self.remove_redundant_cells(self.region_qnodes['regions'][region])
 
 	def delete_region(self, region: str) -> None:
 		"""
@@ -142,6 +200,7 @@ class ItemTable:
 		if region == 'All':
 			self.region_qnodes = {'regions': OrderedDict(), 'qnodes': dict()}
 			self.other = {'region': list(), 'qnodes': dict()}
+			self.region_cell_sets = dict()
 		elif region == "Other":
 			self.other = {'region': list(), 'qnodes': dict()}
 		elif region in self.region_qnodes['regions']:
@@ -149,6 +208,8 @@ class ItemTable:
 				if cell in self.region_qnodes['qnodes']:
 					del self.region_qnodes['qnodes'][cell]
 			del self.region_qnodes['regions'][region]
+			self.region_cell_sets.pop(region, None)
+		self.snapshot = None
 
 	def update_cell(self, region: str, cell: str, qnode: str) -> None:
 		"""
@@ -158,7 +219,10 @@ class ItemTable:
 		:param qnode:
 		:return:
 		"""
+		cell = split_cell(cell)
 		if region == "Other":
+			if cell not in self.other["qnodes"]:
+				insert_sorted_cell(self.other["region"], cell)
 			self.other["qnodes"][cell] = qnode
 		elif region == "All":
 			if cell in self.region_qnodes["qnodes"]:
@@ -167,6 +231,7 @@ class ItemTable:
 				self.other["qnodes"][cell] = qnode
 		else:
 			self.region_qnodes["qnodes"][cell] = qnode
+		self.remove_redundant_cells([cell])
 
 	def update_all_cells_within_region(self, region: str, cell: str, qnode: str, excel_filepath: str, sheet_name: str) -> None:
 		"""
@@ -178,16 +243,28 @@ class ItemTable:
 		:param sheet_name:
 		:return:
 		"""
-		sheet = pyexcel.get_sheet(sheet_name=sheet_name, file_name=excel_filepath)
+		sheet, cell_value_index = get_sheet_with_cell_value_index(excel_filepath, sheet_name)
 		cell_value = sheet[cell]
 		if region == "Other":
-			for index in self.other["region"]:
-				if sheet[index] == cell_value:
-					self.other["qnodes"][index] = qnode
+			# the cells of self.other are the keys of its qnodes
+			region_cells, qnodes = self.other["qnodes"], self.other["qnodes"]
 		else:
-			for index in self.region_qnodes["regions"][region]:
-				if sheet[index] == cell_value:
-					self.region_qnodes["qnodes"][index] = qnode
+			region_cells, qnodes = self.get_region_cell_set(region), self.region_qnodes["qnodes"]
+		matched_cells = [index for index in cell_value_index.get(cell_value, list()) if index in region_cells]
+		# the qnodes of the cells which have none yet are added in the order of the region
+		for index in sorted(matched_cells, key=cell_sort_key):
+			qnodes[index] = qnode
+		self.snapshot = None
+
+	def get_region_cell_set(self, region: str) -> set:
+		"""
+		This function returns the cells of a region as a set, it is built the first time the region is searched
+		:param region:
+		:return:
+		"""
+		if region not in self.region_cell_sets:
+			self.region_cell_sets[region] = set(self.region_qnodes["regions"][region])
+		return self.region_cell_sets[region]
 
 	def update_all_cells_in_all_region(self, cell, qnode: str, excel_filepath: str, sheet_name: str) -> None:
 		"""
@@ -198,11 +275,11 @@ class ItemTable:
 		:param sheet_name:
 		:return:
 		"""
-		sheet = pyexcel.get_sheet(sheet_name=sheet_name, file_name=excel_filepath)
+		sheet, cell_value_index = get_sheet_with_cell_value_index(excel_filepath, sheet_name)
 		cell_value = sheet[cell]
-		for key, value in self.other["qnodes"].items():
-			if sheet[key] == cell_value and key in self.other["qnodes"]:
-				self.other["qnodes"][key] = qnode
-		for key, value in self.region_qnodes["qnodes"].items():
-			if sheet[key] == cell_value and key in self.region_qnodes["qnodes"]:
-				self.region_qnodes["qnodes"][key] = qnode
+		for index in cell_value_index.get(cell_value, list()):
+			if index in self.other["qnodes"]:
+				self.other["qnodes"][index] = qnode
+			if index in self.region_qnodes["qnodes"]:
+				self.region_qnodes["qnodes"][index] = qnode
+		self.snapshot = None
@@ -0,0 +1,99 @@
+import re
+import json
+import threading
+from urllib.parse import parse_qs, urlparse
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Dict
+
+VALUES_REGEX = re.compile(r'VALUES\s+\?property\s*\{([^}]*)\}')
+PROPERTY_REGEX = re.compile(r'wd:([A-Za-z0-9_]+)')
+
+
+class LocalSparqlEndpoint:
+	def __init__(self, property_types: Dict[str, str], host: str = '127.0.0.1', port: int = 0):
+		"""
+		A stand-in for a sparql endpoint which answers the property type queries of the property type cache from
+		a dictionary, so that resolving property types can be run and tested without the network.
+		Every query it receives is recorded in self.queries. It is started in a background thread by start()
+		or by using it as a context manager
+		:param property_types: property to its type, e.g. {'P585': 'Time'}
+		:param host:
+		:param port: 0 to pick a free port
+		"""
+		self.property_types = property_types
+		self.queries = list()
+		self.server = HTTPServer((host, port), self.create_request_handler())
+		self.url = 'http://{}:{}/sparql'.format(*self.server.server_address[:2])
+		self.thread = None
+
+	def create_request_handler(self) -> type:
+		"""
+		This function creates the request handler class of the server, it answers GET and POST queries
+		:return:
+		"""
+		endpoint = self
+
+		class RequestHandler(BaseHTTPRequestHandler):
+			def do_GET(self) -> None:
+				self.answer(urlparse(self.path).query)
+
+			def do_POST(self) -> None:
+				self.answer(self.rfile.read(int(self.headers.get('Content-Length', 0))).decode('utf-8'))
+
+			def answer(self, parameters: str) -> None:
+				query = parse_qs(parameters).get('query', [''])[0]
+				data = json.dumps(endpoint.answer_query(query)).encode('utf-8')
+				self.send_response(200)
+				self.send_header('Content-Type', 'application/sparql-results+json')
+				self.send_header('Content-Length', str(len(data)))
+				self.end_headers()
+				self.wfile.write(data)
+
+			def log_message(self, *args) -> None:
+				pass
+
+		return RequestHandler
+
+	def answer_query(self, query: str) -> dict:
+		"""
+		This function returns the sparql json results of a property type query, the properties which are not
+		in the dictionary have no binding like they have none in an endpoint which does not know them
+		:param query:
+		:return:
+		"""
+		self.queries.append(query)
+		match = VALUES_REGEX.search(query)
+		wikidata_properties = PROPERTY_REGEX.findall(match.group(1)) if match else list()
+		bindings = list()
+		for wikidata_property in wikidata_properties:
+			if wikidata_property in self.property_types:
+				bindings.append({
+					'property': {'type': 'uri', 'value': 'http://www.wikidata.org/entity/' + wikidata_property},
+					'type': {'type': 'uri', 'value': 'http://wikiba.se/ontology#' + self.property_types[wikidata_property]}
+				})
+		return {'head': {'vars': ['property', 'type']}, 'results': {'bindings': bindings}}
+
+	def start(self) -> 'LocalSparqlEndpoint':
+		"""
+		This function starts serving in a background thread
+		:return:
+		"""
+		self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+		self.thread.start()
+		return self
+
+	def stop(self) -> None:
+		"""
+		This function stops the server and closes its socket
+		:return:
+		"""
+		self.server.shutdown()
+		self.server.server_close()
+		if self.thread:
+			self.thread.join()
+
+	def __enter__(self) -> 'LocalSparqlEndpoint':
+		return self.start()
+
+	def __exit__(self, *args) -> None:
+		self.stop()
@@ -0,0 +1,176 @@
+import os
+import re
+import json
+import time
+import hashlib
+from pathlib import Path
+from typing import Dict, Iterable, List, Union
+from SPARQLWrapper import SPARQLWrapper, JSON
+from oslo_concurrency import lockutils
+
+PROPERTY_TYPE_CACHE_FOLDER = Path.cwd() / "config" / "property_type_cache"
+# seconds for which a resolved property type is used before the endpoint is queried again
+PROPERTY_TYPE_TTL = 30 * 24 * 60 * 60
+# properties which were not found are queried again sooner since they may have been added to the endpoint since
+PROPERTY_NOT_FOUND_TTL = 24 * 60 * 60
+# maximum number of properties in the VALUES clause of one query
+PROPERTY_QUERY_BATCH_SIZE = 200
+# seconds after which a query which got no answer fails
+PROPERTY_QUERY_TIMEOUT = 15
+# seconds for which an endpoint which could not be queried is not queried again, its properties fail at once
+PROPERTY_QUERY_RETRY_DELAY = 60
+PROPERTY_NOT_FOUND = "Property Not Found"
+# properties are written into the query as wd: prefixed names, anything else cannot be queried
+PROPERTY_REGEX = re.compile(r'[A-Za-z0-9_]+')
+
+# caches of the endpoints queried by this process
+open_caches = dict()
+
+
+class PropertyTypeCache:
+	def __init__(self, sparql_endpoint: str, ttl: int = PROPERTY_TYPE_TTL, not_found_ttl: int = PROPERTY_NOT_FOUND_TTL):
+		"""
+		The types of the properties of a sparql endpoint, including the properties which it does not have, are kept
+		in a json file so that they survive restarts and are shared by the processes. Every entry holds the time it was
+		resolved at and expires after the ttl of the cache
+		:param sparql_endpoint:
+		:param ttl: seconds for which a property type is kept
+		:param not_found_ttl: seconds for which a property which was not found is kept
+		"""
+		self.sparql_endpoint = sparql_endpoint
+		self.ttl = ttl
+		self.not_found_ttl = not_found_ttl
+		self.cache_path = PROPERTY_TYPE_CACHE_FOLDER / (hashlib.sha1(sparql_endpoint.encode('utf-8')).hexdigest() + ".json")
+		# property to [type, time it was resolved at]
+		self.entries = dict()
+		self.modified_time = None
+		# time until which the endpoint is not queried since the last query failed
+		self.unavailable_until = 0
+
+	def load(self) -> None:
+		"""
+		This function reads the cache file again if another process has modified it
+		:return:
+		"""
+		try:
+			modified_time = os.path.getmtime(str(self.cache_path))
+		except OSError:
+			return
+		if modified_time != self.modified_time:
+			try:
+				with open(str(self.cache_path), 'r') as cache_file:
+					self.entries = json.load(cache_file)['properties']
+			except (ValueError, KeyError):
+				self.entries = dict()
+			self.modified_time = modified_time
+
+	def get(self, wikidata_property: str) -> Union[str, None]:
+		"""
+		This function returns the cached type of a property if it has not expired
+		:param wikidata_property:
+		:return: None if the property has to be queried
+		"""
+		entry = self.entries.get(wikidata_property, None)
+		if entry is None:
+			return None
+		property_type, resolved_time = entry
+		ttl = self.not_found_ttl if property_type == PROPERTY_NOT_FOUND else self.ttl
+		return property_type if time.time() - resolved_time < ttl else None
+
+	def update(self, property_types: Dict[str, str]) -> None:
+		"""
+		This function adds newly resolved property types to the cache file, the entries which other processes
+		have added in the meantime are kept
+		:param property_types:
+		:return:
+		"""
+		PROPERTY_TYPE_CACHE_FOLDER.mkdir(parents=True, exist_ok=True)
+		resolved_time = time.time()
+
+		@lockutils.synchronized('property_type_cache', fair=True, external=True, lock_path=str(PROPERTY_TYPE_CACHE_FOLDER))
+		def update_cache_file() -> None:
+			"""
+			This function rewrites the cache file
+			:return:
+			"""
+			self.load()
+			for wikidata_property, property_type in property_types.items():
+				self.entries[wikidata_property] = [property_type, resolved_time]
+			temporary_path = self.cache_path.with_suffix(".tmp")
+			with open(str(temporary_path), 'w') as cache_file:
+				json.dump({'endpoint': self.sparql_endpoint, 'properties': self.entries}, cache_file)
+			os.replace(str(temporary_path), str(self.cache_path))
+			self.modified_time = os.path.getmtime(str(self.cache_path))
+
+		update_cache_file()
+
+	def resolve(self, wikidata_properties: Iterable[str]) -> Dict[str, str]:
+		"""
+		This function returns the types of the properties, the properties which are not cached are queried
+		together with one query per batch of PROPERTY_QUERY_BATCH_SIZE properties.
+		Properties which cannot be written into a query are left out
+		:param wikidata_properties:
+		:return: property to its type or PROPERTY_NOT_FOUND
+		"""
+		self.load()
+		property_types = dict()
+		missing_properties = list()
+		for wikidata_property in wikidata_properties:
+			if wikidata_property in property_types or not PROPERTY_REGEX.fullmatch(wikidata_property):
+				continue
+			property_type = self.get(wikidata_property)
+			if property_type is None:
+				if wikidata_property not in missing_properties:
+					missing_properties.append(wikidata_property)
+			else:
+				property_types[wikidata_property] = property_type
+		if missing_properties:
+			if time.time() < self.unavailable_until:
+				raise ConnectionError("The SPARQL endpoint " + self.sparql_endpoint + " is unavailable")
+			resolved_property_types = dict()
+			try:
+				for start in range(0, len(missing_properties), PROPERTY_QUERY_BATCH_SIZE):
+					batch = missing_properties[start:start + PROPERTY_QUERY_BATCH_SIZE]
+					resolved_property_types.update(query_property_types(batch, self.sparql_endpoint))
+			except Exception:
+				self.unavailable_until = time.time() + PROPERTY_QUERY_RETRY_DELAY
+				raise
+			self.update(resolved_property_types)
+			property_types.update(resolved_property_types)
+		return property_types
+
+
+def query_property_types(wikidata_properties: List[str], sparql_endpoint: str) -> Dict[str, str]:
+	"""
+	This function queries the types of several properties at once with a VALUES clause
+	:param wikidata_properties:
+	:param sparql_endpoint:
+	:return: property to its type or PROPERTY_NOT_FOUND if the endpoint does not have it
+	"""
+	query = """SELECT ?property ?type WHERE {
+		VALUES ?property { """ + " ".join("wd:" + wikidata_property for wikidata_property in wikidata_properties) + """ }
+		?property rdf:type wikibase:Property ;
+		wikibase:propertyType ?type .
+	}"""
+	sparql = SPARQLWrapper(sparql_endpoint)
+	sparql.setQuery(query)
+	sparql.setReturnFormat(JSON)
+	sparql.setTimeout(PROPERTY_QUERY_TIMEOUT)
+	results = sparql.query().convert()
+	property_types = {wikidata_property: PROPERTY_NOT_FOUND for wikidata_property in wikidata_properties}
+	for binding in results["results"]["bindings"]:
+		wikidata_property = binding["property"]["value"].rsplit("/", 1)[-1]
+		if property_types.get(wikidata_property, None) == PROPERTY_NOT_FOUND:
+			property_types[wikidata_property] = binding["type"]["value"].split("#")[1]
+	return property_types
+
+
+def get_property_type_cache(sparql_endpoint: str) -> PropertyTypeCache:
+	"""
+	This function returns the property type cache of a sparql endpoint
+	:param sparql_endpoint:
+	:return:
+	"""
+	if sparql_endpoint not in open_caches:
+		open_caches[sparql_endpoint] = PropertyTypeCache(sparql_endpoint)
+	return open_caches[sparql_endpoint]
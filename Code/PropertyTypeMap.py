@@ -0,0 +1,88 @@
+import os
+import mmap
+from pathlib import Path
+from typing import Union, Dict
+
+PROPERTY_TYPE_MAP_PATH = Path(__file__).parent / "property_type_map.tsv"
+
+
+class PropertyTypeMap:
+	def __init__(self, map_path: Union[str, Path]):
+		"""
+		The types of the properties which are known without querying a sparql endpoint. The map is a text file with
+		a property and its type separated by a tab on every line, sorted by property. It is memory mapped on the first
+		lookup and searched with a binary search, so nothing is loaded when the module is imported and a map of all
+		the wikidata properties costs no more to open than a small one
+		:param map_path:
+		"""
+		self.map_path = str(map_path)
+		self.buffer = None
+
+	@staticmethod
+	def build(property_types: Dict[str, str], map_path: Union[str, Path]) -> None:
+		"""
+		This function writes a map file
+		:param property_types: property to its type
+		:param map_path:
+		:return:
+		"""
+		lines = sorted(wikidata_property.encode('utf-8') + b"\t" + property_type.encode('utf-8') + b"\n"
+					   for wikidata_property, property_type in property_types.items())
+		temporary_path = str(map_path) + ".tmp"
+		with open(temporary_path, 'wb') as map_file:
+			map_file.writelines(lines)
+		os.replace(temporary_path, str(map_path))
+
+	def open(self) -> Union[mmap.mmap, bytes]:
+		"""
+		This function maps the file in memory the first time it is called
+		:return:
+		"""
+		if self.buffer is None:
+			with open(self.map_path, 'rb') as map_file:
+				# an empty file cannot be memory mapped
+				if os.fstat(map_file.fileno()).st_size == 0:
+					self.buffer = b""
+				else:
+					self.buffer = mmap.mmap(map_file.fileno(), 0, access=mmap.ACCESS_READ)
+		return self.buffer
+
+	def get(self, wikidata_property: str, default: str = None) -> Union[str, None]:
+		"""
+		This function looks up the type of a property with a binary search over the lines of the file
+		:param wikidata_property:
+		:param default: returned if the property is not in the map
+		:return:
+		"""
+		if not isinstance(wikidata_property, str):
+			return default
+		buffer = self.open()
+		key = wikidata_property.encode('utf-8')
+		# low is always the start of a line and high the end of the range which is left to search
+		low, high = 0, len(buffer)
+		while low < high:
+			middle = (low + high) // 2
+			line_start = buffer.rfind(b"\n", 0, middle) + 1
+			line_end = buffer.find(b"\n", line_start)
+			if line_end == -1:
+				line_end = len(buffer)
+			name, _, property_type = buffer[line_start:line_end].partition(b"\t")
+			if name == key:
+				return property_type.decode('utf-8')
+			if name < key:
+				low = line_end + 1
+			else:
+				high = line_start
+		return default
+
+	def __contains__(self, wikidata_property: str) -> bool:
+		return self.get(wikidata_property) is not None
+
+	def __getitem__(self, wikidata_property: str) -> str:
+		property_type = self.get(wikidata_property)
+		if property_type is None:
+			raise KeyError(wikidata_property)
+		return property_type
+
+
+property_type_map = PropertyTypeMap(PROPERTY_TYPE_MAP_PATH)
@@ -1,9 +1,8 @@
-import pyexcel
-
 from Code.RegionNode import RegionNode
 from collections import OrderedDict
 from Code.ItemTable import ItemTable
-from Code.utility_functions import check_if_string_is_invalid
+from Code.utility_functions import get_parsed_sheet
+from Code.SheetStrings import get_sheet_strings
 
 
 class Region:
@@ -24,8 +23,9 @@ class Region:
 		:return: region as a dict
 		"""
 		previous = None
-		data_sheet = pyexcel.get_sheet(sheet_name=sheet_name, file_name=data_file_path)
-		temp_bindings = {'$top': self.top, '$bottom': self.bottom, '$right': self.right, '$left': self.left, 'excel_sheet': data_sheet, 'item_table': item_table}
+		data_sheet = get_parsed_sheet(data_file_path, sheet_name)
+		sheet_strings = get_sheet_strings(data_file_path, sheet_name)
+		temp_bindings = {'$top': self.top, '$bottom': self.bottom, '$right': self.right, '$left': self.left, 'excel_sheet': data_sheet, 'excel_sheet_strings': sheet_strings, 'item_table': item_table}
 		skipped_rows = set()
 		skipped_columns = set()
 		skipped_cells = set()
@@ -39,7 +39,7 @@ class Region:
 				cell_be_skipped = False
 				is_cell_value_invalid = False
 
-				if check_if_string_is_invalid(str(temp_bindings['excel_sheet'][row, column])):
+				if sheet_strings.is_invalid(row, column):
 					is_cell_value_invalid = True
 
 				if self.skip_row:
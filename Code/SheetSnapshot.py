@@ -0,0 +1,310 @@
+import mmap
+import os
+import re
+import struct
+from uuid import uuid4
+from datetime import datetime, date, time
+from collections import OrderedDict
+from typing import Union, Tuple, List, Iterator
+import pyexcel
+
+MAGIC = b"T2WMLSS1"
+# magic, modification time and size of the workbook the snapshot was built from, number of sheets, offset of the sheets
+HEADER = struct.Struct("<8sqQQQ")
+# offset of the name, number of rows, number of columns, offset of the cell types, offset of the value offsets
+SHEET = struct.Struct("<QQQQQ")
+LENGTH = struct.Struct("<I")
+OFFSETS = struct.Struct("<QQ")
+OFFSET = struct.Struct("<Q")
+# cell addresses in excel notation, e.g. A1, which pyexcel.Sheet accepts as an index
+CELL_ADDRESS_REGEX = re.compile(r'([A-Za-z]+)([0-9]+)')
+
+# types of the cells, EMPTY cells hold '' and every other type marks a valid cell
+EMPTY, STRING, INTEGER, FLOAT, BOOLEAN, DATETIME, DATE, TIME = range(8)
+ENCODERS = {
+	str: (STRING, str),
+	bool: (BOOLEAN, lambda value: "1" if value else ""),
+	int: (INTEGER, str),
+	float: (FLOAT, repr),
+	datetime: (DATETIME, datetime.isoformat),
+	date: (DATE, date.isoformat),
+	time: (TIME, time.isoformat)
+}
+DECODERS = {
+	STRING: str,
+	INTEGER: int,
+	FLOAT: float,
+	BOOLEAN: bool,
+	DATETIME: datetime.fromisoformat,
+	DATE: date.fromisoformat,
+	TIME: time.fromisoformat
+}
+
+
+class SheetSnapshot:
+	def __init__(self, buffer: mmap.mmap, offset: int):
+		"""
+		A sheet of a workbook snapshot. The cells are stored column by column as a cell type array,
+		whose non EMPTY entries mark the valid cells, and an array of offsets into the encoded values.
+		It supports the read operations of pyexcel.Sheet used by the engine
+		:param buffer:
+		:param offset: offset of the sheet entry
+		"""
+		self.buffer = buffer
+		name_offset, self.number_of_rows, self.number_of_columns, self.types_offset, self.offsets_offset = SHEET.unpack_from(buffer, offset)
+		length = LENGTH.unpack_from(buffer, name_offset)[0]
+		self.name = buffer[name_offset + LENGTH.size:name_offset + LENGTH.size + length].decode('utf-8')
+		self.row = SnapshotRows(self)
+
+	def __len__(self) -> int:
+		return self.number_of_rows
+
+	def __getitem__(self, index: Union[tuple, int, str]):
+		if isinstance(index, int):
+			return self.row[index]
+		if isinstance(index, str):
+			match = CELL_ADDRESS_REGEX.fullmatch(index)
+			if not match:
+				raise IndexError("Invalid cell address " + index)
+			column = 0
+			for letter in match.group(1).upper():
+				column = column * 26 + ord(letter) - ord('A') + 1
+			return self.cell_value(int(match.group(2)) - 1, column - 1)
+		return self.cell_value(index[0], index[1])
+
+	def get_cell_index(self, row: int, column: int) -> int:
+		"""
+		This function returns the position of a cell in the column major arrays, negative indices count from the end
+		like they do for the rows of pyexcel.Sheet
+		:param row:
+		:param column:
+		:return:
+		"""
+		if row >= self.number_of_rows or column >= self.number_of_columns:
+			raise IndexError("Index out of range")
+		if row < 0:
+			row += self.number_of_rows
+		if column < 0:
+			column += self.number_of_columns
+		if row < 0 or column < 0:
+			raise IndexError("list index out of range")
+		return column * self.number_of_rows + row
+
+	def get_cell_type(self, row: int, column: int) -> int:
+		"""
+		This function returns the type of a cell
+		:param row:
+		:param column:
+		:return:
+		"""
+		return self.buffer[self.types_offset + self.get_cell_index(row, column)]
+
+	def cell_value(self, row: int, column: int):
+		"""
+		This function decodes the value of a cell
+		:param row:
+		:param column:
+		:return:
+		"""
+		index = self.get_cell_index(row, column)
+		cell_type = self.buffer[self.types_offset + index]
+		if cell_type == EMPTY:
+			return ''
+		start, end = OFFSETS.unpack_from(self.buffer, self.offsets_offset + OFFSET.size * index)
+		return DECODERS[cell_type](self.buffer[start:end].decode('utf-8'))
+
+	def row_at(self, row: int) -> list:
+		"""
+		This function returns the values of a row
+		:param row:
+		:return:
+		"""
+		return [self.cell_value(row, column) for column in range(self.number_of_columns)]
+
+	def column_types(self, column: int) -> bytes:
+		"""
+		This function returns the types of the cells of a column, one byte per row
+		:param column:
+		:return:
+		"""
+		if not 0 <= column < self.number_of_columns:
+			raise IndexError("Index out of range")
+		start = self.types_offset + column * self.number_of_rows
+		return self.buffer[start:start + self.number_of_rows]
+
+	def iterate_encoded_column(self, column: int) -> Iterator[Tuple[int, str]]:
+		"""
+		This function iterates over the cells of a column from top to bottom without decoding their values.
+		The cells of a column are contiguous so its value offsets are read at once
+		:param column:
+		:return: type and encoded value of every cell, '' for EMPTY cells
+		"""
+		types = self.column_types(column)
+		offsets = struct.unpack_from("<%dQ" % (self.number_of_rows + 1), self.buffer,
+									 self.offsets_offset + OFFSET.size * column * self.number_of_rows)
+		for row, cell_type in enumerate(types):
+			if cell_type == EMPTY:
+				yield EMPTY, ''
+			else:
+				yield cell_type, self.buffer[offsets[row]:offsets[row + 1]].decode('utf-8')
+
+	def iterate_column(self, column: int) -> Iterator:
+		"""
+		This function iterates over the values of the cells of a column from top to bottom
+		:param column:
+		:return:
+		"""
+		for cell_type, value in self.iterate_encoded_column(column):
+			yield '' if cell_type == EMPTY else DECODERS[cell_type](value)
+
+	@property
+	def array(self) -> List[list]:
+		"""
+		The values of all the cells as rows. Every access decodes the whole sheet,
+		iterate_column reads the cells without building the rows
+		"""
+		return [self.row_at(row) for row in range(self.number_of_rows)]
+
+
+class SnapshotRows:
+	def __init__(self, sheet: SheetSnapshot):
+		self.sheet = sheet
+
+	def __len__(self) -> int:
+		return len(self.sheet)
+
+	def __getitem__(self, row: int) -> list:
+		if row < 0:
+			row += len(self.sheet)
+		if not 0 <= row < len(self.sheet):
+			raise IndexError("Index out of range")
+		return self.sheet.row_at(row)
+
+
+class WorkbookSnapshot:
+	def __init__(self, snapshot_path: str):
+		"""
+		The snapshot is a read only file which holds all the sheets of a workbook in a columnar format.
+		It is memory mapped so reading a sheet does not parse the workbook again
+		:param snapshot_path:
+		"""
+		with open(snapshot_path, 'rb') as snapshot_file:
+			self.buffer = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+		magic, self.source_mtime, self.source_size, sheet_count, sheets_offset = HEADER.unpack_from(self.buffer, 0)
+		if magic != MAGIC:
+			raise ValueError('Invalid sheet snapshot file: ' + snapshot_path)
+		self.sheets = OrderedDict()
+		for i in range(sheet_count):
+			sheet = SheetSnapshot(self.buffer, sheets_offset + SHEET.size * i)
+			self.sheets[sheet.name] = sheet
+
+	def get_sheet_names(self) -> list:
+		"""
+		This function returns the names of the sheets in the order of the workbook
+		:return:
+		"""
+		return list(self.sheets.keys())
+
+	def get_sheet(self, sheet_name: str = None) -> Union[SheetSnapshot, None]:
+		"""
+		This function returns a sheet of the workbook, the first sheet if sheet_name is None.
+		None is returned if the workbook has no such sheet
+		:param sheet_name:
+		:return:
+		"""
+		if sheet_name is None:
+			return next(iter(self.sheets.values()), None)
+		return self.sheets.get(sheet_name, None)
+
+
+def get_snapshot_path(file_path: str) -> str:
+	"""
+	This function returns the path of the snapshot of a workbook, it is stored next to the workbook
+	:param file_path:
+	:return:
+	"""
+	return file_path + ".snapshot"
+
+
+def encode_sheet(rows: List[list], number_of_columns: int, values_offset: int) -> Tuple[bytes, bytes]:
+	"""
+	This function encodes the cells of a sheet column by column, rows shorter than the sheet are padded with empty cells
+	:param rows:
+	:param number_of_columns:
+	:param values_offset: offset of the file at which the encoded values start
+	:return: cell types, value offsets followed by the encoded values
+	"""
+	types = bytearray()
+	values = bytearray()
+	offsets = [values_offset]
+	for column in range(number_of_columns):
+		for row_values in rows:
+			value = row_values[column] if column < len(row_values) else ''
+			if value == '' and type(value) is str:
+				types.append(EMPTY)
+			else:
+				if type(value) not in ENCODERS:
+					raise TypeError('Cell value of type ' + type(value).__name__ + ' cannot be stored in a snapshot')
+				cell_type, encoder = ENCODERS[type(value)]
+				types.append(cell_type)
+				values += encoder(value).encode('utf-8')
+			offsets.append(values_offset + len(values))
+	return bytes(types), struct.pack("<%dQ" % len(offsets), *offsets) + bytes(values)
+
+
+def build_workbook_snapshot(file_path: str, book_dict: OrderedDict = None) -> bool:
+	"""
+	This function parses all the sheets of a workbook once and writes its snapshot.
+	The snapshot is written under a temporary name and then renamed so that readers never see a partial snapshot.
+	False is returned if the workbook has values which cannot be stored in a snapshot
+	:param file_path:
+	:param book_dict: sheets of the workbook if they have already been parsed from the file as it is
+	:return:
+	"""
+	file_stat = os.stat(file_path)
+	if book_dict is None:
+		book_dict = pyexcel.get_book_dict(file_name=file_path)
+	sheets_offset = HEADER.size
+	data = bytearray()
+	entries = list()
+	offset = sheets_offset + SHEET.size * len(book_dict)
+	try:
+		for sheet_name, rows in book_dict.items():
+			name = sheet_name.encode('utf-8')
+			name_offset = offset + len(data)
+			data += LENGTH.pack(len(name)) + name
+			types_offset = offset + len(data)
+			number_of_columns = max((len(row_values) for row_values in rows), default=0)
+			number_of_cells = len(rows) * number_of_columns
+			offsets_offset = types_offset + number_of_cells
+			types, values = encode_sheet(rows, number_of_columns, offsets_offset + OFFSET.size * (number_of_cells + 1))
+			data += types + values
+			entries.append(SHEET.pack(name_offset, len(rows), number_of_columns, types_offset, offsets_offset))
+	except TypeError:
+		return False
+
+	snapshot_path = get_snapshot_path(file_path)
+	temporary_path = snapshot_path + "." + uuid4().hex
+	with open(temporary_path, 'wb') as snapshot_file:
+		snapshot_file.write(HEADER.pack(MAGIC, file_stat.st_mtime_ns, file_stat.st_size, len(book_dict), sheets_offset))
+		snapshot_file.write(b"".join(entries))
+		snapshot_file.write(data)
+	os.replace(temporary_path, snapshot_path)
+	return True
+
+
+def get_workbook_snapshot(file_path: str) -> Union[WorkbookSnapshot, None]:
+	"""
+	This function opens the snapshot of a workbook.
+	None is returned if the workbook has no snapshot or has been modified after the snapshot was built
+	:param file_path:
+	:return:
+	"""
+	snapshot_path = get_snapshot_path(file_path)
+	if not os.path.exists(snapshot_path):
+		return None
+	snapshot = WorkbookSnapshot(snapshot_path)
+	file_stat = os.stat(file_path)
+	if (snapshot.source_mtime, snapshot.source_size) != (file_stat.st_mtime_ns, file_stat.st_size):
+		return None
+	return snapshot
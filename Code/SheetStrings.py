@@ -0,0 +1,115 @@
+import sys
+from typing import Union, List
+import pyexcel
+from Code.SheetSnapshot import SheetSnapshot, BOOLEAN, DATETIME, DECODERS
+from Code.utility_functions import check_if_string_is_invalid, get_cached_sheet, add_to_cached_sheet
+
+# types of the snapshot cells whose str() differs from their encoded value
+DECODED_TYPES = {BOOLEAN, DATETIME}
+
+
+class SheetStrings:
+	def __init__(self, sheet: Union[pyexcel.Sheet, SheetSnapshot]):
+		"""
+		The string values of the cells of a sheet along with a bitmap of the cells whose value is invalid,
+		i.e. empty, only special characters, #N/A or None. Both are computed once, column by column,
+		and the validity of every distinct value of a column is checked only once.
+		The columns of a snapshot are read from their encoded values, which are the strings of most cell types
+		:param sheet:
+		"""
+		if isinstance(sheet, SheetSnapshot):
+			self.number_of_rows = sheet.number_of_rows
+			self.number_of_columns = sheet.number_of_columns
+		else:
+			rows = sheet.to_array()
+			self.number_of_rows = len(rows)
+			self.number_of_columns = max((len(row_values) for row_values in rows), default=0)
+		# column major, strings[column][row] is str(sheet[row, column])
+		self.strings = list()
+		self.invalid = list()
+		# empty cells, which are the EMPTY cells of a snapshot, are invalid without being checked
+		validity = {'': True}
+		for column in range(self.number_of_columns):
+			if isinstance(sheet, SheetSnapshot):
+				strings = get_snapshot_column_strings(sheet, column)
+			else:
+				strings = [str(row_values[column]) if column < len(row_values) else '' for row_values in rows]
+			for string in set(strings).difference(validity):
+				validity[string] = check_if_string_is_invalid(string)
+			self.strings.append(strings)
+			self.invalid.append(bytes(validity[string] for string in strings))
+
+	def get_size(self) -> int:
+		"""
+		This function estimates the number of bytes held by the strings and the bitmap
+		:return:
+		"""
+		size = sys.getsizeof(self.strings) + sys.getsizeof(self.invalid)
+		for strings, invalid in zip(self.strings, self.invalid):
+			size += sys.getsizeof(strings) + sum(sys.getsizeof(string) for string in strings) + sys.getsizeof(invalid)
+		return size
+
+	def get_string(self, row: int, column: int) -> str:
+		"""
+		This function returns the string value of a cell, out of range and negative indices behave like they do
+		for pyexcel.Sheet
+		:param row:
+		:param column:
+		:return:
+		"""
+		if row >= self.number_of_rows or column >= self.number_of_columns:
+			raise IndexError("Index out of range")
+		return self.strings[column][row]
+
+	def is_invalid(self, row: int, column: int) -> bool:
+		"""
+		This function checks if the value of a cell is invalid, see check_if_string_is_invalid
+		:param row:
+		:param column:
+		:return:
+		"""
+		if row >= self.number_of_rows or column >= self.number_of_columns:
+			raise IndexError("Index out of range")
+		return bool(self.invalid[column][row])
+
+
+def get_snapshot_column_strings(sheet: SheetSnapshot, column: int) -> List[str]:
+	"""
+	This function returns the string values of the cells of a snapshot column,
+	only the cells whose string differs from their encoded value are decoded
+	:param sheet:
+	:param column:
+	:return:
+	"""
+	return [str(DECODERS[cell_type](value)) if cell_type in DECODED_TYPES else value
+			for cell_type, value in sheet.iterate_encoded_column(column)]
+
+
+def get_sheet_strings(excel_filepath: str, sheet_name: str = None) -> SheetStrings:
+	"""
+	This function returns the string values and the validity bitmap of a sheet,
+	they are computed once and cached along with the sheet until the file is modified
+	:param excel_filepath:
+	:param sheet_name:
+	:return:
+	"""
+	cached_sheet = get_cached_sheet(excel_filepath, sheet_name)
+	if cached_sheet['strings'] is None:
+		sheet_strings = SheetStrings(cached_sheet['sheet'])
+		add_to_cached_sheet(cached_sheet, 'strings', sheet_strings, sheet_strings.get_size())
+	return cached_sheet['strings']
+
+
+def get_cell_string(bindings: dict, row: int, column: int) -> str:
+	"""
+	This function returns the string value of a cell of the sheet in the bindings,
+	from its precomputed strings if the bindings have them
+	:param bindings:
+	:param row:
+	:param column:
+	:return:
+	"""
+	sheet_strings = bindings.get('excel_sheet_strings', None)
+	if sheet_strings is not None:
+		return sheet_strings.get_string(row, column)
+	return str(bindings['excel_sheet'][row, column])
@@ -0,0 +1,168 @@
+from functools import lru_cache
+from typing import Callable, Dict
+from etk.wikidata.entity import WDItem
+from etk.wikidata.value import DataValue, Item, Property, StringValue, URLValue, TimeValue, QuantityValue, \
+	MonolingualText, ExternalIdentifier, GlobeCoordinate
+from Code.TripleWriter import TripleWriter
+from Code.utility_functions import get_cached_property_type, get_property_types, translate_precision_to_integer
+
+# number of distinct values of each kind whose etk values are built once and shared by the statements having them
+VALUE_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=VALUE_CACHE_SIZE, typed=True)
+def get_item_value(value: str) -> Item:
+	"""
+	This function builds the value of a WikibaseItem property
+	:param value:
+	:return:
+	"""
+	return Item(value)
+
+
+@lru_cache(maxsize=VALUE_CACHE_SIZE, typed=True)
+def get_quantity_value(value) -> QuantityValue:
+	"""
+	This function builds the value of a Quantity qualifier
+	:param value:
+	:return:
+	"""
+	return QuantityValue(value)
+
+
+@lru_cache(maxsize=VALUE_CACHE_SIZE, typed=True)
+def get_normalized_quantity_value(value) -> QuantityValue:
+	"""
+	This function builds the value of a Quantity statement, the thousands separators of the value are removed.
+	Every distinct cell value of a quantity column is normalized once
+	:param value:
+	:return:
+	"""
+	return QuantityValue(str(value).replace(',', ''))
+
+
+@lru_cache(maxsize=VALUE_CACHE_SIZE, typed=True)
+def get_time_value(value: str, calendar: str, precision, time_zone) -> TimeValue:
+	"""
+	This function builds the value of a Time property
+	:param value:
+	:param calendar:
+	:param precision:
+	:param time_zone:
+	:return:
+	"""
+	return TimeValue(value, Item(calendar), precision, time_zone)
+
+
+def build_value(constructor: Callable[..., DataValue], *arguments) -> DataValue:
+	"""
+	This function builds a value with one of the cached value constructors. Values of ranges and of expressions
+	over several cells are lists, which cannot be cached, so they are built without the cache
+	:param constructor:
+	:param arguments:
+	:return:
+	"""
+	try:
+		hash(arguments)
+	except TypeError:
+		return constructor.__wrapped__(*arguments)
+	return constructor(*arguments)
+
+
+# value constructors of the statements for every property type
+STATEMENT_VALUE_CONSTRUCTORS = {
+	"WikibaseItem": lambda statement: get_item_value(str(statement["value"])),
+	"WikibaseProperty": lambda statement: Property(statement["value"]),
+	"String": lambda statement: StringValue(statement["value"]),
+	"Quantity": lambda statement: build_value(get_normalized_quantity_value, statement["value"]),
+	"Time": lambda statement: build_value(get_time_value, str(statement["value"]), statement["calendar"],
+										  translate_precision_to_integer(statement["precision"]), statement["time_zone"]),
+	"Url": lambda statement: URLValue(statement["value"]),
+	"Monolingualtext": lambda statement: MonolingualText(statement["value"], statement["lang"]),
+	"ExternalId": lambda statement: ExternalIdentifier(statement["value"]),
+	"GlobeCoordinate": lambda statement: GlobeCoordinate(statement["latitude"], statement["longitude"],
+														 statement["precision"])
+}
+# qualifiers keep their quantities and time precisions as they are
+QUALIFIER_VALUE_CONSTRUCTORS = dict(STATEMENT_VALUE_CONSTRUCTORS, **{
+	"Quantity": lambda qualifier: build_value(get_quantity_value, qualifier["value"]),
+	"Time": lambda qualifier: build_value(get_time_value, str(qualifier["value"]), qualifier["calendar"],
+										  qualifier["precision"], qualifier["time_zone"])
+})
+
+
+class StatementSerializer:
+	def __init__(self, sparql_endpoint: str, created_by: str = 't2wml', property_types: dict = None):
+		"""
+		Serializes the statements of a template. Every property of the template, as a statement property and as a
+		qualifier property, is mapped once to the function which builds its values, so that serializing a statement
+		is a flat sequence of calls without looking up property types again
+		:param sparql_endpoint:
+		:param created_by:
+		:param property_types: types of the properties resolved while evaluating the template
+		"""
+		self.sparql_endpoint = sparql_endpoint
+		self.creator = 'http://www.isi.edu/{}'.format(created_by)
+		self.property_types = property_types if property_types is not None else dict()
+		self.statement_constructors = dict()
+		self.qualifier_constructors = dict()
+
+	def resolve_property_types(self, resolved_excel: list) -> None:
+		"""
+		This function resolves the types of all the properties of the statements and their qualifiers which are not
+		known yet together, instead of querying them one at a time as they are met
+		:param resolved_excel:
+		:return:
+		"""
+		missing_properties = dict()
+		for i in resolved_excel:
+			properties = [i["statement"].get("property")]
+			properties += [j.get("property") for j in i["statement"].get("qualifier", list())]
+			for wikidata_property in properties:
+				if isinstance(wikidata_property, str) and wikidata_property not in self.property_types:
+					missing_properties[wikidata_property] = None
+		if missing_properties:
+			self.property_types.update(get_property_types(missing_properties, self.sparql_endpoint))
+
+	def get_value_constructor(self, wikidata_property: str, constructors: Dict[str, Callable[[dict], DataValue]],
+							  compiled_constructors: dict) -> Callable[[dict], DataValue]:
+		"""
+		This function returns the value constructor of a property, it is picked the first time the property is met
+		:param wikidata_property:
+		:param constructors: value constructors for every property type
+		:param compiled_constructors: value constructors picked so far, property to its value constructor
+		:return:
+		"""
+		try:
+			return compiled_constructors[wikidata_property]
+		except KeyError:
+			property_type = get_cached_property_type(wikidata_property, self.sparql_endpoint, self.property_types)
+			if property_type == "Property Not Found":
+				raise Exception('data exception while generating triples')
+			if property_type not in constructors:
+				raise ValueError("Properties of type " + str(property_type) + " are not supported")
+			compiled_constructors[wikidata_property] = constructors[property_type]
+			return compiled_constructors[wikidata_property]
+
+	def write(self, triple_writer: TripleWriter, resolved_excel: list) -> None:
+		"""
+		This function uses the wikidata model of ETK to generate the RDF triples of the statements and writes them
+		with the triple writer as each statement is generated, so the triples are never held in memory all at once
+		:param triple_writer:
+		:param resolved_excel:
+		:return:
+		"""
+		self.resolve_property_types(resolved_excel)
+		for i in resolved_excel:
+			statement = i["statement"]
+			if statement["item"] is None:
+				continue
+			item = WDItem(statement["item"], creator=self.creator)
+			value_constructor = self.get_value_constructor(statement["property"], STATEMENT_VALUE_CONSTRUCTORS,
+														   self.statement_constructors)
+			s = item.add_statement(statement["property"], value_constructor(statement))
+			for qualifier in statement.get("qualifier", list()):
+				value_constructor = self.get_value_constructor(qualifier["property"], QUALIFIER_VALUE_CONSTRUCTORS,
+															   self.qualifier_constructors)
+				s.add_qualifier(qualifier["property"], value_constructor(qualifier))
+			triple_writer.add_subject(item)
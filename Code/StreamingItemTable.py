@@ -0,0 +1,69 @@
+from typing import Union
+import pyexcel
+from Code.ItemTable import ItemTable
+from Code.StreamingSheet import StreamingSheet
+from Code.WikifierCache import get_wikifier_cache
+from Code.utility_functions import check_if_string_is_invalid
+
+
+class StreamingItemTable:
+	def __init__(self, item_table: ItemTable, sheet: StreamingSheet, wikifier_output_filepath: str = None, header: bool = True):
+		"""
+		Resolves the qnodes of the cells of a streamed sheet without building the value index of the whole sheet.
+		A cell gets the same qnode as it would from ItemTable.generate_hash_tables: the qnode of its wikified region,
+		else the qnode of its value in the wikifier output file, else the qnode of the cell in the wikifier output file
+		:param item_table: holds the qnodes of the wikified regions
+		:param sheet:
+		:param wikifier_output_filepath:
+		:param header:
+		"""
+		self.region_qnodes = item_table.region_qnodes['qnodes'] if item_table else dict()
+		self.sheet = sheet
+		self.wikifier_cache = None
+		self.cell_to_qnode = dict()
+		self.value_to_qnode = dict()
+		if wikifier_output_filepath:
+			self.wikifier_cache = get_wikifier_cache(wikifier_output_filepath, header)
+			self.cell_to_qnode = dict(self.wikifier_cache.get_cells())
+			self.read_wikified_values()
+
+	def read_wikified_values(self) -> None:
+		"""
+		This function reads the values of the cells of the wikifier output file in one pass over the data file,
+		the values which are not in the wikifier output file get the qnode of the first cell having them
+		:return:
+		"""
+		rows = {row for col, row in self.cell_to_qnode}
+		cell_values = dict()
+		for row, row_values in enumerate(pyexcel.iget_array(file_name=self.sheet.file_path)):
+			if row in rows:
+				for col in range(len(row_values)):
+					if (col, row) in self.cell_to_qnode:
+						cell_values[(col, row)] = str(row_values[col]).strip()
+		pyexcel.free_resources()
+		for cell, qnode in self.cell_to_qnode.items():
+			# cells beyond the end of their row are empty and empty values are invalid
+			cell_value = cell_values.get(cell, '')
+			if not check_if_string_is_invalid(cell_value) and cell_value not in self.value_to_qnode \
+					and self.wikifier_cache.get(cell_value) is None:
+				self.value_to_qnode[cell_value] = qnode
+
+	def get_item(self, column: int, row: int) -> Union[str, None]:
+		"""
+		This function returns the qnode of the cell at (column, row) or None if it has none
+		:param column:
+		:param row:
+		:return:
+		"""
+		qnode = self.region_qnodes.get((column, row), None)
+		if qnode:
+			return qnode
+		if self.wikifier_cache is None:
+			return None
+		try:
+			cell_value = str(self.sheet[row, column]).strip()
+		except IndexError:
+			return self.cell_to_qnode.get((column, row), None) or None
+		qnode = self.wikifier_cache.get(cell_value) or self.value_to_qnode.get(cell_value, None) \
+			or self.cell_to_qnode.get((column, row), None)
+		return qnode if qnode else None
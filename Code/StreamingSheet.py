@@ -0,0 +1,93 @@
+from typing import Iterable
+import pyexcel
+
+
+class StreamingSheet:
+	def __init__(self, file_path: str, pinned_rows: Iterable[int] = None):
+		"""
+		A read only sheet of a csv file which is read forward one row at a time, so files larger than the memory can
+		be evaluated. Only the rows of the current window, i.e. from the start of the window up to the last row read,
+		and the pinned rows are kept in memory; rows which slid out of the window cannot be read again.
+		It supports the cell access of pyexcel.Sheet used by the expressions, except negative indices
+		:param file_path:
+		:param pinned_rows: rows which are kept in memory even after they slid out of the window, e.g. header rows
+		"""
+		self.file_path = file_path
+		self.rows = iter(pyexcel.iget_array(file_name=file_path))
+		self.window = dict()
+		self.pinned = dict()
+		self.pinned_rows = set(pinned_rows or list())
+		self.window_start = 0
+		self.next_row = 0
+		self.is_exhausted = False
+
+	def __getitem__(self, index: tuple):
+		row, column = index
+		if row < 0 or column < 0:
+			raise IndexError("Index out of range")
+		row_values = self.get_row(row)
+		# the width of the file is only known once it has been read, so rows are padded with empty cells
+		# to any width like the rows of pyexcel.Sheet are padded to the width of the widest row
+		return row_values[column] if column < len(row_values) else ''
+
+	def read_row(self) -> bool:
+		"""
+		This function reads the next row of the file into the window or into the pinned rows
+		:return: False if the file has no more rows
+		"""
+		try:
+			row_values = next(self.rows)
+		except StopIteration:
+			self.close()
+			return False
+		if self.next_row >= self.window_start:
+			self.window[self.next_row] = row_values
+		elif self.next_row in self.pinned_rows:
+			self.pinned[self.next_row] = row_values
+		self.next_row += 1
+		return True
+
+	def get_row(self, row: int) -> list:
+		"""
+		This function returns the values of a row, reading the file up to that row if needed
+		:param row:
+		:return:
+		"""
+		if row in self.pinned:
+			return self.pinned[row]
+		if row < self.window_start:
+			raise ValueError('Row ' + str(row + 1) + ' is outside of the streaming window')
+		while self.next_row <= row and self.read_row():
+			pass
+		if row not in self.window:
+			raise IndexError("Index out of range")
+		return self.window[row]
+
+	def pin_rows(self, rows: Iterable[int]) -> None:
+		"""
+		This function pins rows so that they can still be read after they slid out of the window
+		:param rows:
+		:return:
+		"""
+		self.pinned_rows.update(rows)
+
+	def slide(self, window_start: int) -> None:
+		"""
+		This function moves the start of the window forward and drops the rows before it which are not pinned
+		:param window_start:
+		:return:
+		"""
+		for row in range(self.window_start, min(window_start, self.next_row)):
+			row_values = self.window.pop(row)
+			if row in self.pinned_rows:
+				self.pinned[row] = row_values
+		self.window_start = max(self.window_start, window_start)
+
+	def close(self) -> None:
+		"""
+		This function closes the file once it has been read completely or the evaluation is over
+		:return:
+		"""
+		if not self.is_exhausted:
+			self.is_exhausted = True
+			pyexcel.free_resources()
@@ -0,0 +1,229 @@
+import re
+from functools import lru_cache
+from typing import TextIO, Tuple, Union
+import rdflib
+from etk.knowledge_graph.subject import Subject
+from etk.knowledge_graph.node import URI, BNode, Literal
+from etk.wikidata.statement import Statement
+
+# namespaces of the wikidata model, bound to the same prefixes as they were in the etk knowledge graph
+BOUND_NAMESPACES = {
+	'wikibase': 'http://wikiba.se/ontology#',
+	'wd': 'http://www.wikidata.org/entity/',
+	'wdt': 'http://www.wikidata.org/prop/direct/',
+	'wdtn': 'http://www.wikidata.org/prop/direct-normalized/',
+	'wdno': 'http://www.wikidata.org/prop/novalue/',
+	'wds': 'http://www.wikidata.org/entity/statement/',
+	'wdv': 'http://www.wikidata.org/value/',
+	'wdref': 'http://www.wikidata.org/reference/',
+	'p': 'http://www.wikidata.org/prop/',
+	'pr': 'http://www.wikidata.org/prop/reference/',
+	'prv': 'http://www.wikidata.org/prop/reference/value/',
+	'prn': 'http://www.wikidata.org/prop/reference/value-normalized/',
+	'ps': 'http://www.wikidata.org/prop/statement/',
+	'psv': 'http://www.wikidata.org/prop/statement/value/',
+	'psn': 'http://www.wikidata.org/prop/statement/value-normalized/',
+	'pq': 'http://www.wikidata.org/prop/qualifier/',
+	'pqv': 'http://www.wikidata.org/prop/qualifier/value/',
+	'pqn': 'http://www.wikidata.org/prop/qualifier/value-normalized/',
+	'skos': 'http://www.w3.org/2004/02/skos/core#',
+	'prov': 'http://www.w3.org/ns/prov#',
+	'schema': 'http://schema.org/'
+}
+# prefixes which the etk wikidata model abbreviates its uris with, they are expanded but never declared so the uris
+# in their namespaces are written in full
+NAMESPACES = dict(BOUND_NAMESPACES, **{
+	'rdf': 'http://www.w3.org/1999/02/22-rdf-syntax-ns#',
+	'rdfs': 'http://www.w3.org/2000/01/rdf-schema#',
+	'xsd': 'http://www.w3.org/2001/XMLSchema#',
+	'geo': 'http://www.opengis.net/ont/geosparql#'
+})
+# longest namespaces first, a uri is abbreviated with the longest namespace it starts with
+SORTED_NAMESPACES = sorted(((namespace, prefix) for prefix, namespace in NAMESPACES.items()), key=lambda n: -len(n[0]))
+RDF_TYPE = '<http://www.w3.org/1999/02/22-rdf-syntax-ns#type>'
+URI_PATTERN = re.compile(r'^http:|^urn:|^info:|^ftp:|^https:')
+URI_ABBR_PATTERN = re.compile(r'^(?:([^:]*):)?([^:]+)$')
+LOCAL_NAME_PERCENT_REGEX = re.compile(r'%(?![0-9A-Fa-f]{2})')
+# the PN_LOCAL production of the turtle grammar, local names which do not match it are written as full uris
+PN_CHARS_BASE = 'A-Za-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F' \
+				'\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\U00010000-\U000EFFFF'
+PN_CHARS_U = PN_CHARS_BASE + '_'
+PN_CHARS = PN_CHARS_U + '\\-0-9\u00B7\u0300-\u036F\u203F-\u2040'
+PLX = r"(?:%[0-9A-Fa-f]{2}|\\[_~.\-!$&'()*+,;=/?#@%])"
+PN_LOCAL_REGEX = re.compile('(?:(?:[' + PN_CHARS_U + ':0-9]|' + PLX + ')(?:(?:[' + PN_CHARS + '.:]|' + PLX + ')*(?:[' + PN_CHARS + ':]|' + PLX + '))?)?')
+TURTLE_FILETYPES = {'ttl', 'turtle'}
+NTRIPLES_FILETYPES = {'nt', 'ntriples'}
+LITERAL_CACHE_SIZE = 65536
+
+
+class TripleWriter:
+	def __init__(self, output_file: TextIO, filetype: str = 'ttl', header: bool = True):
+		"""
+		Writes the triples of etk wikidata entities to a turtle or n-triples file as soon as they are added,
+		without keeping them in a knowledge graph. The terms are written like the rdflib serializers write them.
+		Items and value nodes are shared by many statements, the triples which do not belong to a statement are
+		remembered so that each of them is written once
+		:param output_file:
+		:param filetype: ttl or nt
+		:param header: False for a part of a document, whose prefixes are declared by the writer of the whole document
+		"""
+		filetype = filetype.lower()
+		if filetype not in TURTLE_FILETYPES and filetype not in NTRIPLES_FILETYPES:
+			raise ValueError("Triples cannot be written as " + filetype)
+		self.output_file = output_file
+		self.filetype = filetype
+		self.is_turtle = filetype in TURTLE_FILETYPES
+		self.written_triples = set()
+		if self.is_turtle and header:
+			self.output_file.write(''.join('@prefix {}: <{}> .\n'.format(prefix, BOUND_NAMESPACES[prefix])
+										   for prefix in sorted(BOUND_NAMESPACES)) + '\n')
+
+	def add_subject(self, subject: Subject, context: set = None) -> None:
+		"""
+		This function writes the triples of a subject and of the subjects which it refers to
+		:param subject:
+		:param context: subjects which have been written already by this call
+		:return:
+		"""
+		if context is None:
+			context = set()
+		context.add(subject)
+		is_statement = isinstance(subject, Statement)
+		subject_term = self.format_term(subject.subject)
+		predicates = dict()
+		nested_subjects = list()
+		for _, p, o in subject:
+			is_shared = not is_statement
+			if isinstance(o, Subject):
+				if o not in context:
+					nested_subjects.append(o)
+				is_shared = is_shared and not isinstance(o, Statement)
+				o = o.subject
+			triple = (subject_term, self.format_term(p), self.format_term(o))
+			if is_shared:
+				if triple in self.written_triples:
+					continue
+				self.written_triples.add(triple)
+			predicates.setdefault(triple[1], list()).append(triple[2])
+		if predicates:
+			self.write_triples(subject_term, predicates)
+		for nested_subject in nested_subjects:
+			if nested_subject not in context:
+				self.add_subject(nested_subject, context)
+
+	def write_triples(self, subject_term: str, predicates: dict) -> None:
+		"""
+		This function writes the triples of a subject, grouped by predicate in turtle
+		:param subject_term:
+		:param predicates: term of the predicate to the terms of its objects
+		:return:
+		"""
+		if not self.is_turtle:
+			self.output_file.write(''.join('{} {} {} .\n'.format(subject_term, predicate, object_term)
+										   for predicate, object_terms in predicates.items() for object_term in object_terms))
+			return
+		lines = list()
+		for predicate in sorted(predicates, key=lambda predicate: (predicate != RDF_TYPE, predicate)):
+			verb = 'a' if predicate == RDF_TYPE else predicate
+			lines.append(verb + ' ' + ',\n        '.join(sorted(predicates[predicate])))
+		self.output_file.write('\n' + subject_term + ' ' + ' ;\n    '.join(lines) + ' .\n')
+
+	def write(self, triples: str) -> None:
+		"""
+		This function writes triples which have been serialized by a writer without header of the same file type
+		:param triples:
+		:return:
+		"""
+		self.output_file.write(triples)
+
+	def format_term(self, node: Union[URI, BNode, Literal]) -> str:
+		"""
+		This function returns the text of an etk node
+		:param node:
+		:return:
+		"""
+		if isinstance(node, URI):
+			return format_uri(node.value, self.is_turtle)
+		if isinstance(node, BNode):
+			return '_:' + node.value
+		return format_literal(node.value, node.lang, node.raw_type, self.is_turtle)
+
+	def close(self) -> None:
+		"""
+		This function ends the document, the output file is left open
+		:return:
+		"""
+		if self.is_turtle:
+			self.output_file.write('\n')
+
+
+def split_uri(value: str) -> Tuple[str, Union[str, None], Union[str, None]]:
+	"""
+	This function expands a uri which may be abbreviated with one of the prefixes of the wikidata model
+	and splits it at the longest namespace which it starts with
+	:param value:
+	:return: uri, prefix and local name, the prefix and the local name are None if the uri is in no namespace
+	"""
+	value = value.strip()
+	if not URI_PATTERN.match(value):
+		match = URI_ABBR_PATTERN.match(value)
+		if not match or (match.group(1) or '') not in NAMESPACES:
+			raise ValueError("Unknown prefix in uri " + value)
+		prefix, local_name = match.group(1) or '', match.group(2)
+		# every namespace ends with / or #, so a longer namespace can only match if the local name has one of them
+		if '/' not in local_name and '#' not in local_name:
+			return NAMESPACES[prefix] + local_name, prefix, local_name
+		value = NAMESPACES[prefix] + local_name
+	for namespace, prefix in SORTED_NAMESPACES:
+		if value.startswith(namespace):
+			return value, prefix, value[len(namespace):]
+	return value, None, None
+
+
+def format_uri(value: str, is_turtle: bool = True) -> str:
+	"""
+	This function returns the prefixed name of a uri in turtle or the uri in angle brackets if it has no prefixed name
+	:param value: uri, which may be abbreviated
+	:param is_turtle:
+	:return:
+	"""
+	uri, prefix, local_name = split_uri(value)
+	if is_turtle and prefix in BOUND_NAMESPACES:
+		# escaped like rdflib escapes them, the other characters which need an escape are written as full uris
+		if '(' in local_name or ')' in local_name or '%' in local_name:
+			local_name = LOCAL_NAME_PERCENT_REGEX.sub('\\%', local_name.replace('(', '\\(').replace(')', '\\)'))
+		if PN_LOCAL_REGEX.fullmatch(local_name):
+			return prefix + ':' + local_name
+	return '<' + uri + '>'
+
+
+@lru_cache(maxsize=LITERAL_CACHE_SIZE)
+def format_literal(value: str, lang: str, datatype: str, is_turtle: bool = True) -> str:
+	"""
+	This function returns the text of a literal, numbers and booleans are written without their datatype in turtle.
+	N-Triples literals are always quoted on one line, escaped like the rdflib n-triples serializer escapes them
+	:param value:
+	:param lang:
+	:param datatype:
+	:param is_turtle:
+	:return:
+	"""
+	literal = rdflib.Literal(value, lang, datatype)
+	if is_turtle:
+		return literal._literal_n3(use_plain=True, qname_callback=format_prefixed_name)
+	text = '"' + str(literal).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"').replace('\r', '\\r') + '"'
+	if literal.language:
+		return text + '@' + literal.language
+	if literal.datatype:
+		return text + '^^<' + str(literal.datatype) + '>'
+	return text
+
+
+def format_prefixed_name(uri: str) -> Union[str, None]:
+	"""
+	This function returns the prefixed name of the datatype of a literal, None if it has none
+	:param uri:
+	:return:
+	"""
+	term = format_uri(uri)
+	return None if term.startswith('<') else term
@@ -1,4 +1,5 @@
 from typing import Union
+from Code.SheetStrings import get_cell_string
 
 
 class ValueExpression:
@@ -27,19 +28,19 @@ class ValueExpression:
             if isinstance(ce, tuple) and isinstance(re, int):
                 response = list()
                 for i in range(ce[0], ce[1] + 1):
-                    response.append(str(bindings['excel_sheet'][re, i]))
+                    response.append(get_cell_string(bindings, re, i))
             elif isinstance(re, tuple) and isinstance(ce, int):
                 response = list()
                 for i in range(re[0], re[1] + 1):
-                    response.append(str(bindings['excel_sheet'][i, ce]))
+                    response.append(get_cell_string(bindings, i, ce))
             elif isinstance(ce, int) and isinstance(re, int):
-                response = str(bindings['excel_sheet'][re, ce])
+                response = get_cell_string(bindings, re, ce)
         else:
             cell_expression = self.boolean_equation.evaluate(bindings)
             if cell_expression:
                 ce = cell_expression[0]
                 re = cell_expression[1]
-                response = str(bindings['excel_sheet'][re, ce])
+                response = get_cell_string(bindings, re, ce)
             else:
                 raise ValueError("Invalid Row and Column values")
         return response
@@ -73,19 +74,19 @@ class ValueExpression:
             if isinstance(ce, tuple) and isinstance(re, int):
                 response = list()
                 for i in range(ce[0], ce[1] + 1):
-                    response.append(str(bindings['excel_sheet'][re, i]))
+                    response.append(get_cell_string(bindings, re, i))
             elif isinstance(re, tuple) and isinstance(ce, int):
                 response = list()
                 for i in range(re[0], re[1] + 1):
-                    response.append(str(bindings['excel_sheet'][i, ce]))
+                    response.append(get_cell_string(bindings, i, ce))
             elif isinstance(ce, int) and isinstance(re, int):
-                response = str(bindings['excel_sheet'][re, ce])
+                response = get_cell_string(bindings, re, ce)
         else:
             cell_expression = self.boolean_equation.evaluate(bindings)
             if cell_expression:
                 ce = cell_expression[0]
                 re = cell_expression[1]
-                response = str(bindings['excel_sheet'][re, ce])
+                response = get_cell_string(bindings, re, ce)
             else:
                 raise ValueError("Invalid Row and Column values")
         return ce, re, response
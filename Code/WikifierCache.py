@@ -0,0 +1,287 @@
+import csv
+import io
+import sys
+import mmap
+import os
+import struct
+import hashlib
+import multiprocessing
+from uuid import uuid4
+from zlib import crc32
+from pathlib import Path
+from typing import Union, Iterator, Tuple, List, Callable
+from Code.utility_functions import check_if_string_is_invalid
+
+WIKIFIER_CACHE_FOLDER = Path.cwd() / "config" / "wikifier_cache"
+MAGIC = b"T2WMLWC1"
+# magic, number of values, number of hash slots, number of cells, offset of the hash slots, offset of the cells
+HEADER = struct.Struct("<8sQQQQQ")
+LENGTH = struct.Struct("<I")
+SLOT = struct.Struct("<Q")
+CELL = struct.Struct("<qq")
+# wikifier files larger than this are parsed in parallel chunks of this size
+WIKIFIER_CHUNK_SIZE = 32 * 1024 * 1024
+
+# open caches of this process and the digests of the wikifier files they were built from
+open_caches = dict()
+file_digests = dict()
+
+
+class WikifierCache:
+	def __init__(self, cache_path: Union[str, Path]):
+		"""
+		The cache is a read only file which is memory mapped so that it is shared by all the worker processes.
+		It holds the value to qnode map of a wikifier file as a hash table and the cell to qnode entries of the file
+		:param cache_path:
+		"""
+		with open(str(cache_path), 'rb') as cache_file:
+			self.buffer = mmap.mmap(cache_file.fileno(), 0, access=mmap.ACCESS_READ)
+		magic, self.value_count, self.slot_count, self.cell_count, self.slots_offset, self.cells_offset = HEADER.unpack_from(self.buffer, 0)
+		if magic != MAGIC:
+			raise ValueError('Invalid wikifier cache file: ' + str(cache_path))
+
+	@staticmethod
+	def build(wikifier_output_filepath: str, cache_path: Union[str, Path], header: bool = True) -> None:
+		"""
+		This function loads the wikifier output file and writes the cache.
+		The file is written under a temporary name and then renamed so that readers never see a partial cache
+		:param wikifier_output_filepath:
+		:param cache_path:
+		:param header:
+		:return:
+		"""
+		cell_to_qnode, value_to_qnode = load_wikifier_file(wikifier_output_filepath, header)
+		slot_count = 1
+		while slot_count < 2 * len(value_to_qnode):
+			slot_count *= 2
+		slots = [0] * slot_count
+		records = bytearray()
+		for value, qnode in value_to_qnode.items():
+			key = value.encode('utf-8')
+			slot = crc32(key) & (slot_count - 1)
+			while slots[slot]:
+				slot = (slot + 1) & (slot_count - 1)
+			# offsets are stored plus one so that 0 marks an empty slot
+			slots[slot] = HEADER.size + len(records) + 1
+			records += encode_string(key) + encode_string(qnode.encode('utf-8'))
+		slots_offset = HEADER.size + len(records)
+		cells = bytearray()
+		for (col, row), qnode in cell_to_qnode.items():
+			cells += CELL.pack(col, row) + encode_string(qnode.encode('utf-8'))
+
+		cache_path = Path(cache_path)
+		cache_path.parent.mkdir(parents=True, exist_ok=True)
+		temporary_path = cache_path.with_name(cache_path.name + "." + uuid4().hex)
+		with open(str(temporary_path), 'wb') as cache_file:
+			cache_file.write(HEADER.pack(MAGIC, len(value_to_qnode), slot_count, len(cell_to_qnode), slots_offset, slots_offset + SLOT.size * slot_count))
+			cache_file.write(records)
+			cache_file.write(struct.pack("<%dQ" % slot_count, *slots))
+			cache_file.write(cells)
+		os.replace(str(temporary_path), str(cache_path))
+
+	def read_string(self, offset: int) -> Tuple[bytes, int]:
+		"""
+		This function reads a length prefixed string and returns it along with the offset of the next field
+		:param offset:
+		:return:
+		"""
+		length = LENGTH.unpack_from(self.buffer, offset)[0]
+		offset += LENGTH.size
+		return self.buffer[offset:offset + length], offset + length
+
+	def get(self, value: str) -> Union[str, None]:
+		"""
+		This function returns the qnode of a value or None if the wikifier file does not have that value
+		:param value:
+		:return:
+		"""
+		key = value.encode('utf-8')
+		slot = crc32(key) & (self.slot_count - 1)
+		while True:
+			offset = SLOT.unpack_from(self.buffer, self.slots_offset + SLOT.size * slot)[0]
+			if not offset:
+				return None
+			record_key, offset = self.read_string(offset - 1)
+			if record_key == key:
+				return self.read_string(offset)[0].decode('utf-8')
+			slot = (slot + 1) & (self.slot_count - 1)
+
+	def get_values(self) -> Iterator[Tuple[str, str]]:
+		"""
+		This function iterates over the value to qnode map
+		:return:
+		"""
+		offset = HEADER.size
+		for _ in range(self.value_count):
+			value, offset = self.read_string(offset)
+			qnode, offset = self.read_string(offset)
+			yield value.decode('utf-8'), qnode.decode('utf-8')
+
+	def get_cells(self) -> Iterator[Tuple[tuple, str]]:
+		"""
+		This function iterates over the cell to qnode entries in the order of the wikifier file
+		:return:
+		"""
+		offset = self.cells_offset
+		for _ in range(self.cell_count):
+			col, row = CELL.unpack_from(self.buffer, offset)
+			qnode, offset = self.read_string(offset + CELL.size)
+			yield (col, row), qnode.decode('utf-8')
+
+
+def parse_wikifier_rows(rows: Iterator[list], header: bool = True) -> Tuple[dict, dict]:
+	"""
+	This function builds the cell to qnode and the value to qnode maps from the rows of a wikifier output file
+	:param rows:
+	:param header: whether the first row is the header
+	:return: cell to qnode map, value to qnode map
+	"""
+	cell_to_qnode = dict()
+	value_to_qnode = dict()
+	for row in rows:
+		if header:
+			header = False
+			continue
+		column, row_index = row[0], row[1]
+		# indices are almost always plain numbers which never are invalid strings
+		if (column.isdigit() or not check_if_string_is_invalid(column)) and (row_index.isdigit() or not check_if_string_is_invalid(row_index)):
+			cell_to_qnode[(int(column), int(row_index))] = row[3]
+		if row[2] is not None:
+			value_to_qnode[row[2].strip()] = row[3]
+	return cell_to_qnode, value_to_qnode
+
+
+def parse_wikifier_chunk(wikifier_output_filepath: str, start: int, end: int, header: bool) -> Tuple[dict, dict]:
+	"""
+	This function parses the rows of the wikifier output file which lie between the start and end byte offsets
+	:param wikifier_output_filepath:
+	:param start:
+	:param end:
+	:param header:
+	:return: cell to qnode map, value to qnode map
+	"""
+	with open(wikifier_output_filepath, 'rb') as file:
+		file.seek(start)
+		chunk = file.read(end - start)
+	# decoded with universal newlines like a file opened in text mode
+	text = io.TextIOWrapper(io.BytesIO(chunk), encoding='utf-8')
+	return parse_wikifier_rows(csv.reader(text, delimiter=','), header)
+
+
+def get_wikifier_chunks(wikifier_output_filepath: str, chunk_size: int) -> List[Tuple[int, int]]:
+	"""
+	This function splits the wikifier output file into chunks of about chunk_size bytes which end with a line break.
+	A line break inside a quoted field is skipped by keeping track of the parity of the quotes before it
+	:param wikifier_output_filepath:
+	:param chunk_size:
+	:return: list of (start, end) byte offsets
+	"""
+	file_size = os.path.getsize(wikifier_output_filepath)
+	if file_size <= chunk_size:
+		return [(0, file_size)]
+	chunks = list()
+	with open(wikifier_output_filepath, 'rb') as file:
+		data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+		start = 0
+		while start < file_size:
+			# number of quotes between the start of the chunk and the position
+			position, quotes = start, 0
+			end = data.find(b"\n", start + chunk_size)
+			while end != -1:
+				quotes += data[position:end].count(b'"')
+				if quotes % 2 == 0:
+					break
+				position = end
+				end = data.find(b"\n", end + 1)
+			end = file_size if end == -1 else end + 1
+			chunks.append((start, end))
+			start = end
+		data.close()
+	return chunks
+
+
+def load_wikifier_file(wikifier_output_filepath: str, header: bool = True, progress: Callable[[int, int], None] = None) -> Tuple[dict, dict]:
+	"""
+	This function builds the cell to qnode and the value to qnode maps of a wikifier output file.
+	Large files are split into chunks which are parsed in parallel and merged in the order of the file,
+	qnodes are interned since the same qnodes repeat across the rows
+	:param wikifier_output_filepath:
+	:param header:
+	:param progress: called with the number of bytes parsed so far and the size of the file
+	:return: cell to qnode map, value to qnode map
+	"""
+	chunks = get_wikifier_chunks(wikifier_output_filepath, WIKIFIER_CHUNK_SIZE)
+	arguments = [(wikifier_output_filepath, start, end, header and i == 0) for i, (start, end) in enumerate(chunks)]
+	cell_to_qnode = dict()
+	value_to_qnode = dict()
+	if len(chunks) == 1:
+		results = iter([parse_wikifier_chunk(*arguments[0])])
+		pool = None
+	else:
+		pool = multiprocessing.Pool(min(len(chunks), os.cpu_count() or 1))
+		results = pool.imap(parse_wikifier_chunk_arguments, arguments)
+	try:
+		for (start, end), (chunk_cell_to_qnode, chunk_value_to_qnode) in zip(chunks, results):
+			for cell, qnode in chunk_cell_to_qnode.items():
+				cell_to_qnode[cell] = sys.intern(qnode)
+			for value, qnode in chunk_value_to_qnode.items():
+				value_to_qnode[value] = sys.intern(qnode)
+			if progress:
+				progress(end, chunks[-1][1])
+	finally:
+		if pool:
+			pool.terminate()
+	return cell_to_qnode, value_to_qnode
+
+
+def parse_wikifier_chunk_arguments(arguments: tuple) -> Tuple[dict, dict]:
+	"""
+	This function unpacks the arguments of parse_wikifier_chunk for the worker processes
+	:param arguments:
+	:return:
+	"""
+	return parse_wikifier_chunk(*arguments)
+
+
+def encode_string(string: bytes) -> bytes:
+	"""
+	This function prefixes the string with its length
+	:param string:
+	:return:
+	"""
+	return LENGTH.pack(len(string)) + string
+
+
+def get_file_digest(file_path: str) -> str:
+	"""
+	This function returns the sha1 digest of the contents of a file,
+	the digest is remembered until the file is modified
+	:param file_path:
+	:return:
+	"""
+	file_stat = os.stat(file_path)
+	key = (file_path, file_stat.st_mtime_ns, file_stat.st_size)
+	if key not in file_digests:
+		digest = hashlib.sha1()
+		with open(file_path, 'rb') as file:
+			for chunk in iter(lambda: file.read(1 << 20), b""):
+				digest.update(chunk)
+		file_digests[key] = digest.hexdigest()
+	return file_digests[key]
+
+
+def get_wikifier_cache(wikifier_output_filepath: str, header: bool = True) -> WikifierCache:
+	"""
+	This function returns the cache of a wikifier output file.
+	Caches are identified by the contents of the wikifier file so the projects which upload the same file share a cache
+	:param wikifier_output_filepath:
+	:param header:
+	:return:
+	"""
+	name = get_file_digest(wikifier_output_filepath) + ("" if header else "-no-header")
+	if name not in open_caches:
+		cache_path = WIKIFIER_CACHE_FOLDER / (name + ".bin")
+		if not cache_path.exists():
+			WikifierCache.build(wikifier_output_filepath, cache_path, header)
+		open_caches[name] = WikifierCache(cache_path)
+	return open_caches[name]
@@ -0,0 +1,150 @@
+import io
+import os
+import posixpath
+import zipfile
+from xml.etree import ElementTree
+from typing import Union, List, Dict, Tuple
+import pyexcel
+from Code.SheetSnapshot import SheetSnapshot, get_workbook_snapshot
+
+RELATIONSHIPS_NAMESPACE = "http://schemas.openxmlformats.org/package/2006/relationships"
+OFFICE_RELATIONSHIPS_NAMESPACE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+SPREADSHEET_NAMESPACE = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+OFFICE_DOCUMENT_TYPE = OFFICE_RELATIONSHIPS_NAMESPACE + "/officeDocument"
+WORKSHEET_TYPE = OFFICE_RELATIONSHIPS_NAMESPACE + "/worksheet"
+# worksheet which replaces the worksheets that are not requested, so that only the requested worksheet is parsed
+EMPTY_WORKSHEET = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n<worksheet xmlns="' + SPREADSHEET_NAMESPACE
+				   + '"><sheetData/></worksheet>').encode('utf-8')
+
+
+class Workbook:
+	def __init__(self, file_path: str):
+		"""
+		A data file whose sheet names are read from the metadata of the file and whose sheets are parsed one at a time,
+		only when they are requested. The sheets are read from the snapshot of the file if it has an up to date one
+		:param file_path:
+		"""
+		self.file_path = file_path
+		self.file_type = os.path.splitext(file_path)[1][1:].lower()
+		self.snapshot = get_workbook_snapshot(file_path)
+		self.sheet_names = None
+		# part of the xlsx archive of every worksheet, hidden ones included
+		self.worksheet_parts = None
+
+	def get_sheet_names(self) -> List[str]:
+		"""
+		This function returns the names of the sheets in the order of the workbook, hidden sheets are skipped like
+		they are by pyexcel
+		:return:
+		"""
+		if self.sheet_names is None:
+			if self.snapshot:
+				self.sheet_names = self.snapshot.get_sheet_names()
+			elif self.file_type == "csv":
+				self.sheet_names = [os.path.basename(self.file_path)]
+			elif self.file_type == "xlsx":
+				self.sheet_names, self.worksheet_parts = read_xlsx_worksheet_parts(self.file_path)
+			elif self.file_type == "xls":
+				self.sheet_names = read_xls_sheet_names(self.file_path)
+			else:
+				self.sheet_names = list(pyexcel.get_book_dict(file_name=self.file_path).keys())
+		return self.sheet_names
+
+	def get_sheet(self, sheet_name: str = None) -> Union[pyexcel.Sheet, SheetSnapshot]:
+		"""
+		This function parses a sheet of the workbook, the first sheet if sheet_name is None
+		:param sheet_name:
+		:return:
+		"""
+		if sheet_name is None:
+			sheet_name = next(iter(self.get_sheet_names()), None)
+		sheet = self.snapshot.get_sheet(sheet_name) if self.snapshot else None
+		if sheet is not None:
+			return sheet
+		if self.file_type == "xlsx":
+			return self.parse_xlsx_sheet(sheet_name)
+		return pyexcel.get_sheet(sheet_name=sheet_name, file_name=self.file_path)
+
+	def parse_xlsx_sheet(self, sheet_name: str) -> pyexcel.Sheet:
+		"""
+		This function parses one worksheet of an xlsx file. openpyxl parses all the worksheets of a workbook when
+		it is loaded, so the workbook is copied in memory with every other worksheet replaced by an empty one.
+		The styles, shared strings and merged cells of the requested worksheet are kept, so the sheet is the same
+		as the one parsed from the whole file
+		:param sheet_name:
+		:return:
+		"""
+		if self.worksheet_parts is None:
+			self.worksheet_parts = read_xlsx_worksheet_parts(self.file_path)[1]
+		if self.worksheet_parts.get(sheet_name) is None:
+			return pyexcel.get_sheet(sheet_name=sheet_name, file_name=self.file_path)
+		skipped_parts = set(self.worksheet_parts.values()) - {self.worksheet_parts[sheet_name]}
+		content = io.BytesIO()
+		with zipfile.ZipFile(self.file_path) as source, zipfile.ZipFile(content, 'w', zipfile.ZIP_STORED) as destination:
+			for part in source.infolist():
+				destination.writestr(part.filename, EMPTY_WORKSHEET if part.filename in skipped_parts else source.read(part))
+		return pyexcel.get_sheet(sheet_name=sheet_name, file_content=content.getvalue(), file_type="xlsx")
+
+
+def read_relationships(archive: zipfile.ZipFile, relationships_part: str) -> Dict[str, tuple]:
+	"""
+	This function reads a relationships part of an xlsx archive
+	:param archive:
+	:param relationships_part:
+	:return: relationship id to (type, path of the target part)
+	"""
+	relationships = dict()
+	if relationships_part not in archive.namelist():
+		return relationships
+	# targets are relative to the folder of the part which the relationships belong to
+	folder = posixpath.dirname(posixpath.dirname(relationships_part))
+	root = ElementTree.fromstring(archive.read(relationships_part))
+	for relationship in root.iter("{%s}Relationship" % RELATIONSHIPS_NAMESPACE):
+		target = relationship.get("Target")
+		if target.startswith("/"):
+			target = target[1:]
+		else:
+			target = posixpath.normpath(posixpath.join(folder, target))
+		relationships[relationship.get("Id")] = (relationship.get("Type"), target)
+	return relationships
+
+
+def read_xlsx_worksheet_parts(file_path: str) -> Tuple[List[str], Dict[str, str]]:
+	"""
+	This function reads the names of the sheets of an xlsx file and the parts which hold them
+	from the workbook part only, without parsing any worksheet
+	:param file_path:
+	:return: names of the visible sheets in the order of the workbook, sheet name to part of the archive of every worksheet
+	"""
+	sheet_names = list()
+	worksheet_parts = dict()
+	with zipfile.ZipFile(file_path) as archive:
+		workbook_part = "xl/workbook.xml"
+		for relationship_type, target in read_relationships(archive, "_rels/.rels").values():
+			if relationship_type == OFFICE_DOCUMENT_TYPE:
+				workbook_part = target
+		folder, name = posixpath.split(workbook_part)
+		relationships = read_relationships(archive, posixpath.join(folder, "_rels", name + ".rels"))
+		root = ElementTree.fromstring(archive.read(workbook_part))
+		for sheet in root.iter("{%s}sheet" % SPREADSHEET_NAMESPACE):
+			relationship_type, target = relationships.get(sheet.get("{%s}id" % OFFICE_RELATIONSHIPS_NAMESPACE), (None, None))
+			if relationship_type == WORKSHEET_TYPE:
+				worksheet_parts[sheet.get("name")] = target
+			if sheet.get("state") != "hidden":
+				sheet_names.append(sheet.get("name"))
+	return sheet_names, worksheet_parts
+
+
+def read_xls_sheet_names(file_path: str) -> List[str]:
+	"""
+	This function reads the names of the visible sheets of an xls file from the sheet records of the workbook,
+	xlrd only loads the sheets themselves when they are requested
+	:param file_path:
+	:return:
+	"""
+	import xlrd
+	book = xlrd.open_workbook(file_path, on_demand=True)
+	try:
+		return [name for name, visibility in zip(book.sheet_names(), book._sheet_visibility) if visibility == 0]
+	finally:
+		book.release_resources()
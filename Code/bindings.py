@@ -6,6 +6,7 @@ bindings = {
     "$top": None,
     "$bottom": None,
     "excel_sheet": None,
+    "excel_sheet_strings": None,
     "item_table": None,
     "created_by": None
 }
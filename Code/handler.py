@@ -4,24 +4,43 @@ from pathlib import Path
 import requests
 import uuid
 import csv
-from typing import Sequence
+import re
+import textwrap
+from datetime import date
+from functools import lru_cache
+from typing import Sequence, Tuple, Iterator, TextIO
 from Code.ItemTable import ItemTable
 from Code.bindings import bindings
 from Code.YamlParser import YAMLParser
 from Code.Region import Region
+from Code.StreamingSheet import StreamingSheet
+from Code.StreamingItemTable import StreamingItemTable
+from Code.SheetStrings import get_sheet_strings
 from Code.utility_functions import get_actual_cell_index, check_if_string_is_invalid, parse_cell_range, \
-    translate_precision_to_integer, get_property_type
-from Code.t2wml_parser import get_cell
+    translate_precision_to_integer, get_property_types, get_cached_property_type, get_parsed_sheet
+from Code.t2wml_parser import iterate_and_get_cell
+from Code.highlighter import get_highlighted_regions, compile_offset
 from Code.triple_generator import generate_triples
+from Code.TripleWriter import TripleWriter
+from Code.StatementSerializer import StatementSerializer
 from Code.ItemExpression import ItemExpression
 from Code.ValueExpression import ValueExpression
 from Code.BooleanEquation import BooleanEquation
-from Code.ColumnExpression import ColumnExpression
 from Code.RowExpression import RowExpression
+from Code.RowRangeExpression import RowRangeExpression
 from etk.wikidata.utils import parse_datetime_string
+from etk.wikidata.value import Precision
 
 __WIKIFIED_RESULT__ = str(Path.cwd() / "Datasets/data.worldbank.org/wikifier.csv")
 
+# etk only detects four digit years starting with 1 or 2, other values are left to etk
+SIMPLE_DATETIME_FORMATS = {
+    "%Y": (re.compile(r"([12]\d{3})"), Precision.year),
+    "%Y-%m": (re.compile(r"([12]\d{3})-(\d{2})"), Precision.month),
+    "%Y-%m-%d": (re.compile(r"([12]\d{3})-(\d{2})-(\d{2})"), Precision.day)
+}
+DATETIME_CACHE_SIZE = 65536
+
 
 def add_excel_file_to_bindings(excel_filepath: str, sheet_name: str) -> None:
     """
@@ -29,11 +48,8 @@ def add_excel_file_to_bindings(excel_filepath: str, sheet_name: str) -> None:
     :return: None
     """
     try:
-        records = pyexcel.get_book(file_name=excel_filepath)
-        if not sheet_name:
-            bindings["excel_sheet"] = records[0]
-        else:
-            bindings["excel_sheet"] = records[sheet_name]
+        bindings["excel_sheet"] = get_parsed_sheet(excel_filepath, sheet_name or None)
+        bindings["excel_sheet_strings"] = get_sheet_strings(excel_filepath, sheet_name or None)
 
     except IOError:
         raise IOError('Excel File cannot be found or opened')
@@ -62,7 +78,7 @@ def update_bindings(item_table: ItemTable, region: dict = None, excel_filepath:
 def highlight_region(item_table: ItemTable, excel_data_filepath: str, sheet_name: str, region_specification: dict,
                      template: dict) -> dict:
     """
-    This function add holes in the region_object and builds up the list of data_region, item_region and qualifier_region
+    This function builds up the list of data_region, item_region and qualifier_region using the highlight engine
     :param item_table:
     :param excel_data_filepath:
     :param sheet_name:
@@ -71,94 +87,7 @@ def highlight_region(item_table: ItemTable, excel_data_filepath: str, sheet_name
     :return:
     """
     update_bindings(item_table, region_specification, excel_data_filepath, sheet_name)
-    region = region_specification['region_object']
-    head = region.get_head()
-    data = {"dataRegion": set(), "item": set(), "qualifierRegion": set(), 'error': dict()}
-    bindings["$col"] = head[0]
-    bindings["$row"] = head[1]
-    try:
-        item = template['item']
-    except KeyError:
-        item = None
-
-    try:
-        qualifiers = template['qualifier']
-    except KeyError:
-        qualifiers = None
-
-    while region.sheet.get((bindings["$col"], bindings["$row"]), None) is not None:
-        try:
-            data_cell = get_actual_cell_index((bindings["$col"], bindings["$row"]))
-            data["dataRegion"].add(data_cell)
-            if item and isinstance(item, (ItemExpression, ValueExpression, BooleanEquation)):
-                try:
-                    if item.variables:
-                        variables = list(item.variables)
-                        num_of_variables = len(variables)
-                        if num_of_variables == 1:
-                            bindings[variables[0]] = 0
-                            while not item.evaluate(bindings):
-                                bindings[variables[0]] += 1
-                            col, row, value = item.evaluate_and_get_cell(bindings)
-                            item_cell = get_actual_cell_index((col, row))
-                            data["item"].add(item_cell)
-                            del bindings[variables[0]]
-                    else:
-                        item_cell = get_cell(item)
-                        item_cell = get_actual_cell_index(item_cell)
-                        data["item"].add(item_cell)
-                except AttributeError:
-                    pass
-            elif item and isinstance(item, (ColumnExpression, RowExpression)):
-                try:
-                    item_cell = get_cell(item)
-                    item_cell = get_actual_cell_index(item_cell)
-                    data["item"].add(item_cell)
-                except AttributeError:
-                    pass
-
-            if qualifiers:
-                qualifier_cells = set()
-                for qualifier in qualifiers:
-                    if isinstance(qualifier["value"], (ItemExpression, ValueExpression, BooleanEquation)):
-                        try:
-                            if qualifier["value"].variables:
-                                variables = list(qualifier["value"].variables)
-                                num_of_variables = len(variables)
-                                if num_of_variables == 1:
-                                    bindings[variables[0]] = 0
-                                    while not qualifier["value"].evaluate(bindings):
-                                        bindings[variables[0]] += 1
-                                    col, row, value = qualifier["value"].evaluate_and_get_cell(bindings)
-                                    qualifier_cell = get_actual_cell_index((col, row))
-                                    qualifier_cells.add(qualifier_cell)
-                                    del bindings[variables[0]]
-                            else:
-                                qualifier_cell = get_cell(qualifier["value"])
-                                qualifier_cell = get_actual_cell_index(qualifier_cell)
-                                qualifier_cells.add(qualifier_cell)
-                        except AttributeError:
-                            pass
-                    elif isinstance(qualifier["value"], (ColumnExpression, RowExpression)):
-                        try:
-                            qualifier_cell = get_cell(qualifier["value"])
-                            qualifier_cell = get_actual_cell_index(qualifier_cell)
-                            qualifier_cells.add(qualifier_cell)
-                        except AttributeError:
-                            pass
-                data["qualifierRegion"] |= qualifier_cells
-        except Exception as e:
-            data['error'][get_actual_cell_index((bindings["$col"], bindings["$row"]))] = str(e)
-
-        if region.sheet[(bindings["$col"], bindings["$row"])].next is not None:
-            bindings["$col"], bindings["$row"] = region.sheet[(bindings["$col"], bindings["$row"])].next
-        else:
-            bindings["$col"], bindings["$row"] = None, None
-
-    data['dataRegion'] = list(data['dataRegion'])
-    data['item'] = list(data['item'])
-    data['qualifierRegion'] = list(data['qualifierRegion'])
-    return data
+    return get_highlighted_regions(region_specification['region_object'], template)
 
 
 def resolve_cell(item_table: ItemTable, excel_data_filepath: str, sheet_name: str, region_specification: dict,
@@ -181,7 +110,7 @@ def resolve_cell(item_table: ItemTable, excel_data_filepath: str, sheet_name: st
     data = {}
     if region.sheet.get((bindings["$col"], bindings["$row"]), None) is not None:
         try:
-            statement = evaluate_template(template, sparql_endpoint)
+            statement = evaluate_template(template, sparql_endpoint, resolve_property_types(template, sparql_endpoint))
             data = {'statement': statement, 'error': None}
         except Exception as e:
             data = {'error': str(e)}
@@ -204,9 +133,39 @@ def generate_download_file(user_id: str, item_table: ItemTable, excel_data_filep
     """
     update_bindings(item_table, region_specification, excel_data_filepath, sheet_name)
 
-    region = region_specification['region_object']
     response = dict()
+    property_types = resolve_property_types(template, sparql_endpoint)
+    data, error = evaluate_region(template, region_specification['region_object'], sparql_endpoint, property_types)
+    if filetype == 'json':
+        response["data"] = json.dumps(data, indent=3)
+        response["error"] = None
+        return response
+    elif filetype == 'ttl':
+        try:
+            response["data"] = generate_triples(user_id, data, sparql_endpoint, filetype, created_by=created_by,
+                                                property_types=property_types)
+            response["error"] = None
+            return response
+        except Exception as e:
+            print(e)
+            response = {'error': str(e)}
+            return response
 
+
+def evaluate_region(template: dict, region: Region, sparql_endpoint: str,
+                    property_types: dict = None) -> Tuple[list, list]:
+    """
+    This function evaluates the template for every cell of the region.
+    The bindings should be updated before calling this function
+    :param template:
+    :param region:
+    :param sparql_endpoint:
+    :param property_types:
+    :return: statements and errors along with the cells they belong to
+    """
+    if property_types is None:
+        property_types = resolve_property_types(template, sparql_endpoint)
+    # the statements are kept as dicts, evaluate_template builds one per cell and the json export writes them as is
     data = []
     error = []
     head = region.get_head()
@@ -214,7 +173,7 @@ def generate_download_file(user_id: str, item_table: ItemTable, excel_data_filep
     bindings["$row"] = head[1]
     while region.sheet.get((bindings["$col"], bindings["$row"]), None) is not None:
         try:
-            statement = evaluate_template(template, sparql_endpoint)
+            statement = evaluate_template(template, sparql_endpoint, property_types)
             data.append({'cell': get_actual_cell_index((bindings["$col"], bindings["$row"])), 'statement': statement})
         except Exception as e:
             error.append({'cell': get_actual_cell_index((bindings["$col"], bindings["$row"])), 'error': str(e)})
@@ -222,19 +181,160 @@ def generate_download_file(user_id: str, item_table: ItemTable, excel_data_filep
             bindings["$col"], bindings["$row"] = region.sheet[(bindings["$col"], bindings["$row"])].next
         else:
             bindings["$col"], bindings["$row"] = None, None
-    if filetype == 'json':
-        response["data"] = json.dumps(data, indent=3)
-        response["error"] = None
-        return response
-    elif filetype == 'ttl':
-        try:
-            response["data"] = generate_triples(user_id, data, sparql_endpoint, filetype, created_by=created_by)
-            response["error"] = None
-            return response
-        except Exception as e:
-            print(e)
-            response = {'error': str(e)}
-            return response
+    return data, error
+
+
+def iterate_row_expressions(node) -> Iterator[RowExpression]:
+    """
+    This function walks the class tree of an expression, or the lists and dictionaries holding expressions,
+    and yields the row expressions in it. Row ranges are rejected since the number of rows they reach is unbounded
+    :param node:
+    :return:
+    """
+    if isinstance(node, RowRangeExpression):
+        raise ValueError('Row ranges cannot be evaluated in streaming mode')
+    if isinstance(node, RowExpression):
+        yield node
+    elif isinstance(node, (list, tuple)):
+        for child in node:
+            yield from iterate_row_expressions(child)
+    elif isinstance(node, dict):
+        for child in node.values():
+            yield from iterate_row_expressions(child)
+    elif type(node).__module__.startswith('Code.'):
+        for child in vars(node).values():
+            yield from iterate_row_expressions(child)
+
+
+def get_streaming_window(template: dict, region: dict) -> Tuple[int, int, set]:
+    """
+    This function statically determines how far above and below the current row the expressions of the template
+    and the skip conditions of the region reach, along with the constant rows they read.
+    Only those rows have to be kept in memory while the data file is streamed.
+    skip_column conditions may only read constant rows since a column is skipped for all the rows at once
+    :param template:
+    :param region:
+    :return: lowest offset, highest offset, constant rows
+    """
+    lowest, highest, constant_rows = 0, 0, set()
+    expressions = [template, region.get('skip_row'), region.get('skip_cell'), region.get('skip_column')]
+    for i, expression in enumerate(expressions):
+        for row_expression in iterate_row_expressions(expression):
+            try:
+                compiled = compile_offset(row_expression, row_expression.row_variable, '$row')
+            except Exception:
+                compiled = None
+            if compiled is None:
+                raise ValueError('Rows computed from variables cannot be evaluated in streaming mode')
+            base, offset = compiled
+            if base != '$row':
+                constant_rows.add(base + offset)
+            elif i == len(expressions) - 1:
+                raise ValueError('skip_column conditions which depend on $row cannot be evaluated in streaming mode')
+            else:
+                lowest, highest = min(lowest, offset), max(highest, offset)
+    return lowest, highest, constant_rows
+
+
+def stream_region(template: dict, region: dict, sheet: StreamingSheet, sparql_endpoint: str,
+                  property_types: dict = None) -> Iterator[dict]:
+    """
+    This function evaluates the template for the cells of the region while the data file is streamed, the window
+    of rows in memory slides down with the current row. The cells are visited row by row, unlike Region which visits
+    them column by column, and a cell is skipped under the same conditions as in Region.
+    The bindings should be updated with the streamed sheet before calling this function
+    :param template:
+    :param region: region parameters returned by YAMLParser.get_region
+    :param sheet:
+    :param sparql_endpoint:
+    :param property_types:
+    :return: {'cell', 'statement'} or {'cell', 'error'} for every cell of the region
+    """
+    if property_types is None:
+        property_types = resolve_property_types(template, sparql_endpoint)
+    lowest, highest, constant_rows = get_streaming_window(template, region)
+    sheet.pin_rows(constant_rows)
+    # skip_column conditions only read constant rows so they are evaluated once for every column
+    skipped_columns = set()
+    bindings["$row"] = region['top'] + 1
+    for column in range(region['left'] + 1, region['right']):
+        bindings["$col"] = column
+        if region['top'] + 1 < region['bottom'] and any(skip_column.evaluate(bindings) for skip_column in region['skip_column'] or list()):
+            skipped_columns.add(column)
+
+    for row in range(region['top'] + 1, region['bottom']):
+        sheet.slide(row + lowest)
+        bindings["$row"] = row
+        is_row_skipped = False
+        columns = list()
+        for column in range(region['left'] + 1, region['right']):
+            bindings["$col"] = column
+            is_cell_skipped = check_if_string_is_invalid(str(sheet[row, column]))
+            for skip_row in region['skip_row'] or list():
+                is_row_skipped = is_row_skipped or skip_row.evaluate(bindings)
+            for skip_cell in region['skip_cell'] or list():
+                is_cell_skipped = is_cell_skipped or skip_cell.evaluate(bindings)
+            if not is_cell_skipped and column not in skipped_columns:
+                columns.append(column)
+        if is_row_skipped:
+            continue
+        for column in columns:
+            bindings["$col"] = column
+            cell = get_actual_cell_index((column, row))
+            try:
+                yield {'cell': cell, 'statement': evaluate_template(template, sparql_endpoint, property_types)}
+            except Exception as e:
+                yield {'cell': cell, 'error': str(e)}
+    bindings["$col"], bindings["$row"] = None, None
+
+
+def generate_streaming_download_file(user_id: str, item_table: ItemTable, csv_filepath: str, wikifier_output_filepath: str,
+                                     yaml_filepath: str, output_file: TextIO, filetype: str, sparql_endpoint: str) -> list:
+    """
+    This function generates the download file of a csv data file which is too large to be loaded in memory.
+    The statements are written to the output file one at a time as the data file is streamed, see stream_region
+    :param user_id:
+    :param item_table: holds the qnodes of the wikified regions, may be None
+    :param csv_filepath:
+    :param wikifier_output_filepath:
+    :param yaml_filepath:
+    :param output_file:
+    :param filetype: json or ttl
+    :param sparql_endpoint:
+    :return: errors along with the cells they belong to
+    """
+    sheet = StreamingSheet(csv_filepath)
+    try:
+        bindings["excel_sheet"] = sheet
+        bindings["excel_sheet_strings"] = None
+        bindings["item_table"] = StreamingItemTable(item_table, sheet, wikifier_output_filepath)
+        yaml_parser = YAMLParser(yaml_filepath)
+        region = yaml_parser.get_region(bindings)
+        if 'error' in region:
+            raise ValueError(region['error'])
+        template = yaml_parser.get_template()
+        created_by = yaml_parser.get_created_by()
+        property_types = resolve_property_types(template, sparql_endpoint)
+
+        errors = list()
+        is_empty = True
+        triple_writer = TripleWriter(output_file, filetype) if filetype != 'json' else None
+        statement_serializer = StatementSerializer(sparql_endpoint, created_by, property_types)
+        for result in stream_region(template, region, sheet, sparql_endpoint, property_types):
+            if 'error' in result:
+                errors.append(result)
+            elif filetype == 'json':
+                output_file.write(("[\n" if is_empty else ",\n") + textwrap.indent(json.dumps(result, indent=3), "   "))
+                is_empty = False
+            else:
+                statement_serializer.write(triple_writer, [result])
+        if filetype == 'json':
+            output_file.write("[]" if is_empty else "\n]")
+        else:
+            triple_writer.close()
+        return errors
+    finally:
+        sheet.close()
 
 
 def wikifier(item_table: ItemTable, region: str, excel_filepath: str, sheet_name: str) -> dict:
@@ -283,13 +383,70 @@ def build_item_table(item_table: ItemTable, wikifier_output_filepath: str, excel
     return item_table
 
 
-def evaluate_template(template: dict, sparql_endpoint: str) -> dict:
+@lru_cache(maxsize=DATETIME_CACHE_SIZE, typed=True)
+def parse_cached_datetime(value, datetime_format: str) -> Tuple[str, Precision]:
+    """
+    This function parses the value into a datetime string and its precision and memoizes the result
+    since the same dates repeat in every row or column of a sheet.
+    Valid dates in %Y, %Y-%m and %Y-%m-%d formats are parsed directly, everything else is parsed by etk
+    :param value:
+    :param datetime_format:
+    :return:
+    """
+    if isinstance(value, str) and datetime_format in SIMPLE_DATETIME_FORMATS:
+        pattern, precision = SIMPLE_DATETIME_FORMATS[datetime_format]
+        match = pattern.fullmatch(value)
+        if match:
+            parts = [int(part) for part in match.groups()] + [1] * (3 - len(match.groups()))
+            try:
+                return date(*parts).isoformat() + "T00:00:00", precision
+            except ValueError:
+                pass
+    return parse_datetime_string(value, additional_formats=[datetime_format])
+
+
+def parse_datetime(value, datetime_format: str) -> Tuple[str, Precision]:
+    """
+    This function parses the value into a datetime string and its precision using the cache whenever possible
+    :param value:
+    :param datetime_format:
+    :return:
+    """
+    try:
+        return parse_cached_datetime(value, datetime_format)
+    except TypeError:
+        # unhashable values cannot be memoized
+        return parse_datetime_string(value, additional_formats=[datetime_format])
+
+
+def resolve_property_types(template: dict, sparql_endpoint: str) -> dict:
+    """
+    This function resolves the types of the literal properties of the template together once before it is evaluated
+    for the cells of the region. Properties computed by T2WML expressions are resolved later for every distinct value.
+    Properties which cannot be resolved are left out so that the error is reported against every cell
+    :param template:
+    :param sparql_endpoint:
+    :return: dictionary from property to its type
+    """
+    properties = [template.get("property")]
+    properties += [qualifier.get("property") for qualifier in template.get("qualifier", None) or list()]
+    try:
+        return get_property_types([p for p in properties if isinstance(p, str)], sparql_endpoint)
+    except Exception:
+        return dict()
+
+
+def evaluate_template(template: dict, sparql_endpoint: str, property_types: dict = None) -> dict:
     """
     This function resolves the template by parsing the T2WML expressions
     and replacing them by the class trees of those expressions
     :param template:
+    :param sparql_endpoint:
+    :param property_types: types of the properties resolved so far, see resolve_property_types
     :return:
     """
+    if property_types is None:
+        property_types = dict()
     response = dict()
     for key, value in template.items():
         if key == 'qualifier':
@@ -297,41 +454,22 @@ def evaluate_template(template: dict, sparql_endpoint: str) -> dict:
             for i in range(len(template[key])):
                 temp_dict = dict()
                 for k, v in template[key][i].items():
-                    if isinstance(v, (ItemExpression, ValueExpression)):
-                        if v.variables:
-                            variables = list(v.variables)
-                            num_of_variables = len(variables)
-                            if num_of_variables == 1:
-                                bindings[variables[0]] = 0
-                                while not v.evaluate_and_get_cell(bindings)[2]:
-                                    bindings[variables[0]] += 1
-                                col, row, temp_dict['value'] = v.evaluate_and_get_cell(bindings)
-                                temp_dict['cell'] = get_actual_cell_index((col, row))
-                                del bindings[variables[0]]
-                        else:
-                            col, row, temp_dict['value'] = v.evaluate_and_get_cell(bindings)
-                            temp_dict['cell'] = get_actual_cell_index((col, row))
-                    elif isinstance(v, BooleanEquation):
+                    if isinstance(v, (ItemExpression, ValueExpression, BooleanEquation)):
                         if v.variables:
-                            variables = list(v.variables)
-                            num_of_variables = len(variables)
-                            if num_of_variables == 1:
-                                bindings[variables[0]] = 0
-                                while not v.evaluate(bindings):
-                                    bindings[variables[0]] += 1
-                                col, row, temp_dict['value'] = v.evaluate_and_get_cell(bindings)
+                            result = iterate_and_get_cell(v)
+                            if result is not None:
+                                col, row, temp_dict['value'] = result
                                 temp_dict['cell'] = get_actual_cell_index((col, row))
-                                del bindings[variables[0]]
                         else:
                             col, row, temp_dict['value'] = v.evaluate_and_get_cell(bindings)
                             temp_dict['cell'] = get_actual_cell_index((col, row))
                     else:
                         temp_dict[k] = v
-                if "property" in temp_dict and get_property_type(temp_dict["property"], sparql_endpoint) == "Time":
+                if "property" in temp_dict and \
+                        get_cached_property_type(temp_dict["property"], sparql_endpoint, property_types) == "Time":
                     if "format" in temp_dict:
                         try:
-                            datetime_string, precision = parse_datetime_string(temp_dict["value"],
-                                                                               additional_formats=[temp_dict["format"]])
+                            datetime_string, precision = parse_datetime(temp_dict["value"], temp_dict["format"])
                             if "precision" not in temp_dict:
                                 temp_dict["precision"] = int(precision.value.__str__())
                             else:
@@ -343,40 +481,29 @@ def evaluate_template(template: dict, sparql_endpoint: str) -> dict:
         else:
             if isinstance(value, (ItemExpression, ValueExpression)):
                 if value.variables:
-                    variables = list(value.variables)
-                    num_of_variables = len(variables)
-                    if num_of_variables == 1:
-                        bindings[variables[0]] = 0
-                        while not value.evaluate_and_get_cell(bindings)[2]:
-                            bindings[variables[0]] += 1
-                        col, row, response[key] = value.evaluate_and_get_cell(bindings)
-                        del bindings[variables[0]]
+                    result = iterate_and_get_cell(value)
+                    if result is not None:
+                        col, row, response[key] = result
                 else:
                     col, row, response[key] = value.evaluate_and_get_cell(bindings)
                 if key == "item":
                     response['cell'] = get_actual_cell_index((col, row))
             elif isinstance(value, BooleanEquation):
                 if value.variables:
-                    variables = list(value.variables)
-                    num_of_variables = len(variables)
-                    if num_of_variables == 1:
-                        bindings[variables[0]] = 0
-                        while not value.evaluate(bindings):
-                            bindings[variables[0]] += 1
-                        col, row, response[key] = value.evaluate_and_get_cell(bindings)
+                    result = iterate_and_get_cell(value)
+                    if result is not None:
+                        col, row, response[key] = result
                         response['cell'] = get_actual_cell_index((col, row))
-                        del bindings[variables[0]]
                 else:
                     col, row, response[key] = value.evaluate_and_get_cell(bindings)
                     response['cell'] = get_actual_cell_index((col, row))
             else:
                 response[key] = value
 
-    if get_property_type(response["property"], sparql_endpoint) == "Time":
+    if get_cached_property_type(response["property"], sparql_endpoint, property_types) == "Time":
         if "format" in response:
             try:
-                datetime_string, precision = parse_datetime_string(response["value"],
-                                                                   additional_formats=[response["format"]])
+                datetime_string, precision = parse_datetime(response["value"], response["format"])
                 if "precision" not in response:
                     response["precision"] = int(precision.value.__str__())
                 else:
@@ -398,10 +525,10 @@ def create_temporary_csv_file(cell_range: str, excel_filepath: str, sheet_name:
     file_name = uuid.uuid4().hex + ".csv"
     file_path = str(Path.cwd() / "temporary_files" / file_name)
     try:
-        sheet = pyexcel.get_sheet(sheet_name=sheet_name, file_name=excel_filepath, start_row=cell_range[0][1],
-                                  row_limit=cell_range[1][1] - cell_range[0][1] + 1, start_column=cell_range[0][0],
-                                  column_limit=cell_range[1][0] - cell_range[0][0] + 1)
-        pyexcel.save_as(array=sheet, dest_file_name=file_path)
+        sheet = get_parsed_sheet(excel_filepath, sheet_name)
+        rows = [sheet.row[row][cell_range[0][0]:cell_range[1][0] + 1]
+                for row in range(cell_range[0][1], min(cell_range[1][1] + 1, len(sheet)))]
+        pyexcel.save_as(array=rows, dest_file_name=file_path)
     except IOError:
         raise IOError('Excel File cannot be found or opened')
     return file_path
@@ -447,12 +574,12 @@ def wikify_region(region: str, excel_filepath: str, sheet_name: str = None) -> d
     file_path = create_temporary_csv_file(cell_range, excel_filepath, sheet_name)
     cell_qnode_map = call_wikifiy_service(file_path, cell_range[0][0], cell_range[0][1])
     response = dict()
-    sheet = pyexcel.get_sheet(sheet_name=sheet_name, file_name=excel_filepath)
+    sheet_strings = get_sheet_strings(excel_filepath, sheet_name)
     for col in range(cell_range[0][0], cell_range[1][0] + 1):
         for row in range(cell_range[0][1], cell_range[1][1] + 1):
             try:
                 cell_index = get_actual_cell_index((col, row))
-                if not check_if_string_is_invalid(sheet[row, col]):
+                if not sheet_strings.is_invalid(row, col):
                     if cell_index in cell_qnode_map:
                         response[cell_index] = cell_qnode_map[cell_index]
                     else:
@@ -0,0 +1,253 @@
+from typing import Union, Sequence, Tuple
+from Code.bindings import bindings
+from Code.ItemExpression import ItemExpression
+from Code.ValueExpression import ValueExpression
+from Code.BooleanEquation import BooleanEquation
+from Code.ColumnExpression import ColumnExpression
+from Code.RowExpression import RowExpression
+from Code.Region import Region
+from Code.t2wml_parser import get_cell, iterate_and_get_cell
+from Code.utility_functions import get_actual_cell_index, get_column_letter
+
+HIGHLIGHTED_EXPRESSIONS = (ItemExpression, ValueExpression, BooleanEquation, ColumnExpression, RowExpression)
+
+
+def compile_offset(expression: Union[ColumnExpression, RowExpression], variable, iterator: str) -> Union[tuple, None]:
+    """
+    This function reduces a column or row expression to a (base, offset) pair.
+    base is either the iterator ($col or $row) or a constant index resolved from the current bindings.
+    None is returned if the expression uses an iteration variable as an operator argument
+    :param expression:
+    :param variable: ColumnVariable or RowVariable
+    :param iterator: $col or $row
+    :return:
+    """
+    offset = 0
+    for operation in expression.operations:
+        argument = str(operation['cell_operator_argument'].value)
+        if not argument.isdigit():
+            return None
+        if operation['cell_operator'] == '+':
+            offset += int(argument)
+        elif operation['cell_operator'] == '-':
+            offset -= int(argument)
+    if variable.value == iterator:
+        return iterator, offset
+    base = variable.evaluate(bindings)
+    if not isinstance(base, int):
+        return None
+    return base, offset
+
+
+def compile_cell_reference(expression) -> Union[Tuple[tuple, tuple], None]:
+    """
+    This function statically analyses an expression which references a single cell, viz. item(A/$row) or
+    value($col/$row-1), and returns the (base, offset) pairs of its column and row.
+    None is returned if the expression has to be evaluated for every cell, i.e. it has guards, ranges or variables
+    :param expression:
+    :return:
+    """
+    if not isinstance(expression, (ItemExpression, ValueExpression)) or expression.variables:
+        return None
+    cell_expression = expression.cell_expression
+    if not cell_expression or not cell_expression.column_expression or not cell_expression.row_expression:
+        return None
+    column = compile_offset(cell_expression.column_expression, cell_expression.column_expression.column_variable, '$col')
+    row = compile_offset(cell_expression.row_expression, cell_expression.row_expression.row_variable, '$row')
+    if column is None or row is None:
+        return None
+    return column, row
+
+
+def resolve_offset(compiled: tuple, indices: set, error_message: str) -> Union[dict, int, str]:
+    """
+    This function applies a compiled (base, offset) pair to all the column or row indices of the region at once.
+    The result is a constant index if the base is constant otherwise it is a dictionary from index to the referenced index.
+    Indices which go out of bound are mapped to the error message raised by the expression
+    :param compiled:
+    :param indices:
+    :param error_message:
+    :return:
+    """
+    base, offset = compiled
+    if isinstance(base, int):
+        return base + offset if base + offset >= -1 else error_message
+    return {index: index + offset if index + offset >= -1 else error_message for index in indices}
+
+
+def get_cell_labels(cells: Sequence[tuple]) -> set:
+    """
+    This function converts the (column, row) indices to excel cell notation, converting every column only once
+    :param cells:
+    :return:
+    """
+    column_letters = dict()
+    labels = set()
+    for column, row in cells:
+        if column not in column_letters:
+            column_letters[column] = get_column_letter(int(column) + 1)
+        labels.add(column_letters[column] + str(int(row) + 1))
+    return labels
+
+
+def get_dynamic_cell(expression) -> Union[str, None]:
+    """
+    This function evaluates the expression for the current $col and $row bindings and returns the cell it references
+    :param expression:
+    :return:
+    """
+    try:
+        if isinstance(expression, (ItemExpression, ValueExpression, BooleanEquation)) and expression.variables:
+            result = iterate_and_get_cell(expression)
+            if result is None:
+                return None
+            col, row, value = result
+            return get_actual_cell_index((col, row))
+        return get_actual_cell_index(get_cell(expression))
+    except AttributeError:
+        return None
+
+
+class CompiledReference:
+    def __init__(self, key: str, expression, columns: set, rows: set):
+        self.key = key
+        self.expression = expression
+        self.static = compile_cell_reference(expression)
+        if self.static:
+            self.columns = resolve_offset(self.static[0], columns, 'Column value out of bound')
+            self.rows = resolve_offset(self.static[1], rows, 'Row value out of bound')
+
+    def get_invalid_indices(self) -> Tuple[set, set, bool]:
+        """
+        This function returns the columns and rows of the region for which this reference goes out of bound
+        and whether it goes out of bound for every cell
+        :return:
+        """
+        invalid_columns, invalid_rows, all_invalid = set(), set(), False
+        for targets, invalid in ((self.columns, invalid_columns), (self.rows, invalid_rows)):
+            if isinstance(targets, str):
+                all_invalid = True
+            elif isinstance(targets, dict):
+                invalid |= {index for index, target in targets.items() if isinstance(target, str)}
+        return invalid_columns, invalid_rows, all_invalid
+
+    def get_cells(self, cells: Sequence[tuple]) -> set:
+        """
+        This function returns the cells referenced by the cells of the region, computing them per distinct row or
+        column whenever the reference only depends on one of them
+        :param cells:
+        :return:
+        """
+        if not cells:
+            return set()
+        columns, rows = self.columns, self.rows
+        if isinstance(columns, dict) and isinstance(rows, dict):
+            return {(columns[col], rows[row]) for col, row in cells}
+        elif isinstance(columns, dict):
+            return {(columns[col], rows) for col in {col for col, row in cells}}
+        elif isinstance(rows, dict):
+            return {(columns, rows[row]) for row in {row for col, row in cells}}
+        return {(columns, rows)}
+
+    def get_cell(self, col: int, row: int) -> Union[str, None]:
+        """
+        This function returns the cell referenced by a single cell of the region
+        :param col:
+        :param row:
+        :return:
+        """
+        if not self.static:
+            return get_dynamic_cell(self.expression)
+        target_row = self.rows[row] if isinstance(self.rows, dict) else self.rows
+        if isinstance(target_row, str):
+            raise ValueError(target_row)
+        target_column = self.columns[col] if isinstance(self.columns, dict) else self.columns
+        if isinstance(target_column, str):
+            raise ValueError(target_column)
+        return get_actual_cell_index((target_column, target_row))
+
+
+def highlight_cell(data: dict, references: Sequence[CompiledReference], col: int, row: int) -> None:
+    """
+    This function adds the cells referenced by a single cell of the region to the highlighted regions.
+    If any reference fails the error is recorded against the cell and its qualifier cells are dropped
+    :param data:
+    :param references:
+    :param col:
+    :param row:
+    :return:
+    """
+    bindings["$col"] = col
+    bindings["$row"] = row
+    try:
+        qualifier_cells = set()
+        for reference in references:
+            cell = reference.get_cell(col, row)
+            if cell is None:
+                continue
+            if reference.key == "item":
+                data["item"].add(cell)
+            else:
+                qualifier_cells.add(cell)
+        data["qualifierRegion"] |= qualifier_cells
+    except Exception as e:
+        data['error'][get_actual_cell_index((col, row))] = str(e)
+
+
+def get_highlighted_regions(region: Region, template: dict) -> dict:
+    """
+    This function computes the data region, item region and qualifier region of the template over the region.
+    References with constant offsets from $col and $row are resolved for whole rows and columns at once,
+    the remaining expressions are evaluated for every cell
+    :param region:
+    :param template:
+    :return:
+    """
+    data = {"dataRegion": set(), "item": set(), "qualifierRegion": set(), 'error': dict()}
+    cells = list(region.sheet.keys())
+    columns = {col for col, row in cells}
+    rows = {row for col, row in cells}
+    data["dataRegion"] = get_cell_labels(cells)
+
+    references = list()
+    item = template.get('item', None)
+    if item and isinstance(item, HIGHLIGHTED_EXPRESSIONS):
+        references.append(CompiledReference("item", item, columns, rows))
+    for qualifier in template.get('qualifier', None) or list():
+        if isinstance(qualifier["value"], HIGHLIGHTED_EXPRESSIONS):
+            references.append(CompiledReference("qualifierRegion", qualifier["value"], columns, rows))
+
+    if all(reference.static for reference in references):
+        invalid_columns, invalid_rows, all_invalid = set(), set(), False
+        for reference in references:
+            reference_columns, reference_rows, reference_invalid = reference.get_invalid_indices()
+            invalid_columns |= reference_columns
+            invalid_rows |= reference_rows
+            all_invalid = all_invalid or reference_invalid
+        if all_invalid:
+            valid_cells, invalid_cells = list(), cells
+        elif invalid_columns or invalid_rows:
+            valid_cells, invalid_cells = list(), list()
+            for cell in cells:
+                if cell[0] in invalid_columns or cell[1] in invalid_rows:
+                    invalid_cells.append(cell)
+                else:
+                    valid_cells.append(cell)
+        else:
+            valid_cells, invalid_cells = cells, list()
+        referenced_cells = {"item": set(), "qualifierRegion": set()}
+        for reference in references:
+            referenced_cells[reference.key] |= reference.get_cells(valid_cells)
+        data["item"] = get_cell_labels(referenced_cells["item"])
+        data["qualifierRegion"] = get_cell_labels(referenced_cells["qualifierRegion"])
+    else:
+        invalid_cells = cells
+
+    for col, row in invalid_cells:
+        highlight_cell(data, references, col, row)
+    bindings["$col"], bindings["$row"] = None, None
+
+    data['dataRegion'] = list(data['dataRegion'])
+    data['item'] = list(data['item'])
+    data['qualifierRegion'] = list(data['qualifierRegion'])
+    return data
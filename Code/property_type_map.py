@@ -1,1512 +0,0 @@
-property_type_map = {
-	"P100001": "Quantity",
-	"P100002": "Quantity",
-	"P100003": "Quantity",
-	"P100004": "Quantity",
-	"P100005": "Quantity",
-	"P100006": "Quantity",
-	"P100007": "Quantity",
-	"P100008": "Quantity",
-	"P100009": "Quantity",
-	"P100010": "Quantity",
-	"P100011": "Quantity",
-	"P100012": "Quantity",
-	"P100013": "Quantity",
-	"P100014": "Quantity",
-	"P100015": "Quantity",
-	"P100016": "Quantity",
-	"P100017": "Quantity",
-	"P100018": "Quantity",
-	"P100019": "Quantity",
-	"P100020": "Quantity",
-	"P100021": "Quantity",
-	"P100022": "Quantity",
-	"P100023": "Quantity",
-	"P100024": "Quantity",
-	"P100025": "Quantity",
-	"P100026": "Quantity",
-	"P100027": "Quantity",
-	"P100028": "Quantity",
-	"P100029": "Quantity",
-	"P100030": "Quantity",
-	"P100031": "Quantity",
-	"P100032": "Quantity",
-	"P110001": "Quantity",
-	"P110002": "Quantity",
-	"P110003": "Quantity",
-	"P110004": "Quantity",
-	"P110005": "Quantity",
-	"P110006": "Quantity",
-	"P110007": "Quantity",
-	"P110008": "Quantity",
-	"P110009": "Quantity",
-	"P110010": "Quantity",
-	"P110011": "Quantity",
-	"P110012": "Quantity",
-	"P110013": "Quantity",
-	"P110014": "Quantity",
-	"P110015": "Quantity",
-	"P110016": "Quantity",
-	"P110017": "Quantity",
-	"P110018": "Quantity",
-	"P110019": "Quantity",
-	"P110020": "Quantity",
-	"P110021": "Quantity",
-	"P110022": "Quantity",
-	"P110023": "Quantity",
-	"P110024": "Quantity",
-	"P110025": "Quantity",
-	"P110026": "Quantity",
-	"P110027": "Quantity",
-	"P110028": "Quantity",
-	"P110029": "Quantity",
-	"P110030": "Quantity",
-	"P110031": "Quantity",
-	"P110032": "Quantity",
-	"P110033": "Quantity",
-	"P110034": "Quantity",
-	"P110035": "Quantity",
-	"P110036": "Quantity",
-	"P110037": "Quantity",
-	"P110038": "Quantity",
-	"P110039": "Quantity",
-	"P110040": "Quantity",
-	"P110041": "Quantity",
-	"P110042": "Quantity",
-	"P110043": "Quantity",
-	"P110044": "Quantity",
-	"P110045": "Quantity",
-	"P110046": "Quantity",
-	"P110047": "Quantity",
-	"P110048": "Quantity",
-	"P110049": "Quantity",
-	"P110050": "Quantity",
-	"P110051": "Quantity",
-	"P110052": "Quantity",
-	"P110053": "Quantity",
-	"P110054": "Quantity",
-	"P110055": "Quantity",
-	"P110056": "Quantity",
-	"P110057": "Quantity",
-	"P110058": "Quantity",
-	"P110059": "Quantity",
-	"P110060": "Quantity",
-	"P110061": "Quantity",
-	"P110062": "Quantity",
-	"P110063": "Quantity",
-	"P110064": "Quantity",
-	"P110065": "Quantity",
-	"P110066": "Quantity",
-	"P110067": "Quantity",
-	"P110068": "Quantity",
-	"P110069": "Quantity",
-	"P110070": "Quantity",
-	"P110071": "Quantity",
-	"P110072": "Quantity",
-	"P110073": "Quantity",
-	"P110074": "Quantity",
-	"P110075": "Quantity",
-	"P110076": "Quantity",
-	"P110077": "Quantity",
-	"P110078": "Quantity",
-	"P110079": "Quantity",
-	"P110080": "Quantity",
-	"P110081": "Quantity",
-	"P110082": "Quantity",
-	"P110083": "Quantity",
-	"P110084": "Quantity",
-	"P110085": "Quantity",
-	"P110086": "Quantity",
-	"P110087": "Quantity",
-	"P110088": "Quantity",
-	"P110089": "Quantity",
-	"P110090": "Quantity",
-	"P110091": "Quantity",
-	"P110092": "Quantity",
-	"P110093": "Quantity",
-	"P110094": "Quantity",
-	"P110095": "Quantity",
-	"P110096": "Quantity",
-	"P110097": "Quantity",
-	"P110098": "Quantity",
-	"P110099": "Quantity",
-	"P110100": "Quantity",
-	"P110101": "Quantity",
-	"P110102": "Quantity",
-	"P110103": "Quantity",
-	"P110104": "Quantity",
-	"P110105": "Quantity",
-	"P110106": "Quantity",
-	"P110107": "Quantity",
-	"P110108": "Quantity",
-	"P110109": "Quantity",
-	"P110110": "Quantity",
-	"P110111": "Quantity",
-	"P110112": "Quantity",
-	"P110113": "Quantity",
-	"P110114": "Quantity",
-	"P110115": "Quantity",
-	"P110116": "Quantity",
-	"P110117": "Quantity",
-	"P110118": "Quantity",
-	"P110119": "Quantity",
-	"P110120": "Quantity",
-	"P110121": "Quantity",
-	"P110122": "Quantity",
-	"P110123": "Quantity",
-	"P110124": "Quantity",
-	"P110125": "Quantity",
-	"P110126": "Quantity",
-	"P110127": "Quantity",
-	"P110128": "Quantity",
-	"P110129": "Quantity",
-	"P110130": "Quantity",
-	"P110131": "Quantity",
-	"P110132": "Quantity",
-	"P110133": "Quantity",
-	"P110134": "Quantity",
-	"P110135": "Quantity",
-	"P110136": "Quantity",
-	"P110137": "Quantity",
-	"P110138": "Quantity",
-	"P110139": "Quantity",
-	"P110140": "Quantity",
-	"P110141": "Quantity",
-	"P110142": "Quantity",
-	"P110143": "Quantity",
-	"P110144": "Quantity",
-	"P110145": "Quantity",
-	"P110146": "Quantity",
-	"P110147": "Quantity",
-	"P110148": "Quantity",
-	"P110149": "Quantity",
-	"P110150": "Quantity",
-	"P110151": "Quantity",
-	"P110152": "Quantity",
-	"P110153": "Quantity",
-	"P110154": "Quantity",
-	"P110155": "Quantity",
-	"P110156": "Quantity",
-	"P110157": "Quantity",
-	"P110158": "Quantity",
-	"P110159": "Quantity",
-	"P110160": "Quantity",
-	"P110161": "Quantity",
-	"P110162": "Quantity",
-	"P110163": "Quantity",
-	"P110164": "Quantity",
-	"P110165": "Quantity",
-	"P110166": "Quantity",
-	"P110167": "Quantity",
-	"P110168": "Quantity",
-	"P110169": "Quantity",
-	"P110170": "Quantity",
-	"P110171": "Quantity",
-	"P110172": "Quantity",
-	"P110173": "Quantity",
-	"P110174": "Quantity",
-	"P110175": "Quantity",
-	"P110176": "Quantity",
-	"P110177": "Quantity",
-	"P110178": "Quantity",
-	"P110179": "Quantity",
-	"P110180": "Quantity",
-	"P110181": "Quantity",
-	"P110182": "Quantity",
-	"P110183": "Quantity",
-	"P110184": "Quantity",
-	"P110185": "Quantity",
-	"P110186": "Quantity",
-	"P110187": "Quantity",
-	"P110188": "Quantity",
-	"P110189": "Quantity",
-	"P110190": "Quantity",
-	"P110191": "Quantity",
-	"P110192": "Quantity",
-	"P110193": "Quantity",
-	"P110194": "Quantity",
-	"P110195": "Quantity",
-	"P110196": "Quantity",
-	"P110197": "Quantity",
-	"P110198": "Quantity",
-	"P110199": "Quantity",
-	"P110200": "Quantity",
-	"P110201": "Quantity",
-	"P110202": "Quantity",
-	"P110203": "Quantity",
-	"P110204": "Quantity",
-	"P110205": "Quantity",
-	"P110206": "Quantity",
-	"P110207": "Quantity",
-	"P110208": "Quantity",
-	"P110209": "Quantity",
-	"P110210": "Quantity",
-	"P110211": "Quantity",
-	"P110212": "Quantity",
-	"P110213": "Quantity",
-	"P110214": "Quantity",
-	"P110215": "Quantity",
-	"P110216": "Quantity",
-	"P110217": "Quantity",
-	"P110218": "Quantity",
-	"P110219": "Quantity",
-	"P110220": "Quantity",
-	"P110221": "Quantity",
-	"P110222": "Quantity",
-	"P110223": "Quantity",
-	"P110224": "Quantity",
-	"P110225": "Quantity",
-	"P110226": "Quantity",
-	"P110227": "Quantity",
-	"P110228": "Quantity",
-	"P110229": "Quantity",
-	"P110230": "Quantity",
-	"P110231": "Quantity",
-	"P110232": "Quantity",
-	"P110233": "Quantity",
-	"P110234": "Quantity",
-	"P110235": "Quantity",
-	"P110236": "Quantity",
-	"P110237": "Quantity",
-	"P110238": "Quantity",
-	"P110239": "Quantity",
-	"P110240": "Quantity",
-	"P110241": "Quantity",
-	"P110242": "Quantity",
-	"P110243": "Quantity",
-	"P110244": "Quantity",
-	"P110245": "Quantity",
-	"P110246": "Quantity",
-	"P110247": "Quantity",
-	"P110248": "Quantity",
-	"P110249": "Quantity",
-	"P110250": "Quantity",
-	"P110251": "Quantity",
-	"P110252": "Quantity",
-	"P110253": "Quantity",
-	"P110254": "Quantity",
-	"P110255": "Quantity",
-	"P110256": "Quantity",
-	"P110257": "Quantity",
-	"P110258": "Quantity",
-	"P110259": "Quantity",
-	"P110260": "Quantity",
-	"P110261": "Quantity",
-	"P110262": "Quantity",
-	"P110263": "Quantity",
-	"P110264": "Quantity",
-	"P110265": "Quantity",
-	"P110266": "Quantity",
-	"P110267": "Quantity",
-	"P110268": "Quantity",
-	"P110269": "Quantity",
-	"P110270": "Quantity",
-	"P110271": "Quantity",
-	"P110272": "Quantity",
-	"P110273": "Quantity",
-	"P110274": "Quantity",
-	"P110275": "Quantity",
-	"P110276": "Quantity",
-	"P110277": "Quantity",
-	"P110278": "Quantity",
-	"P110279": "Quantity",
-	"P110280": "Quantity",
-	"P110281": "Quantity",
-	"P110282": "Quantity",
-	"P110283": "Quantity",
-	"P110284": "Quantity",
-	"P110285": "Quantity",
-	"P110286": "Quantity",
-	"P110287": "Quantity",
-	"P110288": "Quantity",
-	"P110289": "Quantity",
-	"P110290": "Quantity",
-	"P110291": "Quantity",
-	"P110292": "Quantity",
-	"P110293": "Quantity",
-	"P110294": "Quantity",
-	"P110295": "Quantity",
-	"P110296": "Quantity",
-	"P110297": "Quantity",
-	"P110298": "Quantity",
-	"P110299": "Quantity",
-	"P110300": "Quantity",
-	"P110301": "Quantity",
-	"P110302": "Quantity",
-	"P110303": "Quantity",
-	"P110304": "Quantity",
-	"P110305": "Quantity",
-	"P110306": "Quantity",
-	"P110307": "Quantity",
-	"P110308": "Quantity",
-	"P110309": "Quantity",
-	"P110310": "Quantity",
-	"P110311": "Quantity",
-	"P110312": "Quantity",
-	"P110313": "Quantity",
-	"P110314": "Quantity",
-	"P110315": "Quantity",
-	"P110316": "Quantity",
-	"P110317": "Quantity",
-	"P110318": "Quantity",
-	"P110319": "Quantity",
-	"P110320": "Quantity",
-	"P110321": "Quantity",
-	"P110322": "Quantity",
-	"P110323": "Quantity",
-	"P110324": "Quantity",
-	"P110325": "Quantity",
-	"P110326": "Quantity",
-	"P110327": "Quantity",
-	"P110328": "Quantity",
-	"P110329": "Quantity",
-	"P110330": "Quantity",
-	"P110331": "Quantity",
-	"P110332": "Quantity",
-	"P110333": "Quantity",
-	"P110334": "Quantity",
-	"P110335": "Quantity",
-	"P110336": "Quantity",
-	"P110337": "Quantity",
-	"P110338": "Quantity",
-	"P110339": "Quantity",
-	"P110340": "Quantity",
-	"P110341": "Quantity",
-	"P110342": "Quantity",
-	"P110343": "Quantity",
-	"P110344": "Quantity",
-	"P110345": "Quantity",
-	"P110346": "Quantity",
-	"P110347": "Quantity",
-	"P110348": "Quantity",
-	"P110349": "Quantity",
-	"P110350": "Quantity",
-	"P110351": "Quantity",
-	"P110352": "Quantity",
-	"P110353": "Quantity",
-	"P110354": "Quantity",
-	"P110355": "Quantity",
-	"P110356": "Quantity",
-	"P110357": "Quantity",
-	"P110358": "Quantity",
-	"P110359": "Quantity",
-	"P110360": "Quantity",
-	"P110361": "Quantity",
-	"P110362": "Quantity",
-	"P110363": "Quantity",
-	"P110364": "Quantity",
-	"P110365": "Quantity",
-	"P110366": "Quantity",
-	"P110367": "Quantity",
-	"P110368": "Quantity",
-	"P110369": "Quantity",
-	"P110370": "Quantity",
-	"P110371": "Quantity",
-	"P110372": "Quantity",
-	"P110373": "Quantity",
-	"P110374": "Quantity",
-	"P110375": "Quantity",
-	"P110376": "Quantity",
-	"P110377": "Quantity",
-	"P110378": "Quantity",
-	"P110379": "Quantity",
-	"P110380": "Quantity",
-	"P110381": "Quantity",
-	"P110382": "Quantity",
-	"P110383": "Quantity",
-	"P110384": "Quantity",
-	"P110385": "Quantity",
-	"P110386": "Quantity",
-	"P110387": "Quantity",
-	"P110388": "Quantity",
-	"P110389": "Quantity",
-	"P110390": "Quantity",
-	"P110391": "Quantity",
-	"P110392": "Quantity",
-	"P110393": "Quantity",
-	"P110394": "Quantity",
-	"P110395": "Quantity",
-	"P110396": "Quantity",
-	"P110397": "Quantity",
-	"P110398": "Quantity",
-	"P110399": "Quantity",
-	"P110400": "Quantity",
-	"P110401": "Quantity",
-	"P110402": "Quantity",
-	"P110403": "Quantity",
-	"P110404": "Quantity",
-	"P110405": "Quantity",
-	"P110406": "Quantity",
-	"P110407": "Quantity",
-	"P110408": "Quantity",
-	"P110409": "Quantity",
-	"P110410": "Quantity",
-	"P110411": "Quantity",
-	"P110412": "Quantity",
-	"P110413": "Quantity",
-	"P110414": "Quantity",
-	"P110415": "Quantity",
-	"P110416": "Quantity",
-	"P110417": "Quantity",
-	"P110418": "Quantity",
-	"P110419": "Quantity",
-	"P110420": "Quantity",
-	"P110421": "Quantity",
-	"P110422": "Quantity",
-	"P110423": "Quantity",
-	"P110424": "Quantity",
-	"P110425": "Quantity",
-	"P110426": "Quantity",
-	"P110427": "Quantity",
-	"P110428": "Quantity",
-	"P110429": "Quantity",
-	"P110430": "Quantity",
-	"P110431": "Quantity",
-	"P110432": "Quantity",
-	"P110433": "Quantity",
-	"P110434": "Quantity",
-	"P110435": "Quantity",
-	"P110436": "Quantity",
-	"P110437": "Quantity",
-	"P110438": "Quantity",
-	"P110439": "Quantity",
-	"P110440": "Quantity",
-	"P110441": "Quantity",
-	"P110442": "Quantity",
-	"P110443": "Quantity",
-	"P110444": "Quantity",
-	"P110445": "Quantity",
-	"P110446": "Quantity",
-	"P110447": "Quantity",
-	"P110448": "Quantity",
-	"P110449": "Quantity",
-	"P110450": "Quantity",
-	"P110451": "Quantity",
-	"P110452": "Quantity",
-	"P110453": "Quantity",
-	"P110454": "Quantity",
-	"P110455": "Quantity",
-	"P110456": "Quantity",
-	"P110457": "Quantity",
-	"P110458": "Quantity",
-	"P110459": "Quantity",
-	"P110460": "Quantity",
-	"P110461": "Quantity",
-	"P110462": "Quantity",
-	"P110463": "Quantity",
-	"P110464": "Quantity",
-	"P110465": "Quantity",
-	"P110466": "Quantity",
-	"P110467": "Quantity",
-	"P110468": "Quantity",
-	"P110469": "Quantity",
-	"P110470": "Quantity",
-	"P110471": "Quantity",
-	"P110472": "Quantity",
-	"P110473": "Quantity",
-	"P110474": "Quantity",
-	"P110475": "Quantity",
-	"P110476": "Quantity",
-	"P110477": "Quantity",
-	"P110478": "Quantity",
-	"P110479": "Quantity",
-	"P110480": "Quantity",
-	"P110481": "Quantity",
-	"P110482": "Quantity",
-	"P110483": "Quantity",
-	"P110484": "Quantity",
-	"P110485": "Quantity",
-	"P110486": "Quantity",
-	"P110487": "Quantity",
-	"P110488": "Quantity",
-	"P110489": "Quantity",
-	"P110490": "Quantity",
-	"P110491": "Quantity",
-	"P110492": "Quantity",
-	"P110493": "Quantity",
-	"P110494": "Quantity",
-	"P110495": "Quantity",
-	"P110496": "Quantity",
-	"P110497": "Quantity",
-	"P110498": "Quantity",
-	"P110499": "Quantity",
-	"P110500": "Quantity",
-	"P110501": "Quantity",
-	"P110502": "Quantity",
-	"P110503": "Quantity",
-	"P110504": "Quantity",
-	"P110505": "Quantity",
-	"P110506": "Quantity",
-	"P110507": "Quantity",
-	"P110508": "Quantity",
-	"P110509": "Quantity",
-	"P110510": "Quantity",
-	"P110511": "Quantity",
-	"P110512": "Quantity",
-	"P110513": "Quantity",
-	"P110514": "Quantity",
-	"P110515": "Quantity",
-	"P110516": "Quantity",
-	"P110517": "Quantity",
-	"P110518": "Quantity",
-	"P110519": "Quantity",
-	"P110520": "Quantity",
-	"P110521": "Quantity",
-	"P110522": "Quantity",
-	"P110523": "Quantity",
-	"P110524": "Quantity",
-	"P110525": "Quantity",
-	"P110526": "Quantity",
-	"P110527": "Quantity",
-	"P110528": "Quantity",
-	"P110529": "Quantity",
-	"P110530": "Quantity",
-	"P110531": "Quantity",
-	"P110532": "Quantity",
-	"P110533": "Quantity",
-	"P110534": "Quantity",
-	"P110535": "Quantity",
-	"P110536": "Quantity",
-	"P110537": "Quantity",
-	"P110538": "Quantity",
-	"P110539": "Quantity",
-	"P110540": "Quantity",
-	"P110541": "Quantity",
-	"P110542": "Quantity",
-	"P110543": "Quantity",
-	"P110544": "Quantity",
-	"P110545": "Quantity",
-	"P110546": "Quantity",
-	"P110547": "Quantity",
-	"P110548": "Quantity",
-	"P110549": "Quantity",
-	"P110550": "Quantity",
-	"P110551": "Quantity",
-	"P110552": "Quantity",
-	"P110553": "Quantity",
-	"P110554": "Quantity",
-	"P110555": "Quantity",
-	"P110556": "Quantity",
-	"P110557": "Quantity",
-	"P110558": "Quantity",
-	"P110559": "Quantity",
-	"P110560": "Quantity",
-	"P110561": "Quantity",
-	"P110562": "Quantity",
-	"P110563": "Quantity",
-	"P110564": "Quantity",
-	"P110565": "Quantity",
-	"P110566": "Quantity",
-	"P110567": "Quantity",
-	"P110568": "Quantity",
-	"P110569": "Quantity",
-	"P110570": "Quantity",
-	"P110571": "Quantity",
-	"P110572": "Quantity",
-	"P110573": "Quantity",
-	"P110574": "Quantity",
-	"P110575": "Quantity",
-	"P110576": "Quantity",
-	"P110577": "Quantity",
-	"P110578": "Quantity",
-	"P110579": "Quantity",
-	"P110580": "Quantity",
-	"P110581": "Quantity",
-	"P110582": "Quantity",
-	"P110583": "Quantity",
-	"P110584": "Quantity",
-	"P110585": "Quantity",
-	"P110586": "Quantity",
-	"P110587": "Quantity",
-	"P110588": "Quantity",
-	"P110589": "Quantity",
-	"P110590": "Quantity",
-	"P110591": "Quantity",
-	"P110592": "Quantity",
-	"P110593": "Quantity",
-	"P110594": "Quantity",
-	"P110595": "Quantity",
-	"P110596": "Quantity",
-	"P110597": "Quantity",
-	"P110598": "Quantity",
-	"P110599": "Quantity",
-	"P110600": "Quantity",
-	"P110601": "Quantity",
-	"P110602": "Quantity",
-	"P110603": "Quantity",
-	"P110604": "Quantity",
-	"P110605": "Quantity",
-	"P110606": "Quantity",
-	"P110607": "Quantity",
-	"P110608": "Quantity",
-	"P110609": "Quantity",
-	"P110610": "Quantity",
-	"P110611": "Quantity",
-	"P110612": "Quantity",
-	"P110613": "Quantity",
-	"P110614": "Quantity",
-	"P110615": "Quantity",
-	"P110616": "Quantity",
-	"P110617": "Quantity",
-	"P110618": "Quantity",
-	"P110619": "Quantity",
-	"P110620": "Quantity",
-	"P110621": "Quantity",
-	"P110622": "Quantity",
-	"P110623": "Quantity",
-	"P110624": "Quantity",
-	"P110625": "Quantity",
-	"P110626": "Quantity",
-	"P110627": "Quantity",
-	"P110628": "Quantity",
-	"P110629": "Quantity",
-	"P110630": "Quantity",
-	"P110631": "Quantity",
-	"P110632": "Quantity",
-	"P110633": "Quantity",
-	"P110634": "Quantity",
-	"P110635": "Quantity",
-	"P110636": "Quantity",
-	"P110637": "Quantity",
-	"P110638": "Quantity",
-	"P110639": "Quantity",
-	"P110640": "Quantity",
-	"P110641": "Quantity",
-	"P110642": "Quantity",
-	"P110643": "Quantity",
-	"P110644": "Quantity",
-	"P110645": "Quantity",
-	"P110646": "Quantity",
-	"P110647": "Quantity",
-	"P110648": "Quantity",
-	"P110649": "Quantity",
-	"P110650": "Quantity",
-	"P110651": "Quantity",
-	"P110652": "Quantity",
-	"P110653": "Quantity",
-	"P110654": "Quantity",
-	"P110655": "Quantity",
-	"P110656": "Quantity",
-	"P110657": "Quantity",
-	"P110658": "Quantity",
-	"P110659": "Quantity",
-	"P110660": "Quantity",
-	"P110661": "Quantity",
-	"P110662": "Quantity",
-	"P110663": "Quantity",
-	"P110664": "Quantity",
-	"P110665": "Quantity",
-	"P110666": "Quantity",
-	"P110667": "Quantity",
-	"P110668": "Quantity",
-	"P110669": "Quantity",
-	"P110670": "Quantity",
-	"P110671": "Quantity",
-	"P110672": "Quantity",
-	"P110673": "Quantity",
-	"P110674": "Quantity",
-	"P110675": "Quantity",
-	"P110676": "Quantity",
-	"P110677": "Quantity",
-	"P110678": "Quantity",
-	"P110679": "Quantity",
-	"P110680": "Quantity",
-	"P110681": "Quantity",
-	"P110682": "Quantity",
-	"P110683": "Quantity",
-	"P110684": "Quantity",
-	"P110685": "Quantity",
-	"P110686": "Quantity",
-	"P110687": "Quantity",
-	"P110688": "Quantity",
-	"P110689": "Quantity",
-	"P110690": "Quantity",
-	"P110691": "Quantity",
-	"P110692": "Quantity",
-	"P110693": "Quantity",
-	"P110694": "Quantity",
-	"P110695": "Quantity",
-	"P110696": "Quantity",
-	"P110697": "Quantity",
-	"P110698": "Quantity",
-	"P110699": "Quantity",
-	"P110700": "Quantity",
-	"P110701": "Quantity",
-	"P110702": "Quantity",
-	"P110703": "Quantity",
-	"P110704": "Quantity",
-	"P110705": "Quantity",
-	"P110706": "Quantity",
-	"P110707": "Quantity",
-	"P110708": "Quantity",
-	"P110709": "Quantity",
-	"P110710": "Quantity",
-	"P110711": "Quantity",
-	"P110712": "Quantity",
-	"P110713": "Quantity",
-	"P110714": "Quantity",
-	"P110715": "Quantity",
-	"P110716": "Quantity",
-	"P110717": "Quantity",
-	"P110718": "Quantity",
-	"P110719": "Quantity",
-	"P110720": "Quantity",
-	"P110721": "Quantity",
-	"P110722": "Quantity",
-	"P110723": "Quantity",
-	"P110724": "Quantity",
-	"P110725": "Quantity",
-	"P110726": "Quantity",
-	"P110727": "Quantity",
-	"P110728": "Quantity",
-	"P110729": "Quantity",
-	"P110730": "Quantity",
-	"P110731": "Quantity",
-	"P110732": "Quantity",
-	"P110733": "Quantity",
-	"P110734": "Quantity",
-	"P110735": "Quantity",
-	"P110736": "Quantity",
-	"P110737": "Quantity",
-	"P110738": "Quantity",
-	"P110739": "Quantity",
-	"P110740": "Quantity",
-	"P110741": "Quantity",
-	"P110742": "Quantity",
-	"P110743": "Quantity",
-	"P110744": "Quantity",
-	"P110745": "Quantity",
-	"P110746": "Quantity",
-	"P110747": "Quantity",
-	"P110748": "Quantity",
-	"P110749": "Quantity",
-	"P110750": "Quantity",
-	"P110751": "Quantity",
-	"P110752": "Quantity",
-	"P110753": "Quantity",
-	"P110754": "Quantity",
-	"P110755": "Quantity",
-	"P110756": "Quantity",
-	"P110757": "Quantity",
-	"P110758": "Quantity",
-	"P110759": "Quantity",
-	"P110760": "Quantity",
-	"P110761": "Quantity",
-	"P110762": "Quantity",
-	"P110763": "Quantity",
-	"P110764": "Quantity",
-	"P110765": "Quantity",
-	"P110766": "Quantity",
-	"P110767": "Quantity",
-	"P110768": "Quantity",
-	"P110769": "Quantity",
-	"P110770": "Quantity",
-	"P110771": "Quantity",
-	"P110772": "Quantity",
-	"P110773": "Quantity",
-	"P110774": "Quantity",
-	"P110775": "Quantity",
-	"P110776": "Quantity",
-	"P110777": "Quantity",
-	"P110778": "Quantity",
-	"P110779": "Quantity",
-	"P110780": "Quantity",
-	"P110781": "Quantity",
-	"P110782": "Quantity",
-	"P110783": "Quantity",
-	"P110784": "Quantity",
-	"P110785": "Quantity",
-	"P110786": "Quantity",
-	"P110787": "Quantity",
-	"P110788": "Quantity",
-	"P110789": "Quantity",
-	"P110790": "Quantity",
-	"P110791": "Quantity",
-	"P110792": "Quantity",
-	"P110793": "Quantity",
-	"P110794": "Quantity",
-	"P110795": "Quantity",
-	"P110796": "Quantity",
-	"P110797": "Quantity",
-	"P110798": "Quantity",
-	"P110799": "Quantity",
-	"P110800": "Quantity",
-	"P110801": "Quantity",
-	"P110802": "Quantity",
-	"P110803": "Quantity",
-	"P110804": "Quantity",
-	"P110805": "Quantity",
-	"P110806": "Quantity",
-	"P110807": "Quantity",
-	"P110808": "Quantity",
-	"P110809": "Quantity",
-	"P110810": "Quantity",
-	"P110811": "Quantity",
-	"P110812": "Quantity",
-	"P110813": "Quantity",
-	"P110814": "Quantity",
-	"P110815": "Quantity",
-	"P110816": "Quantity",
-	"P110817": "Quantity",
-	"P110818": "Quantity",
-	"P110819": "Quantity",
-	"P110820": "Quantity",
-	"P110821": "Quantity",
-	"P110822": "Quantity",
-	"P110823": "Quantity",
-	"P110824": "Quantity",
-	"P110825": "Quantity",
-	"P110826": "Quantity",
-	"P110827": "Quantity",
-	"P110828": "Quantity",
-	"P110829": "Quantity",
-	"P110830": "Quantity",
-	"P110831": "Quantity",
-	"P110832": "Quantity",
-	"P110833": "Quantity",
-	"P110834": "Quantity",
-	"P110835": "Quantity",
-	"P110836": "Quantity",
-	"P110837": "Quantity",
-	"P110838": "Quantity",
-	"P110839": "Quantity",
-	"P110840": "Quantity",
-	"P110841": "Quantity",
-	"P110842": "Quantity",
-	"P110843": "Quantity",
-	"P110844": "Quantity",
-	"P110845": "Quantity",
-	"P110846": "Quantity",
-	"P110847": "Quantity",
-	"P110848": "Quantity",
-	"P110849": "Quantity",
-	"P110850": "Quantity",
-	"P110851": "Quantity",
-	"P110852": "Quantity",
-	"P110853": "Quantity",
-	"P110854": "Quantity",
-	"P110855": "Quantity",
-	"P110856": "Quantity",
-	"P110857": "Quantity",
-	"P110858": "Quantity",
-	"P110859": "Quantity",
-	"P110860": "Quantity",
-	"P110861": "Quantity",
-	"P110862": "Quantity",
-	"P110863": "Quantity",
-	"P110864": "Quantity",
-	"P110865": "Quantity",
-	"P110866": "Quantity",
-	"P110867": "Quantity",
-	"P110868": "Quantity",
-	"P110869": "Quantity",
-	"P110870": "Quantity",
-	"P110871": "Quantity",
-	"P110872": "Quantity",
-	"P110873": "Quantity",
-	"P110874": "Quantity",
-	"P110875": "Quantity",
-	"P110876": "Quantity",
-	"P110877": "Quantity",
-	"P110878": "Quantity",
-	"P110879": "Quantity",
-	"P110880": "Quantity",
-	"P110881": "Quantity",
-	"P110882": "Quantity",
-	"P110883": "Quantity",
-	"P110884": "Quantity",
-	"P110885": "Quantity",
-	"P110886": "Quantity",
-	"P110887": "Quantity",
-	"P110888": "Quantity",
-	"P110889": "Quantity",
-	"P110890": "Quantity",
-	"P110891": "Quantity",
-	"P110892": "Quantity",
-	"P110893": "Quantity",
-	"P110894": "Quantity",
-	"P110895": "Quantity",
-	"P110896": "Quantity",
-	"P110897": "Quantity",
-	"P110898": "Quantity",
-	"P110899": "Quantity",
-	"P110900": "Quantity",
-	"P110901": "Quantity",
-	"P110902": "Quantity",
-	"P110903": "Quantity",
-	"P110904": "Quantity",
-	"P110905": "Quantity",
-	"P110906": "Quantity",
-	"P110907": "Quantity",
-	"P110908": "Quantity",
-	"P110909": "Quantity",
-	"P110910": "Quantity",
-	"P110911": "Quantity",
-	"P110912": "Quantity",
-	"P110913": "Quantity",
-	"P110914": "Quantity",
-	"P110915": "Quantity",
-	"P110916": "Quantity",
-	"P110917": "Quantity",
-	"P110918": "Quantity",
-	"P110919": "Quantity",
-	"P110920": "Quantity",
-	"P110921": "Quantity",
-	"P110922": "Quantity",
-	"P110923": "Quantity",
-	"P110924": "Quantity",
-	"P110925": "Quantity",
-	"P110926": "Quantity",
-	"P110927": "Quantity",
-	"P110928": "Quantity",
-	"P110929": "Quantity",
-	"P110930": "Quantity",
-	"P110931": "Quantity",
-	"P110932": "Quantity",
-	"P110933": "Quantity",
-	"P110934": "Quantity",
-	"P110935": "Quantity",
-	"P110936": "Quantity",
-	"P110937": "Quantity",
-	"P110938": "Quantity",
-	"P110939": "Quantity",
-	"P110940": "Quantity",
-	"P110941": "Quantity",
-	"P110942": "Quantity",
-	"P110943": "Quantity",
-	"P110944": "Quantity",
-	"P110945": "Quantity",
-	"P110946": "Quantity",
-	"P110947": "Quantity",
-	"P110948": "Quantity",
-	"P110949": "Quantity",
-	"P110950": "Quantity",
-	"P110951": "Quantity",
-	"P110952": "Quantity",
-	"P110953": "Quantity",
-	"P110954": "Quantity",
-	"P110955": "Quantity",
-	"P110956": "Quantity",
-	"P110957": "Quantity",
-	"P110958": "Quantity",
-	"P110959": "Quantity",
-	"P110960": "Quantity",
-	"P110961": "Quantity",
-	"P110962": "Quantity",
-	"P110963": "Quantity",
-	"P110964": "Quantity",
-	"P110965": "Quantity",
-	"P110966": "Quantity",
-	"P110967": "Quantity",
-	"P110968": "Quantity",
-	"P110969": "Quantity",
-	"P110970": "Quantity",
-	"P110971": "Quantity",
-	"P110972": "Quantity",
-	"P110973": "Quantity",
-	"P110974": "Quantity",
-	"P110975": "Quantity",
-	"P110976": "Quantity",
-	"P110977": "Quantity",
-	"P110978": "Quantity",
-	"P110979": "Quantity",
-	"P110980": "Quantity",
-	"P110981": "Quantity",
-	"P110982": "Quantity",
-	"P110983": "Quantity",
-	"P110984": "Quantity",
-	"P110985": "Quantity",
-	"P110986": "Quantity",
-	"P110987": "Quantity",
-	"P110988": "Quantity",
-	"P110989": "Quantity",
-	"P110990": "Quantity",
-	"P110991": "Quantity",
-	"P110992": "Quantity",
-	"P110993": "Quantity",
-	"P110994": "Quantity",
-	"P110995": "Quantity",
-	"P110996": "Quantity",
-	"P110997": "Quantity",
-	"P110998": "Quantity",
-	"P110999": "Quantity",
-	"P111000": "Quantity",
-	"P111001": "Quantity",
-	"P111002": "Quantity",
-	"P111003": "Quantity",
-	"P111004": "Quantity",
-	"P111005": "Quantity",
-	"P111006": "Quantity",
-	"P111007": "Quantity",
-	"P111008": "Quantity",
-	"P111009": "Quantity",
-	"P111010": "Quantity",
-	"P111011": "Quantity",
-	"P111012": "Quantity",
-	"P111013": "Quantity",
-	"P111014": "Quantity",
-	"P111015": "Quantity",
-	"P111016": "Quantity",
-	"P111017": "Quantity",
-	"P111018": "Quantity",
-	"P111019": "Quantity",
-	"P111020": "Quantity",
-	"P111021": "Quantity",
-	"P111022": "Quantity",
-	"P111023": "Quantity",
-	"P111024": "Quantity",
-	"P111025": "Quantity",
-	"P111026": "Quantity",
-	"P111027": "Quantity",
-	"P111028": "Quantity",
-	"P111029": "Quantity",
-	"P111030": "Quantity",
-	"P111031": "Quantity",
-	"P111032": "Quantity",
-	"P111033": "Quantity",
-	"P111034": "Quantity",
-	"P111035": "Quantity",
-	"P111036": "Quantity",
-	"P111037": "Quantity",
-	"P111038": "Quantity",
-	"P111039": "Quantity",
-	"P111040": "Quantity",
-	"P111041": "Quantity",
-	"P111042": "Quantity",
-	"P111043": "Quantity",
-	"P111044": "Quantity",
-	"P111045": "Quantity",
-	"P111046": "Quantity",
-	"P111047": "Quantity",
-	"P111048": "Quantity",
-	"P111049": "Quantity",
-	"P111050": "Quantity",
-	"P111051": "Quantity",
-	"P111052": "Quantity",
-	"P111053": "Quantity",
-	"P111054": "Quantity",
-	"P111055": "Quantity",
-	"P111056": "Quantity",
-	"P111057": "Quantity",
-	"P111058": "Quantity",
-	"P111059": "Quantity",
-	"P111060": "Quantity",
-	"P111061": "Quantity",
-	"P111062": "Quantity",
-	"P111063": "Quantity",
-	"P111064": "Quantity",
-	"P111065": "Quantity",
-	"P111066": "Quantity",
-	"P111067": "Quantity",
-	"P111068": "Quantity",
-	"P111069": "Quantity",
-	"P111070": "Quantity",
-	"P111071": "Quantity",
-	"P111072": "Quantity",
-	"P111073": "Quantity",
-	"P111074": "Quantity",
-	"P111075": "Quantity",
-	"P111076": "Quantity",
-	"P111077": "Quantity",
-	"P111078": "Quantity",
-	"P111079": "Quantity",
-	"P111080": "Quantity",
-	"P111081": "Quantity",
-	"P111082": "Quantity",
-	"P111083": "Quantity",
-	"P111084": "Quantity",
-	"P111085": "Quantity",
-	"P111086": "Quantity",
-	"P111087": "Quantity",
-	"P111088": "Quantity",
-	"P111089": "Quantity",
-	"P111090": "Quantity",
-	"P111091": "Quantity",
-	"P111092": "Quantity",
-	"P111093": "Quantity",
-	"P111094": "Quantity",
-	"P111095": "Quantity",
-	"P111096": "Quantity",
-	"P111097": "Quantity",
-	"P111098": "Quantity",
-	"P111099": "Quantity",
-	"P111100": "Quantity",
-	"P111101": "Quantity",
-	"P111102": "Quantity",
-	"P111103": "Quantity",
-	"P111104": "Quantity",
-	"P111105": "Quantity",
-	"P111106": "Quantity",
-	"P111107": "Quantity",
-	"P111108": "Quantity",
-	"P111109": "Quantity",
-	"P111110": "Quantity",
-	"P111111": "Quantity",
-	"P111112": "Quantity",
-	"P111113": "Quantity",
-	"P111114": "Quantity",
-	"P111115": "Quantity",
-	"P111116": "Quantity",
-	"P111117": "Quantity",
-	"P111118": "Quantity",
-	"P111119": "Quantity",
-	"P111120": "Quantity",
-	"P111121": "Quantity",
-	"P111122": "Quantity",
-	"P111123": "Quantity",
-	"P111124": "Quantity",
-	"P111125": "Quantity",
-	"P111126": "Quantity",
-	"P111127": "Quantity",
-	"P111128": "Quantity",
-	"P111129": "Quantity",
-	"P111130": "Quantity",
-	"P111131": "Quantity",
-	"P111132": "Quantity",
-	"P111133": "Quantity",
-	"P111134": "Quantity",
-	"P111135": "Quantity",
-	"P111136": "Quantity",
-	"P111137": "Quantity",
-	"P111138": "Quantity",
-	"P111139": "Quantity",
-	"P111140": "Quantity",
-	"P111141": "Quantity",
-	"P111142": "Quantity",
-	"P111143": "Quantity",
-	"P111144": "Quantity",
-	"P111145": "Quantity",
-	"P111146": "Quantity",
-	"P111147": "Quantity",
-	"P111148": "Quantity",
-	"P111149": "Quantity",
-	"P111150": "Quantity",
-	"P111151": "Quantity",
-	"P111152": "Quantity",
-	"P111153": "Quantity",
-	"P111154": "Quantity",
-	"P111155": "Quantity",
-	"P111156": "Quantity",
-	"P111157": "Quantity",
-	"P111158": "Quantity",
-	"P111159": "Quantity",
-	"P111160": "Quantity",
-	"P111161": "Quantity",
-	"P111162": "Quantity",
-	"P111163": "Quantity",
-	"P111164": "Quantity",
-	"P111165": "Quantity",
-	"P111166": "Quantity",
-	"P111167": "Quantity",
-	"P111168": "Quantity",
-	"P111169": "Quantity",
-	"P111170": "Quantity",
-	"P111171": "Quantity",
-	"P111172": "Quantity",
-	"P111173": "Quantity",
-	"P111174": "Quantity",
-	"P111175": "Quantity",
-	"P111176": "Quantity",
-	"P111177": "Quantity",
-	"P111178": "Quantity",
-	"P111179": "Quantity",
-	"P111180": "Quantity",
-	"P111181": "Quantity",
-	"P111182": "Quantity",
-	"P111183": "Quantity",
-	"P111184": "Quantity",
-	"P111185": "Quantity",
-	"P111186": "Quantity",
-	"P111187": "Quantity",
-	"P111188": "Quantity",
-	"P111189": "Quantity",
-	"P111190": "Quantity",
-	"P111191": "Quantity",
-	"P111192": "Quantity",
-	"P111193": "Quantity",
-	"P111194": "Quantity",
-	"P111195": "Quantity",
-	"P111196": "Quantity",
-	"P111197": "Quantity",
-	"P111198": "Quantity",
-	"P111199": "Quantity",
-	"P111200": "Quantity",
-	"P111201": "Quantity",
-	"P111202": "Quantity",
-	"P111203": "Quantity",
-	"P111204": "Quantity",
-	"P111205": "Quantity",
-	"P111206": "Quantity",
-	"P111207": "Quantity",
-	"P111208": "Quantity",
-	"P111209": "Quantity",
-	"P111210": "Quantity",
-	"P111211": "Quantity",
-	"P111212": "Quantity",
-	"P111213": "Quantity",
-	"P111214": "Quantity",
-	"P111215": "Quantity",
-	"P111216": "Quantity",
-	"P111217": "Quantity",
-	"P111218": "Quantity",
-	"P111219": "Quantity",
-	"P111220": "Quantity",
-	"P111221": "Quantity",
-	"P111222": "Quantity",
-	"P111223": "Quantity",
-	"P111224": "Quantity",
-	"P111225": "Quantity",
-	"P111226": "Quantity",
-	"P111227": "Quantity",
-	"P111228": "Quantity",
-	"P111229": "Quantity",
-	"P111230": "Quantity",
-	"P111231": "Quantity",
-	"P111232": "Quantity",
-	"P111233": "Quantity",
-	"P111234": "Quantity",
-	"P111235": "Quantity",
-	"P111236": "Quantity",
-	"P111237": "Quantity",
-	"P111238": "Quantity",
-	"P111239": "Quantity",
-	"P111240": "Quantity",
-	"P111241": "Quantity",
-	"P111242": "Quantity",
-	"P111243": "Quantity",
-	"P111244": "Quantity",
-	"P111245": "Quantity",
-	"P111246": "Quantity",
-	"P111247": "Quantity",
-	"P111248": "Quantity",
-	"P111249": "Quantity",
-	"P111250": "Quantity",
-	"P111251": "Quantity",
-	"P111252": "Quantity",
-	"P111253": "Quantity",
-	"P111254": "Quantity",
-	"P111255": "Quantity",
-	"P111256": "Quantity",
-	"P111257": "Quantity",
-	"P111258": "Quantity",
-	"P111259": "Quantity",
-	"P111260": "Quantity",
-	"P111261": "Quantity",
-	"P111262": "Quantity",
-	"P111263": "Quantity",
-	"P111264": "Quantity",
-	"P111265": "Quantity",
-	"P111266": "Quantity",
-	"P111267": "Quantity",
-	"P111268": "Quantity",
-	"P111269": "Quantity",
-	"P111270": "Quantity",
-	"P111271": "Quantity",
-	"P111272": "Quantity",
-	"P111273": "Quantity",
-	"P111274": "Quantity",
-	"P111275": "Quantity",
-	"P111276": "Quantity",
-	"P111277": "Quantity",
-	"P111278": "Quantity",
-	"P111279": "Quantity",
-	"P111280": "Quantity",
-	"P111281": "Quantity",
-	"P111282": "Quantity",
-	"P111283": "Quantity",
-	"P111284": "Quantity",
-	"P111285": "Quantity",
-	"P111286": "Quantity",
-	"P111287": "Quantity",
-	"P111288": "Quantity",
-	"P111289": "Quantity",
-	"P111290": "Quantity",
-	"P111291": "Quantity",
-	"P111292": "Quantity",
-	"P111293": "Quantity",
-	"P111294": "Quantity",
-	"P111295": "Quantity",
-	"P111296": "Quantity",
-	"P111297": "Quantity",
-	"P111298": "Quantity",
-	"P111299": "Quantity",
-	"P111300": "Quantity",
-	"P111301": "Quantity",
-	"P111302": "Quantity",
-	"P111303": "Quantity",
-	"P111304": "Quantity",
-	"P111305": "Quantity",
-	"P111306": "Quantity",
-	"P111307": "Quantity",
-	"P111308": "Quantity",
-	"P111309": "Quantity",
-	"P111310": "Quantity",
-	"P111311": "Quantity",
-	"P111312": "Quantity",
-	"P111313": "Quantity",
-	"P111314": "Quantity",
-	"P111315": "Quantity",
-	"P111316": "Quantity",
-	"P111317": "Quantity",
-	"P111318": "Quantity",
-	"P111319": "Quantity",
-	"P111320": "Quantity",
-	"P111321": "Quantity",
-	"P111322": "Quantity",
-	"P111323": "Quantity",
-	"P111324": "Quantity",
-	"P111325": "Quantity",
-	"P111326": "Quantity",
-	"P111327": "Quantity",
-	"P111328": "Quantity",
-	"P111329": "Quantity",
-	"P111330": "Quantity",
-	"P111331": "Quantity",
-	"P111332": "Quantity",
-	"P111333": "Quantity",
-	"P111334": "Quantity",
-	"P111335": "Quantity",
-	"P111336": "Quantity",
-	"P111337": "Quantity",
-	"P111338": "Quantity",
-	"P111339": "Quantity",
-	"P111340": "Quantity",
-	"P111341": "Quantity",
-	"P111342": "Quantity",
-	"P111343": "Quantity",
-	"P111344": "Quantity",
-	"P111345": "Quantity",
-	"P111346": "Quantity",
-	"P111347": "Quantity",
-	"P111348": "Quantity",
-	"P111349": "Quantity",
-	"P111350": "Quantity",
-	"P111351": "Quantity",
-	"P111352": "Quantity",
-	"P111353": "Quantity",
-	"P111354": "Quantity",
-	"P111355": "Quantity",
-	"P111356": "Quantity",
-	"P111357": "Quantity",
-	"P111358": "Quantity",
-	"P111359": "Quantity",
-	"P111360": "Quantity",
-	"P111361": "Quantity",
-	"P111362": "Quantity",
-	"P111363": "Quantity",
-	"P111364": "Quantity",
-	"P111365": "Quantity",
-	"P111366": "Quantity",
-	"P111367": "Quantity",
-	"P111368": "Quantity",
-	"P111369": "Quantity",
-	"P111370": "Quantity",
-	"P111371": "Quantity",
-	"P111372": "Quantity",
-	"P111373": "Quantity",
-	"P111374": "Quantity",
-	"P111375": "Quantity",
-	"P111376": "Quantity",
-	"P111377": "Quantity",
-	"P111378": "Quantity",
-	"P111379": "Quantity",
-	"P111380": "Quantity",
-	"P111381": "Quantity",
-	"P111382": "Quantity",
-	"P111383": "Quantity",
-	"P111384": "Quantity",
-	"P111385": "Quantity",
-	"P111386": "Quantity",
-	"P111387": "Quantity",
-	"P111388": "Quantity",
-	"P111389": "Quantity",
-	"P111390": "Quantity",
-	"P111391": "Quantity",
-	"P111392": "Quantity",
-	"P111393": "Quantity",
-	"P111394": "Quantity",
-	"P111395": "Quantity",
-	"P111396": "Quantity",
-	"P111397": "Quantity",
-	"P111398": "Quantity",
-	"P111399": "Quantity",
-	"P111400": "Quantity",
-	"P111401": "Quantity",
-	"P111402": "Quantity",
-	"P111403": "Quantity",
-	"P111404": "Quantity",
-	"P111405": "Quantity",
-	"P111406": "Quantity",
-	"P111407": "Quantity",
-	"P111408": "Quantity",
-	"P111409": "Quantity",
-	"P111410": "Quantity",
-	"P111411": "Quantity",
-	"P111412": "Quantity",
-	"P111413": "Quantity",
-	"P111414": "Quantity",
-	"P111415": "Quantity",
-	"P111416": "Quantity",
-	"P111417": "Quantity",
-	"P111418": "Quantity",
-	"P111419": "Quantity",
-	"P111420": "Quantity",
-	"P111421": "Quantity",
-	"P111422": "Quantity",
-	"P111423": "Quantity",
-	"P111424": "Quantity",
-	"P111425": "Quantity",
-	"P111426": "Quantity",
-	"P111427": "Quantity",
-	"P111428": "Quantity",
-	"P111429": "Quantity",
-	"P111430": "Quantity",
-	"P111431": "Quantity",
-	"P111432": "Quantity",
-	"P111433": "Quantity",
-	"P111434": "Quantity",
-	"P111435": "Quantity",
-	"P111436": "Quantity",
-	"P111437": "Quantity",
-	"P111438": "Quantity",
-	"P111439": "Quantity",
-	"P111440": "Quantity",
-	"P111441": "Quantity",
-	"P111442": "Quantity",
-	"P111443": "Quantity",
-	"P111444": "Quantity",
-	"P111445": "Quantity",
-	"P111446": "Quantity",
-	"P111447": "Quantity",
-	"P111448": "Quantity",
-	"P111449": "Quantity",
-	"P111450": "Quantity",
-	"P111451": "Quantity",
-	"P111452": "Quantity",
-	"P111453": "Quantity",
-	"P111454": "Quantity",
-	"P111455": "Quantity",
-	"P111456": "Quantity",
-	"P111457": "Quantity",
-	"P111458": "Quantity",
-	"P111459": "Quantity",
-	"P111460": "Quantity",
-	"P111461": "Quantity",
-	"P111462": "Quantity",
-	"P111463": "Quantity",
-	"P111464": "Quantity",
-	"P111465": "Quantity",
-	"P111466": "Quantity",
-	"P111467": "Quantity",
-	"P111468": "Quantity",
-	"P111469": "Quantity",
-	"P111470": "Quantity",
-	"P111471": "Quantity",
-	"P111472": "Quantity",
-	"P111473": "Quantity",
-	"P111474": "Quantity",
-	"P7482": "WikibaseItem"
-}
-
-
-
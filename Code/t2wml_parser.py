@@ -5,6 +5,7 @@ from typing import Union
 from Code.dictionary import class_dictionary
 from Code.bindings import bindings
 from Code.ValueExpression import ValueExpression
+from Code.ItemExpression import ItemExpression
 from Code.BooleanEquation import BooleanEquation
 from Code.ColumnExpression import ColumnExpression
 from Code.RowExpression import RowExpression
@@ -178,6 +179,25 @@ def get_cell(root: str) -> tuple:
     return result
 
 
+def iterate_and_get_cell(root: Union[ItemExpression, ValueExpression, BooleanEquation]) -> Union[tuple, None]:
+    """
+    This function binds the iteration variable of the expression and increments it until the expression evaluates
+    to a non empty value. The expression is then evaluated and returned along with the cell index it operates on.
+    None is returned if the expression has more than one iteration variable
+    :param root:
+    :return: (column, row, value) or None
+    """
+    variables = list(root.variables)
+    if len(variables) != 1:
+        return None
+    bindings[variables[0]] = 0
+    while not root.evaluate(bindings):
+        bindings[variables[0]] += 1
+    result = root.evaluate_and_get_cell(bindings)
+    del bindings[variables[0]]
+    return result
+
+
 def parse_evaluate_and_get_cell(text_to_parse: str) -> tuple:
     """
     This function evaluates the expressions and return its value.
@@ -1,136 +1,92 @@
+import io
+import multiprocessing
 from pathlib import Path
-from etk.etk import ETK
+from typing import Tuple
 from app_config import app
 import os
-from etk.knowledge_graph.schema import KGSchema
-from etk.etk_module import ETKModule
-from etk.wikidata.entity import WDItem
-from etk.wikidata.value import Item, Property, StringValue, URLValue, TimeValue, QuantityValue, MonolingualText, \
-    ExternalIdentifier, GlobeCoordinate
+from etk.wikidata.entity import change_recorder
 from etk.wikidata import serialize_change_record
-from Code.utility_functions import get_property_type, translate_precision_to_integer
-from Code.property_type_map import property_type_map as property_type_dict
+from Code.TripleWriter import TripleWriter
+from Code.StatementSerializer import StatementSerializer
+
+# statements are split into shards of this size which are serialized by parallel worker processes
+TRIPLES_SHARD_SIZE = 10000
 
 
 def generate_triples(user_id: str, resolved_excel: list, sparql_endpoint: str, filetype: str = 'ttl',
-                     created_by: str = 't2wml') -> str:
+                     created_by: str = 't2wml', property_types: dict = None) -> str:
     """
-    This function uses ETK to generate the RDF triples
+    This function generates the RDF triples of the statements
     :param user_id:
     :param resolved_excel:
     :param sparql_endpoint:
-    :param filetype:
+    :param filetype: ttl or nt
+    :param created_by:
+    :param property_types: types of the properties resolved while evaluating the template
     :return:
     """
-    # initialize
-    kg_schema = KGSchema()
-    kg_schema.add_schema('@prefix : <http://isi.edu/> .', 'ttl')
-    etk = ETK(kg_schema=kg_schema, modules=ETKModule)
-    doc = etk.create_document({}, doc_id="http://isi.edu/default-ns/projects")
-    property_type_map = property_type_dict
+    output_file = io.StringIO()
+    triple_writer = TripleWriter(output_file, filetype)
+    write_triples_in_parallel(triple_writer, resolved_excel, sparql_endpoint, created_by, property_types)
+    triple_writer.close()
+    return output_file.getvalue()
 
-    # bind prefixes
-    doc.kg.bind('wikibase', 'http://wikiba.se/ontology#')
-    doc.kg.bind('wd', 'http://www.wikidata.org/entity/')
-    doc.kg.bind('wdt', 'http://www.wikidata.org/prop/direct/')
-    doc.kg.bind('wdtn', 'http://www.wikidata.org/prop/direct-normalized/')
-    doc.kg.bind('wdno', 'http://www.wikidata.org/prop/novalue/')
-    doc.kg.bind('wds', 'http://www.wikidata.org/entity/statement/')
-    doc.kg.bind('wdv', 'http://www.wikidata.org/value/')
-    doc.kg.bind('wdref', 'http://www.wikidata.org/reference/')
-    doc.kg.bind('p', 'http://www.wikidata.org/prop/')
-    doc.kg.bind('pr', 'http://www.wikidata.org/prop/reference/')
-    doc.kg.bind('prv', 'http://www.wikidata.org/prop/reference/value/')
-    doc.kg.bind('prn', 'http://www.wikidata.org/prop/reference/value-normalized/')
-    doc.kg.bind('ps', 'http://www.wikidata.org/prop/statement/')
-    doc.kg.bind('psv', 'http://www.wikidata.org/prop/statement/value/')
-    doc.kg.bind('psn', 'http://www.wikidata.org/prop/statement/value-normalized/')
-    doc.kg.bind('pq', 'http://www.wikidata.org/prop/qualifier/')
-    doc.kg.bind('pqv', 'http://www.wikidata.org/prop/qualifier/value/')
-    doc.kg.bind('pqn', 'http://www.wikidata.org/prop/qualifier/value-normalized/')
-    doc.kg.bind('skos', 'http://www.w3.org/2004/02/skos/core#')
-    doc.kg.bind('prov', 'http://www.w3.org/ns/prov#')
-    doc.kg.bind('schema', 'http://schema.org/')
 
-    # property_type_cache = {}
-    is_error = False
-    for i in resolved_excel:
-        _item = i["statement"]["item"]
-        if _item is not None:
-            item = WDItem(_item, creator='http://www.isi.edu/{}'.format(created_by))
-            try:
-                property_type = property_type_map[i["statement"]["property"]]
-            except KeyError:
-                property_type = get_property_type(i["statement"]["property"], sparql_endpoint)
-                if property_type != "Property Not Found" and i["statement"]["property"] not in property_type_map:
-                    property_type_map[i["statement"]["property"]] = property_type
-            if property_type == "WikibaseItem":
-                value = Item(str(i["statement"]["value"]))
-            elif property_type == "WikibaseProperty":
-                value = Property(i["statement"]["value"])
-            elif property_type == "String":
-                value = StringValue(i["statement"]["value"])
-            elif property_type == "Quantity":
-                _value = i["statement"]["value"]
-                _value = str(_value).replace(',', '')
-                value = QuantityValue(_value)
-            elif property_type == "Time":
-                value = TimeValue(str(i["statement"]["value"]), Item(i["statement"]["calendar"]),
-                                  translate_precision_to_integer(i["statement"]["precision"]),
-                                  i["statement"]["time_zone"])
-            elif property_type == "Url":
-                value = URLValue(i["statement"]["value"])
-            elif property_type == "Monolingualtext":
-                value = MonolingualText(i["statement"]["value"], i["statement"]["lang"])
-            elif property_type == "ExternalId":
-                value = ExternalIdentifier(i["statement"]["value"])
-            elif property_type == "GlobeCoordinate":
-                value = GlobeCoordinate(i["statement"]["latitude"], i["statement"]["longitude"],
-                                        i["statement"]["precision"])
-            elif property_type == "Property Not Found":
-                is_error = True
-                break
-            s = item.add_statement(i["statement"]["property"], value)
-            doc.kg.add_subject(item)
+def write_triples_in_parallel(triple_writer: TripleWriter, resolved_excel: list, sparql_endpoint: str,
+                              created_by: str = 't2wml', property_types: dict = None) -> None:
+    """
+    This function splits the statements into shards which are serialized by parallel worker processes.
+    The shards are written in the order of the statements, after the prefix header which the triple writer
+    has written once, and the changes recorded by the workers are added to the change record of this process
+    :param triple_writer:
+    :param resolved_excel:
+    :param sparql_endpoint:
+    :param created_by:
+    :param property_types: types of the properties resolved while evaluating the template
+    :return:
+    """
+    statement_serializer = StatementSerializer(sparql_endpoint, created_by, property_types)
+    shards = [resolved_excel[start:start + TRIPLES_SHARD_SIZE] for start in range(0, len(resolved_excel), TRIPLES_SHARD_SIZE)]
+    processes = min(len(shards), os.cpu_count() or 1)
+    if processes <= 1:
+        statement_serializer.write(triple_writer, resolved_excel)
+        return
+    # resolved once here rather than by every worker
+    statement_serializer.resolve_property_types(resolved_excel)
+    arguments = [(shard, sparql_endpoint, triple_writer.filetype, created_by, statement_serializer.property_types)
+                 for shard in shards]
+    pool = multiprocessing.Pool(processes)
+    try:
+        for triples, changes in pool.imap(serialize_shard_arguments, arguments):
+            triple_writer.write(triples)
+            change_recorder.update(changes)
+    finally:
+        pool.terminate()
+
 
-            if "qualifier" in i["statement"]:
-                for j in i["statement"]["qualifier"]:
-                    try:
-                        property_type = property_type_map[j["property"]]
+def serialize_shard(resolved_excel: list, sparql_endpoint: str, filetype: str = 'ttl', created_by: str = 't2wml',
+                    property_types: dict = None) -> Tuple[str, set]:
+    """
+    This function serializes a shard of the statements in a worker process, without the prefix header
+    :param resolved_excel:
+    :param sparql_endpoint:
+    :param filetype:
+    :param created_by:
+    :param property_types:
+    :return: triples, (item, property) changes recorded while generating them
+    """
+    # the change record of a worker process only holds the changes of its current shard
+    change_recorder.clear()
+    output_file = io.StringIO()
+    StatementSerializer(sparql_endpoint, created_by, property_types).write(TripleWriter(output_file, filetype, header=False),
+                                                                          resolved_excel)
+    return output_file.getvalue(), set(change_recorder)
 
-                    except KeyError:
-                        property_type = get_property_type(j["property"], sparql_endpoint)
-                        if property_type != "Property Not Found" and i["statement"]["property"] not in property_type_map:
-                            property_type_map[i["statement"]["property"]] = property_type
-                    if property_type == "WikibaseItem":
-                        value = Item(str(j["value"]))
-                    elif property_type == "WikibaseProperty":
-                        value = Property(j["value"])
-                    elif property_type == "String":
-                        value = StringValue(j["value"])
-                    elif property_type == "Quantity":
-                        value = QuantityValue(j["value"])
-                    elif property_type == "Time":
-                        value = TimeValue(str(j["value"]), Item(j["calendar"]), j["precision"], j["time_zone"])
-                    elif property_type == "Url":
-                        value = URLValue(j["value"])
-                    elif property_type == "Monolingualtext":
-                        value = MonolingualText(j["value"], j["lang"])
-                    elif property_type == "ExternalId":
-                        value = ExternalIdentifier(j["value"])
-                    elif property_type == "GlobeCoordinate":
-                        value = GlobeCoordinate(j["latitude"], j["longitude"], j["precision"])
-                    elif property_type == "Property Not Found":
-                        is_error = True
-                    if value is None:
-                        continue
-                    else:
-                        s.add_qualifier(j["property"], value)
-            doc.kg.add_subject(s)
-    if not is_error:
-        data = doc.kg.serialize(filetype)
-    else:
-        # data = "Property Not Found"
-        raise Exception('data exception while generating triples')
 
-    return data
+def serialize_shard_arguments(arguments: tuple) -> Tuple[str, set]:
+    """
+    This function unpacks the arguments of serialize_shard for the worker processes
+    :param arguments:
+    :return:
+    """
+    return serialize_shard(*arguments)
@@ -1,22 +1,39 @@
-from SPARQLWrapper import SPARQLWrapper, JSON
 import string
 import pyexcel
+from pyexcel_io import service as pyexcel_io_service
 import os
 import re
+import sys
 import json
 import pickle
 from time import time
 from uuid import uuid4
-from typing import Sequence, Union, Tuple, List, Dict, Any
+from typing import Sequence, Union, Tuple, List, Dict, Any, Iterable, Iterator
 from google.oauth2 import id_token
 from google.auth.transport import requests
 from pathlib import Path
+from collections import OrderedDict
 from oslo_concurrency import lockutils
 # from Code.Project import Project
 # from Code.YAMLFile import YAMLFile
-from Code.property_type_map import property_type_map
+from Code.PropertyTypeMap import property_type_map
+from Code.PropertyTypeCache import get_property_type_cache
+from Code.SheetSnapshot import SheetSnapshot
+from Code.Workbook import Workbook
 from app_config import GOOGLE_CLIENT_ID, DEFAULT_SPARQL_ENDPOINT
 
+NATURAL_SORT_REGEX = re.compile('([0-9]+)')
+# approximate number of bytes of parsed sheets which are kept in memory, the least recently used sheets are dropped first
+SHEET_CACHE_MEMORY = 256 * 1024 * 1024
+sheet_cache = OrderedDict()
+# number of workbooks whose sheet names and snapshots are kept open
+WORKBOOK_CACHE_SIZE = 64
+workbook_cache = OrderedDict()
+# maximum number of rows of a sheet which are sent to the GUI at once, larger sheets are fetched a window at a time
+SHEET_WINDOW_SIZE = 10000
+# number of changes after which the wikifier journal is merged into the wikifier region file
+WIKIFIER_JOURNAL_SIZE = 500
+
 
 def get_column_letter(n: int) -> str:
     """
@@ -79,77 +96,411 @@ def get_property_type(wikidata_property: str, sparql_endpoint: str) -> str:
     :param sparql_endpoint:
     :return:
     """
+    property_types = get_property_types([wikidata_property], sparql_endpoint)
+    if wikidata_property not in property_types:
+        raise ValueError("Invalid property " + str(wikidata_property))
+    return property_types[wikidata_property]
+
+
+def get_property_types(wikidata_properties: Iterable[str], sparql_endpoint: str) -> Dict[str, str]:
+    """
+    This function finds out the types of several wikidata properties at once. The known properties are looked up
+    in the property type map, the others in the on-disk cache of the endpoint and the rest are queried together.
+    Properties which are not valid property names are left out
+    :param wikidata_properties:
+    :param sparql_endpoint:
+    :return: dictionary from property to its type, "Property Not Found" if the endpoint does not have it
+    """
+    property_types = dict()
+    unknown_properties = list()
+    for wikidata_property in wikidata_properties:
+        property_type = property_type_map.get(wikidata_property)
+        if property_type is not None:
+            property_types[wikidata_property] = property_type
+        elif isinstance(wikidata_property, str):
+            unknown_properties.append(wikidata_property)
+    if unknown_properties:
+        property_types.update(get_property_type_cache(sparql_endpoint).resolve(unknown_properties))
+    return property_types
+
+
+def get_cached_property_type(wikidata_property: str, sparql_endpoint: str, property_types: dict) -> str:
+    """
+    This function returns the type of a wikidata property from the property_types dictionary
+    and queries it only once for every distinct property
+    :param wikidata_property:
+    :param sparql_endpoint:
+    :param property_types:
+    :return:
+    """
     try:
-        type = property_type_map[wikidata_property]
+        return property_types[wikidata_property]
     except KeyError:
-        query = """SELECT ?type WHERE {
-            wd:""" + wikidata_property + """ rdf:type wikibase:Property ;
-            wikibase:propertyType ?type .  
-        }"""
-        sparql = SPARQLWrapper(sparql_endpoint)
-        sparql.setQuery(query)
-        sparql.setReturnFormat(JSON)
-        results = sparql.query().convert()
-        try:
-            type = results["results"]["bindings"][0]["type"]["value"].split("#")[1]
-            property_type_map[wikidata_property] = type
-        except IndexError:
-            type = "Property Not Found"
-    return type
-
-
-def add_row_in_data_file(file_path: str, sheet_name: str):
-    """
-    This function adds a new blank row at the end of the excel file
+        property_type = get_property_type(wikidata_property, sparql_endpoint)
+        property_types[wikidata_property] = property_type
+        return property_type
+    except TypeError:
+        return get_property_type(wikidata_property, sparql_endpoint)
+
+
+def iterate_sheet_columns(sheet: Union[pyexcel.Sheet, SheetSnapshot], width: int) -> Iterator[Iterator[Tuple[int, Any]]]:
+    """
+    This function iterates over the first columns of a sheet without copying its rows,
+    the columns of a snapshot are decoded one at a time
+    :param sheet:
+    :param width: number of columns
+    :return: (row, value) of the cells of every column
+    """
+    if isinstance(sheet, SheetSnapshot):
+        for column in range(min(width, sheet.number_of_columns)):
+            yield enumerate(sheet.iterate_column(column))
+        return
+    rows = sheet.to_array()
+    for column in range(width):
+        yield ((row, row_values[column]) for row, row_values in enumerate(rows) if column < len(row_values))
+
+
+def sort_cells_by_row(index: dict) -> dict:
+    """
+    This function puts the cells of every value of an index which was built column by column in row major order.
+    The sort is stable so the cells of a row stay in column order
+    :param index:
+    :return:
+    """
+    for cells in index.values():
+        if len(cells) > 1:
+            cells.sort(key=lambda cell: cell[1])
+    return index
+
+
+def build_value_index(sheet: Union[pyexcel.Sheet, SheetSnapshot]) -> dict:
+    """
+    This function builds an inverted index from the stripped string value of the cells to their (column, row)
+    indices, the cells of every value are listed in row major order
+    :param sheet:
+    :return:
+    """
+    value_index = dict()
+    width = len(sheet[0]) if len(sheet) else 0
+    for col, cells in enumerate(iterate_sheet_columns(sheet, width)):
+        for row, cell_value in cells:
+            value_index.setdefault(str(cell_value).strip(), list()).append((col, row))
+    return sort_cells_by_row(value_index)
+
+
+def build_cell_value_index(sheet: Union[pyexcel.Sheet, SheetSnapshot]) -> dict:
+    """
+    This function builds an inverted index from the raw value of the cells to their (column, row) indices.
+    Unlike build_value_index the values are not converted to strings so the cells of a value are exactly
+    the cells which compare equal to it
+    :param sheet:
+    :return:
+    """
+    cell_value_index = dict()
+    width = len(sheet[0]) if len(sheet) else 0
+    for col, cells in enumerate(iterate_sheet_columns(sheet, width)):
+        for row, cell_value in cells:
+            cell_value_index.setdefault(cell_value, list()).append((col, row))
+    return sort_cells_by_row(cell_value_index)
+
+
+def get_file_version(file_path: str) -> tuple:
+    """
+    This function returns the path, modification time and size of a file which identify the version of the file
+    :param file_path:
+    :return:
+    """
+    file_stat = os.stat(file_path)
+    return file_path, file_stat.st_mtime_ns, file_stat.st_size
+
+
+def estimate_sheet_size(sheet: Union[pyexcel.Sheet, SheetSnapshot]) -> int:
+    """
+    This function estimates the number of bytes held by the rows and cell values of a sheet,
+    the cells of a snapshot are memory mapped and are not counted
+    :param sheet:
+    :return:
+    """
+    if isinstance(sheet, SheetSnapshot):
+        return sys.getsizeof(sheet)
+    rows = sheet.to_array()
+    size = sys.getsizeof(rows)
+    for row_values in rows:
+        size += sys.getsizeof(row_values) + sum(sys.getsizeof(cell_value) for cell_value in row_values)
+    return size
+
+
+def estimate_index_size(index: dict) -> int:
+    """
+    This function estimates the number of bytes held by an index from values to the cells which have them
+    :param index:
+    :return:
+    """
+    size = sys.getsizeof(index)
+    for value, cells in index.items():
+        size += sys.getsizeof(value) + sys.getsizeof(cells) + sum(sys.getsizeof(cell) for cell in cells)
+    return size
+
+
+def get_workbook(excel_filepath: str) -> Workbook:
+    """
+    This function returns the workbook of an excel file, the workbook is opened once for every version of the file
+    :param excel_filepath:
+    :return:
+    """
+    key = get_file_version(excel_filepath)
+    if key in workbook_cache:
+        workbook_cache.move_to_end(key)
+    else:
+        workbook_cache[key] = Workbook(excel_filepath)
+        if len(workbook_cache) > WORKBOOK_CACHE_SIZE:
+            workbook_cache.popitem(last=False)
+    return workbook_cache[key]
+
+
+def get_cached_sheet(excel_filepath: str, sheet_name: str = None) -> dict:
+    """
+    This function returns the cache entry of a sheet, the entry is created when the sheet is requested
+    for the first time or when the file has been modified since.
+    Only the requested sheet is parsed, or read from the snapshot of the file if it has an up to date one.
+    The cached sheet is shared by all the callers of this process so it must never be modified
+    :param excel_filepath:
+    :param sheet_name:
+    :return:
+    """
+    key = get_file_version(excel_filepath) + (sheet_name,)
+    if key in sheet_cache:
+        sheet_cache.move_to_end(key)
+        return sheet_cache[key]
+    sheet = get_workbook(excel_filepath).get_sheet(sheet_name)
+    sheet_cache[key] = {'sheet': sheet, 'value_index': None, 'cell_value_index': None, 'strings': None, 'size': estimate_sheet_size(sheet)}
+    cached_sheet = sheet_cache[key]
+    evict_cached_sheets()
+    return cached_sheet
+
+
+def evict_cached_sheets() -> None:
+    """
+    This function drops the least recently used sheets until the cached sheets fit in SHEET_CACHE_MEMORY,
+    the most recently used sheet is always kept
+    :return:
+    """
+    used_memory = sum(entry['size'] for entry in sheet_cache.values())
+    while used_memory > SHEET_CACHE_MEMORY and len(sheet_cache) > 1:
+        used_memory -= sheet_cache.popitem(last=False)[1]['size']
+
+
+def add_to_cached_sheet(cached_sheet: dict, name: str, structure: Any, size: int) -> None:
+    """
+    This function stores a structure derived from a sheet in the cache entry of the sheet
+    and counts its size against the memory of the cache
+    :param cached_sheet:
+    :param name: value_index, cell_value_index or strings
+    :param structure:
+    :param size: estimated number of bytes held by the structure
+    :return:
+    """
+    cached_sheet[name] = structure
+    cached_sheet['size'] += size
+    evict_cached_sheets()
+
+
+def get_parsed_sheet(excel_filepath: str, sheet_name: str = None) -> Union[pyexcel.Sheet, SheetSnapshot]:
+    """
+    This function returns the parsed sheet of an excel file, the first sheet is returned if sheet_name is None.
+    The sheet is parsed once for every version of the file and must not be modified by the caller
+    :param excel_filepath:
+    :param sheet_name:
+    :return:
+    """
+    return get_cached_sheet(excel_filepath, sheet_name)['sheet']
+
+
+def get_sheet_names(excel_filepath: str) -> list:
+    """
+    This function returns the names of the sheets of an excel file, they are read from the metadata of the file
+    without parsing any sheet
+    :param excel_filepath:
+    :return:
+    """
+    return list(get_workbook(excel_filepath).get_sheet_names())
+
+
+def get_indexed_sheet(excel_filepath: str, sheet_name: str = None) -> Tuple[pyexcel.Sheet, dict]:
+    """
+    This function returns the sheet along with its value index.
+    Both are cached per sheet until the file is modified so that the sheet is read and scanned only once
+    :param excel_filepath:
+    :param sheet_name:
+    :return: sheet, value index
+    """
+    cached_sheet = get_cached_sheet(excel_filepath, sheet_name)
+    if cached_sheet['value_index'] is None:
+        value_index = build_value_index(cached_sheet['sheet'])
+        add_to_cached_sheet(cached_sheet, 'value_index', value_index, estimate_index_size(value_index))
+    return cached_sheet['sheet'], cached_sheet['value_index']
+
+
+def get_sheet_with_cell_value_index(excel_filepath: str, sheet_name: str = None) -> Tuple[pyexcel.Sheet, dict]:
+    """
+    This function returns the sheet along with the index from raw cell values to cells, see build_cell_value_index
+    :param excel_filepath:
+    :param sheet_name:
+    :return: sheet, cell value index
+    """
+    cached_sheet = get_cached_sheet(excel_filepath, sheet_name)
+    if cached_sheet['cell_value_index'] is None:
+        cell_value_index = build_cell_value_index(cached_sheet['sheet'])
+        add_to_cached_sheet(cached_sheet, 'cell_value_index', cell_value_index, estimate_index_size(cell_value_index))
+    return cached_sheet['sheet'], cached_sheet['cell_value_index']
+
+
+def is_blank_row(row_values: list) -> bool:
+    """
+    This function checks if all the cells of a row are empty once they are stripped
+    :param row_values:
+    :return:
+    """
+    return all(not str(cell_value).strip() for cell_value in row_values)
+
+
+def parse_csv_cell(cell_text: str) -> Any:
+    """
+    This function converts the text of a csv cell to the value which pyexcel reads from it,
+    i.e. an int, a float or a date if the text is one
+    :param cell_text:
+    :return:
+    """
+    if cell_text == "":
+        return cell_text
+    value = pyexcel_io_service.detect_int_value(cell_text)
+    if value is None:
+        value = pyexcel_io_service.detect_float_value(cell_text)
+        if value in (float("inf"), float("-inf")):
+            value = None
+    if value is None:
+        value = pyexcel_io_service.detect_date_value(cell_text)
+    return cell_text if value is None else value
+
+
+def normalize_data_file(file_path: str, book_dict: OrderedDict = None) -> OrderedDict:
+    """
+    This function strips the values of all the sheets of an uploaded data file and adds a blank row at the end of
+    the sheets which do not already end with one. The file is rewritten at most once, when it is uploaded,
+    so that viewing the project never modifies it.
+    The cells of a rewritten sheet are written as their stripped text, the cells of a csv file are then read
+    like pyexcel reads them, so the sheets which are returned are the sheets which parsing the file again would return
+    :param file_path:
+    :param book_dict: sheets of the file if they have already been parsed
+    :return: normalized sheets of the file
+    """
+    if book_dict is None:
+        book_dict = pyexcel.get_book_dict(file_name=file_path)
+    book_dict = OrderedDict(book_dict)
+    is_csv = file_path.lower().endswith(".csv")
+    normalized_book_dict = OrderedDict(book_dict)
+    is_modified = False
+    for sheet_name, rows in book_dict.items():
+        if not rows:
+            continue
+        # pyexcel parses numbers as int and float, they are compared as text so that only values with
+        # surrounding whitespace count as modified
+        text_rows = [[str(cell_value) for cell_value in row_values] for row_values in rows]
+        normalized_rows = [[cell_value.strip() for cell_value in row_values] for row_values in text_rows]
+        if not is_blank_row(normalized_rows[-1]):
+            normalized_rows.append([""] * len(normalized_rows[0]))
+        if normalized_rows != text_rows:
+            book_dict[sheet_name] = normalized_rows
+            if is_csv:
+                normalized_rows = [[parse_csv_cell(cell_value) for cell_value in row_values] for row_values in normalized_rows]
+            normalized_book_dict[sheet_name] = normalized_rows
+            is_modified = True
+    if is_modified:
+        pyexcel.save_book_as(bookdict=book_dict, dest_file_name=file_path)
+    return normalized_book_dict
+
+
+def get_sheet_row_count(sheet: pyexcel.Sheet) -> int:
+    """
+    This function returns the number of rows of the sheet as it is shown in the GUI,
+    i.e. including the blank row which is added at the end if the sheet does not end with one
+    :param sheet:
+    :return:
+    """
+    if len(sheet) and is_blank_row(sheet.row[-1]):
+        return len(sheet)
+    return len(sheet) + 1
+
+
+def get_sheet_window(file_path: str, sheet_name: str = None, row_offset: int = 0, row_limit: int = SHEET_WINDOW_SIZE,
+                     column_offset: int = 0, column_limit: int = None) -> dict:
+    """
+    This function returns the stripped values of a window of rows and columns of a sheet as an array of rows
+    along with the size of the whole sheet
     :param file_path:
     :param sheet_name:
+    :param row_offset:
+    :param row_limit:
+    :param column_offset:
+    :param column_limit: all the columns after the column offset if None
     :return:
     """
-    book = pyexcel.get_book(file_name=file_path)
-    num_of_cols = len(book[sheet_name][0])
-    blank_row = [" "] * num_of_cols
-    if book[sheet_name].row[-1] != blank_row:
-        book[sheet_name].row += blank_row
-    book.save_as(file_path)
+    sheet = get_parsed_sheet(file_path, sheet_name)
+    row_count = get_sheet_row_count(sheet)
+    column_count = len(sheet[0]) if len(sheet) else 0
+    row_offset, column_offset = max(row_offset, 0), max(column_offset, 0)
+    row_end = min(row_offset + max(row_limit, 0), row_count)
+    column_end = column_count if column_limit is None else min(column_offset + max(column_limit, 0), column_count)
+    rows = list()
+    for row in range(row_offset, row_end):
+        if row < len(sheet):
+            rows.append([str(cell_value).strip() for cell_value in sheet.row[row][column_offset:column_end]])
+        else:
+            rows.append([""] * max(column_end - column_offset, 0))
+    return {
+        'rowCount': row_count,
+        'columnCount': column_count,
+        'rowOffset': row_offset,
+        'columnOffset': column_offset,
+        'rows': rows
+    }
 
 
-def excel_to_json(file_path: str, sheet_name: str = None, want_sheet_names: bool = False) -> dict:
+def excel_to_json(file_path: str, sheet_name: str = None, want_sheet_names: bool = False, row_limit: int = None) -> dict:
     """
-    This function reads the excel file and converts it to JSON
+    This function reads the excel file and converts it to JSON.
+    The file is only read, values are stripped and a blank row is added at the end in the JSON itself.
+    Only the first row_limit rows are converted if row_limit is given, the rest are fetched with get_sheet_window
     :param file_path:
     :param sheet_name:
     :param want_sheet_names:
+    :param row_limit:
     :return:
     """
     sheet_data = {'columnDefs': [{'headerName': "", 'field': "^", 'pinned': "left"}], 'rowData': []}
     column_index_map = {}
     result = dict()
     if not sheet_name or want_sheet_names:
-        result['sheetNames'] = list()
-        book_dict = pyexcel.get_book_dict(file_name=file_path)
-        for sheet in book_dict.keys():
-            result['sheetNames'].append(sheet)
+        result['sheetNames'] = get_sheet_names(file_path)
         if not sheet_name:
             sheet_name = result['sheetNames'][0]
     else:
         result["sheetNames"] = None
     result["currSheetName"] = sheet_name
-    add_row_in_data_file(file_path, sheet_name)
-    book = pyexcel.get_book(file_name=file_path)
-    sheet = book[sheet_name]
-    for i in range(len(sheet[0])):
+    window = get_sheet_window(file_path, sheet_name, 0, row_limit if row_limit is not None else sys.maxsize)
+    for i in range(window['columnCount']):
         column = get_column_letter(i + 1)
         column_index_map[i + 1] = column
         sheet_data['columnDefs'].append({'headerName': column_index_map[i + 1], 'field': column_index_map[i + 1]})
-    for row in range(len(sheet)):
+    for row, row_values in enumerate(window['rows']):
         r = {'^': str(row + 1)}
-        for col in range(len(sheet[row])):
-            sheet[row, col] = str(sheet[row, col]).strip()
-            r[column_index_map[col + 1]] = sheet[row, col]
+        for col, value in enumerate(row_values):
+            r[column_index_map[col + 1]] = value
         sheet_data['rowData'].append(r)
+    sheet_data['rowCount'] = window['rowCount']
+    sheet_data['columnCount'] = window['columnCount']
 
     result['sheetData'] = sheet_data
-    book.save_as(file_path)
     return result
 
 
@@ -279,8 +630,35 @@ def natural_sort_key(s: str) -> list:
     :param s:
     :return:
     """
-    _nsre = re.compile('([0-9]+)')
-    return [int(text) if text.isdigit() else text.lower() for text in re.split(_nsre, s)]
+    return [int(text) if text.isdigit() else text.lower() for text in NATURAL_SORT_REGEX.split(s)]
+
+
+def cell_sort_key(cell: tuple) -> Tuple[str, int]:
+    """
+    This function generates the key which sorts (column, row) indices
+    in the same order as natural_sort_key sorts their excel cell notation, viz. A2, A10, AA1, B1
+    :param cell: (col, row)
+    :return:
+    """
+    return get_column_letter(int(cell[0]) + 1), int(cell[1])
+
+
+def insert_sorted_cell(cells: list, cell: tuple) -> None:
+    """
+    This function inserts a cell in a list of cells sorted by cell_sort_key using binary search
+    :param cells:
+    :param cell:
+    :return:
+    """
+    key = cell_sort_key(cell)
+    low, high = 0, len(cells)
+    while low < high:
+        middle = (low + high) // 2
+        if cell_sort_key(cells[middle]) < key:
+            low = middle + 1
+        else:
+            high = middle
+    cells.insert(low, cell)
 
 
 def generate_id() -> str:
@@ -398,17 +776,145 @@ def get_region_mapping(uid: str, pid: str, project, data_file_name=None, sheet_n
     file_name = project.get_or_create_wikifier_region_filename(data_file_name, sheet_name)
     region_file_path = Path.cwd() / "config" / "uploads" / uid / pid / "wf" / file_name
     region_file_path.touch(exist_ok=True)
-    with open(region_file_path) as json_data:
-        try:
-            region_map = json.load(json_data)
-        except json.decoder.JSONDecodeError:
-            region_map = None
+    region_map = read_wikifier_region_file(uid, pid, file_name)
     return region_map, file_name
 
 
+def get_wikifier_journal_path(file_path: Union[str, Path]) -> Path:
+    """
+    This function returns the path of the journal of a wikifier region file
+    :param file_path:
+    :return:
+    """
+    return Path(file_path).with_suffix(".journal")
+
+
+def apply_wikifier_region_changes(region_qnodes: dict, changes: dict) -> None:
+    """
+    This function applies the changes recorded by ItemTable.get_changes to the region_qnodes
+    :param region_qnodes:
+    :param changes:
+    :return:
+    """
+    region_qnodes['qnodes'].update(changes.get('qnodes', dict()))
+    for cell in changes.get('deleted_cells', list()):
+        region_qnodes['qnodes'].pop(cell, None)
+    for region, region_changes in changes.get('regions', dict()).items():
+        removed_cells = set(region_changes['removed'])
+        # a set so that applying the same changes twice leaves the region as it is
+        cells = {cell for cell in region_qnodes['regions'].get(region, list()) if cell not in removed_cells}
+        cells.update(region_changes['added'])
+        region_qnodes['regions'][region] = sorted(cells, key=natural_sort_key)
+    for region in changes.get('deleted_regions', list()):
+        region_qnodes['regions'].pop(region, None)
+
+
+def read_wikifier_journal(journal_path: Path) -> List[dict]:
+    """
+    This function reads the changes recorded in a wikifier journal
+    :param journal_path:
+    :return:
+    """
+    journal_changes = list()
+    if journal_path.exists():
+        with open(journal_path) as journal:
+            for line in journal:
+                try:
+                    journal_changes.append(json.loads(line))
+                except json.decoder.JSONDecodeError:
+                    # a change which is still being written
+                    break
+    return journal_changes
+
+
+def read_wikifier_region_file(uid: str, pid: str, region_filename: str) -> Union[dict, None]:
+    """
+    This function reads the wikifier region file and replays the changes recorded in its journal on its contents.
+    Both are read while holding the lock of the writers so that a journal which is being merged into the file
+    is seen either before or after the merge, never in between
+    :param uid:
+    :param pid:
+    :param region_filename:
+    :return: None if the file is empty and has no journal
+    """
+    file_path = Path.cwd() / "config" / "uploads" / uid / pid / "wf" / region_filename
+
+    @lockutils.synchronized('update_wikifier_region_config', fair=True, external=True,
+                            lock_path=str(Path.cwd() / "config" / "uploads" / uid / pid / "wf"))
+    def read_wikifier_region_config() -> Union[dict, None]:
+        """
+        This function reads the file and its journal
+        :return:
+        """
+        return load_wikifier_region_config(file_path)
+
+    return read_wikifier_region_config()
+
+
+def load_wikifier_region_config(file_path: Path) -> Union[dict, None]:
+    """
+    This function reads the wikifier region file and replays its journal,
+    the lock of the file must be held by the caller
+    :param file_path:
+    :return: None if the file is empty and has no journal
+    """
+    try:
+        with open(file_path) as wikifier_region_config:
+            region_qnodes = json.load(wikifier_region_config)
+    except (OSError, json.decoder.JSONDecodeError):
+        region_qnodes = None
+    journal_changes = read_wikifier_journal(get_wikifier_journal_path(file_path))
+    if journal_changes and region_qnodes is None:
+        region_qnodes = {'regions': dict(), 'qnodes': dict()}
+    for changes in journal_changes:
+        apply_wikifier_region_changes(region_qnodes, changes)
+    return region_qnodes
+
+
+def merge_wikifier_journal(file_path: Path) -> None:
+    """
+    This function merges the journal into the wikifier region file and clears the journal,
+    the lock of the file must be held by the caller
+    :param file_path:
+    :return:
+    """
+    region_qnodes = load_wikifier_region_config(file_path)
+    if region_qnodes is None:
+        region_qnodes = {'regions': dict(), 'qnodes': dict()}
+    with open(file_path, 'w') as wikifier_region_config:
+        json.dump(region_qnodes, wikifier_region_config, indent=3)
+    journal_path = get_wikifier_journal_path(file_path)
+    if journal_path.exists():
+        journal_path.unlink()
+
+
+def compact_wikifier_journal(uid: str, pid: str, region_filename: str) -> None:
+    """
+    This function merges the journal into the wikifier config file and clears the journal.
+    It locks the file while updating to maintain concurrency.
+    :param uid:
+    :param pid:
+    :param region_filename:
+    :return:
+    """
+    file_path = Path.cwd() / "config" / "uploads" / uid / pid / "wf" / region_filename
+
+    @lockutils.synchronized('update_wikifier_region_config', fair=True, external=True,
+                            lock_path=str(Path.cwd() / "config" / "uploads" / uid / pid / "wf"))
+    def merge_wikifier_region_config_changes() -> None:
+        """
+        This function replays the journal on the file and rewrites it
+        :return:
+        """
+        merge_wikifier_journal(file_path)
+
+    merge_wikifier_region_config_changes()
+
+
 def update_wikifier_region_file(uid: str, pid: str, region_filename: str, region_qnodes: dict) -> None:
     """
-    This function updates the wikifier config file. It locks the file while updating to maintain concurrency.
+    This function updates the wikifier config file and clears its journal.
+    It locks the file while updating to maintain concurrency.
     :param uid:
     :param pid:
     :param region_filename:
@@ -426,10 +932,46 @@ def update_wikifier_region_file(uid: str, pid: str, region_filename: str, region
         """
         with open(file_path, 'w') as wikifier_region_config:
             json.dump(region_qnodes, wikifier_region_config, indent=3)
+        journal_path = get_wikifier_journal_path(file_path)
+        if journal_path.exists():
+            journal_path.unlink()
 
     update_wikifier_region_config()
 
 
+def append_wikifier_region_changes(uid: str, pid: str, region_filename: str, changes: Union[dict, None]) -> None:
+    """
+    This function appends the changes of the ItemTable to the journal of the wikifier config file
+    instead of rewriting the whole file. The journal is merged into the file once it grows beyond
+    WIKIFIER_JOURNAL_SIZE changes. It locks the file while updating to maintain concurrency.
+    :param uid:
+    :param pid:
+    :param region_filename:
+    :param changes: see ItemTable.get_changes
+    :return:
+    """
+    if not changes:
+        return
+    file_path = Path.cwd() / "config" / "uploads" / uid / pid / "wf" / region_filename
+
+    @lockutils.synchronized('update_wikifier_region_config', fair=True, external=True,
+                            lock_path=str(Path.cwd() / "config" / "uploads" / uid / pid / "wf"))
+    def append_wikifier_region_config_changes() -> None:
+        """
+        This function appends the changes as a line of the journal
+        :return:
+        """
+        journal_path = get_wikifier_journal_path(file_path)
+        with open(journal_path, 'a') as journal:
+            journal.write(json.dumps(changes) + "\n")
+        with open(journal_path) as journal:
+            journal_size = sum(1 for _ in journal)
+        if journal_size > WIKIFIER_JOURNAL_SIZE:
+            merge_wikifier_journal(file_path)
+
+    append_wikifier_region_config_changes()
+
+
 def deserialize_wikifier_config(uid: str, pid: str, region_filename: str) -> dict:
     """
     This function reads and deserialize the wikifier config file
@@ -438,10 +980,7 @@ def deserialize_wikifier_config(uid: str, pid: str, region_filename: str) -> dic
     :param region_filename:
     :return:
     """
-    file_path = str(Path.cwd() / "config" / "uploads" / uid / pid / "wf" / region_filename)
-    with open(file_path, 'r') as wikifier_region_config:
-        wikifier_config = json.load(wikifier_region_config)
-    return wikifier_config
+    return read_wikifier_region_file(uid, pid, region_filename)
 
 
 def get_project_config_path(uid: str, pid: str) -> str:
@@ -482,6 +1021,5 @@ def get_first_sheet_name(file_path: str):
     :param file_path:
     :return:
     """
-    book_dict = pyexcel.get_book_dict(file_name=file_path)
-    for sheet in book_dict.keys():
+    for sheet in get_sheet_names(file_path):
         return sheet
@@ -16,7 +16,7 @@ app = Flask(__name__, template_folder="templates", static_folder="t2wml-gui")
 CORS(app)
 app.secret_key = "secret key"
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
-# 16 MB max file size
+# 16 MB max request size, larger data files are uploaded in chunks
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024
 app.config['CODE_FOLDER'] = CODE_FOLDER
 app.config['ETK_PATH'] = ETK_PATH
@@ -6,6 +6,8 @@ from Code.handler import highlight_region, resolve_cell, generate_download_file,
 from Code.ItemTable import ItemTable
 from Code.Project import Project
 from Code.YAMLFile import YAMLFile
+from Code.SheetSnapshot import build_workbook_snapshot
+from Code.ChunkedUpload import ChunkedUpload, UPLOAD_CHUNK_SIZE, get_upload_parser
 import shutil
 import sys
 
@@ -60,13 +62,121 @@ def data_file_uploader(uid: str, pid: str, sheet_name: str = None) -> dict:
             response["currentDataFile"] = new_filename
             file_path = str(Path(app.config['UPLOAD_FOLDER']) / uid / pid / "df" / new_filename)
             file.save(file_path)
-            data = excel_to_json(file_path, sheet_name)
+            data = process_data_file(file_path, sheet_name)
             response.update(data)
         else:
             response["error"] = 'This file type is currently not supported'
     return response
 
 
+def process_data_file(file_path: str, sheet_name: str = None, book_dict: OrderedDict = None) -> dict:
+    """
+    This function normalizes an uploaded data file, builds its snapshot and converts it to JSON
+    :param file_path:
+    :param sheet_name:
+    :param book_dict: sheets of the file if they have already been parsed while it was uploaded
+    :return:
+    """
+    # the file is parsed once, its snapshot is built from the sheets which were normalized
+    build_workbook_snapshot(file_path, normalize_data_file(file_path, book_dict))
+    return excel_to_json(file_path, sheet_name)
+
+
+def get_upload_folder(uid: str, pid: str) -> str:
+    """
+    This function returns the folder which holds the chunked uploads in progress of a project
+    :param uid:
+    :param pid:
+    :return:
+    """
+    return str(Path(app.config['UPLOAD_FOLDER']) / uid / pid / "parts")
+
+
+def add_data_file_to_project(user_id: str, project_id: str, data: dict) -> str:
+    """
+    This function makes an uploaded data file the current data file of the project
+    and returns its table, wikifier and yaml data
+    :param user_id:
+    :param project_id:
+    :param data: response of data_file_uploader
+    :return:
+    """
+    response = {
+        "tableData": dict(),
+        "wikifierData": dict(),
+        "yamlData": dict(),
+        "error": None
+    }
+    project_meta = dict()
+    if data["error"]:
+        response["error"] = data["error"]
+    else:
+        table_data = response["tableData"]
+        curr_data_file_id = data["currentDataFile"]
+        project_meta["currentDataFile"] = curr_data_file_id
+        curr_data_file_name = data["dataFileMapping"][curr_data_file_id]
+        project_meta["dataFileMapping"] = data["dataFileMapping"]
+        project_meta["mdate"] = int(time() * 1000)
+        table_data["filename"] = curr_data_file_name
+        table_data["isCSV"] = data["isCSV"]
+        if not table_data["isCSV"]:
+            table_data["sheetNames"] = data["sheetNames"]
+            table_data["currSheetName"] = data["currSheetName"]
+            project_meta["currentSheetName"] = data["currSheetName"]
+        else:
+            table_data["sheetNames"] = None
+            table_data["currSheetName"] = None
+            project_meta["currentSheetName"] = curr_data_file_id
+        table_data["sheetData"] = data["sheetData"]
+
+    project_config_path = get_project_config_path(user_id, project_id)
+    project = Project(project_config_path)
+
+    data_file_name = curr_data_file_id
+    sheet_name = project_meta["currentSheetName"]
+    region_map, region_file_name = get_region_mapping(user_id, project_id, project, data_file_name, sheet_name)
+    item_table = ItemTable(region_map)
+    wikifier_output_filepath = str(Path.cwd() / "config" / "uploads" / user_id / project_id / "wf" / "other.csv")
+    data_file_path = str(Path.cwd() / "config" / "uploads" / user_id / project_id / "df" / data_file_name)
+
+    add_excel_file_to_bindings(data_file_path, sheet_name)
+
+    if Path(wikifier_output_filepath).exists():
+        build_item_table(item_table, wikifier_output_filepath, data_file_path, sheet_name)
+    region_qnodes = item_table.get_region_qnodes()
+    response["wikifierData"] = region_qnodes
+    project_meta["wikifierRegionMapping"] = dict()
+    project_meta["wikifierRegionMapping"][data_file_name] = dict()
+    project_meta["wikifierRegionMapping"][data_file_name][sheet_name] = region_file_name
+    update_wikifier_region_file(user_id, project_id, region_file_name, region_qnodes)
+
+    yaml_file_id = project.get_yaml_file_id(data_file_name, sheet_name)
+    if yaml_file_id:
+        response["yamlData"] = dict()
+        yaml_file_name = yaml_file_id + ".yaml"
+        yaml_file_path = str(Path.cwd() / "config" / "uploads" / user_id / project_id / "yf" / yaml_file_name)
+        response["yamlData"]["yamlFileContent"] = read_file(yaml_file_path)
+        if data_file_name:
+            yaml_config_file_name = yaml_file_id + ".pickle"
+            yaml_config_file_path = str(
+                Path.cwd() / "config" / "uploads" / user_id / project_id / "yf" / yaml_config_file_name)
+            data_file_path = str(Path(app.config['UPLOAD_FOLDER']) / user_id / project_id / "df" / data_file_name)
+
+            yaml_config = load_yaml_config(yaml_config_file_path)
+            template = yaml_config.get_template()
+            region = yaml_config.get_region()
+            response["yamlData"]['yamlRegions'] = highlight_region(item_table, data_file_path, sheet_name, region,
+                                                                   template)
+            project_meta["yamlMapping"] = dict()
+            project_meta["yamlMapping"][data_file_name] = dict()
+            project_meta["yamlMapping"][data_file_name][data["currSheetName"]] = yaml_file_id
+    else:
+        response["yamlData"] = None
+
+    project.update_project_config(project_meta)
+    return json.dumps(response)
+
+
 def wikified_output_uploader(uid: str, pid: str) -> str:
     """
     This function helps in processing the wikifier output file upload request
@@ -201,83 +311,99 @@ def upload_data_file():
     :return:
     """
     if 'uid' in session:
-        response = {
-            "tableData": dict(),
-            "wikifierData": dict(),
-            "yamlData": dict(),
-            "error": None
-        }
-        project_meta = dict()
         user_id = session['uid']
         project_id = request.form['pid']
         data = data_file_uploader(user_id, project_id)
-        if data["error"]:
-            response["error"] = data["error"]
-        else:
-            table_data = response["tableData"]
-            curr_data_file_id = data["currentDataFile"]
-            project_meta["currentDataFile"] = curr_data_file_id
-            curr_data_file_name = data["dataFileMapping"][curr_data_file_id]
-            project_meta["dataFileMapping"] = data["dataFileMapping"]
-            project_meta["mdate"] = int(time() * 1000)
-            table_data["filename"] = curr_data_file_name
-            table_data["isCSV"] = data["isCSV"]
-            if not table_data["isCSV"]:
-                table_data["sheetNames"] = data["sheetNames"]
-                table_data["currSheetName"] = data["currSheetName"]
-                project_meta["currentSheetName"] = data["currSheetName"]
-            else:
-                table_data["sheetNames"] = None
-                table_data["currSheetName"] = None
-                project_meta["currentSheetName"] = curr_data_file_id
-            table_data["sheetData"] = data["sheetData"]
+        return add_data_file_to_project(user_id, project_id, data)
+    else:
+        return redirect(url_for('index'))
 
-        project_config_path = get_project_config_path(user_id, project_id)
-        project = Project(project_config_path)
 
-        data_file_name = curr_data_file_id
-        sheet_name = project_meta["currentSheetName"]
-        region_map, region_file_name = get_region_mapping(user_id, project_id, project, data_file_name, sheet_name)
-        item_table = ItemTable(region_map)
-        wikifier_output_filepath = str(Path.cwd() / "config" / "uploads" / user_id / project_id / "wf" / "other.csv")
-        data_file_path = str(Path.cwd() / "config" / "uploads" / user_id / project_id / "df" / data_file_name)
+@app.route('/upload_data_file/init', methods=['POST'])
+def init_data_file_upload():
+    """
+    This route starts a chunked upload of a data file, or resumes it if the id of an upload in progress is given.
+    The response tells the client from which byte to send the chunks of the file
+    :return:
+    """
+    if 'uid' in session:
+        response = {"error": None}
+        user_id = session['uid']
+        project_id = request.form['pid']
+        upload_folder = get_upload_folder(user_id, project_id)
+        try:
+            if request.form.get('upload_id'):
+                upload = ChunkedUpload(upload_folder, request.form['upload_id'])
+            elif allowed_file(request.form.get('filename', '')):
+                upload = ChunkedUpload.create(upload_folder, generate_id(), request.form['filename'],
+                                              int(request.form['size']))
+            else:
+                response["error"] = 'This file type is currently not supported'
+                return json.dumps(response)
+        except (ValueError, KeyError):
+            response["error"] = 'Invalid upload'
+            return json.dumps(response)
+        get_upload_parser(upload)
+        response["uploadId"] = upload.upload_id
+        response["receivedBytes"] = upload.get_received_bytes()
+        response["chunkSize"] = UPLOAD_CHUNK_SIZE
+        return json.dumps(response)
+    else:
+        return redirect(url_for('index'))
 
-        add_excel_file_to_bindings(data_file_path, sheet_name)
 
-        if Path(wikifier_output_filepath).exists():
-            build_item_table(item_table, wikifier_output_filepath, data_file_path, sheet_name)
-        region_qnodes = item_table.get_region_qnodes()
-        response["wikifierData"] = region_qnodes
-        project_meta["wikifierRegionMapping"] = dict()
-        project_meta["wikifierRegionMapping"][data_file_name] = dict()
-        project_meta["wikifierRegionMapping"][data_file_name][sheet_name] = region_file_name
-        update_wikifier_region_file(user_id, project_id, region_file_name, region_qnodes)
+@app.route('/upload_data_file/chunk', methods=['POST'])
+def upload_data_file_chunk():
+    """
+    This route writes a chunk of a data file at its offset, csv files are parsed in the background as chunks arrive
+    :return:
+    """
+    if 'uid' in session:
+        response = {"error": None}
+        user_id = session['uid']
+        project_id = request.form['pid']
+        try:
+            upload = ChunkedUpload(get_upload_folder(user_id, project_id), request.form['upload_id'])
+            if 'chunk' not in request.files:
+                raise ValueError('No chunk part')
+            response["receivedBytes"] = upload.write_chunk(int(request.form['offset']), request.files['chunk'].read())
+        except (ValueError, KeyError) as e:
+            response["error"] = str(e)
+        return json.dumps(response)
+    else:
+        return redirect(url_for('index'))
 
-        yaml_file_id = project.get_yaml_file_id(data_file_name, sheet_name)
-        if yaml_file_id:
-            response["yamlData"] = dict()
-            yaml_file_name = yaml_file_id + ".yaml"
-            yaml_file_path = str(Path.cwd() / "config" / "uploads" / user_id / project_id / "yf" / yaml_file_name)
-            response["yamlData"]["yamlFileContent"] = read_file(yaml_file_path)
-            if data_file_name:
-                yaml_config_file_name = yaml_file_id + ".pickle"
-                yaml_config_file_path = str(
-                    Path.cwd() / "config" / "uploads" / user_id / project_id / "yf" / yaml_config_file_name)
-                data_file_path = str(Path(app.config['UPLOAD_FOLDER']) / user_id / project_id / "df" / data_file_name)
 
-                yaml_config = load_yaml_config(yaml_config_file_path)
-                template = yaml_config.get_template()
-                region = yaml_config.get_region()
-                response["yamlData"]['yamlRegions'] = highlight_region(item_table, data_file_path, sheet_name, region,
-                                                                       template)
-                project_meta["yamlMapping"] = dict()
-                project_meta["yamlMapping"][data_file_name] = dict()
-                project_meta["yamlMapping"][data_file_name][data["currSheetName"]] = yaml_file_id
-        else:
-            response["yamlData"] = None
-
-        project.update_project_config(project_meta)
-        return json.dumps(response, indent=3)
+@app.route('/upload_data_file/complete', methods=['POST'])
+def complete_data_file_upload():
+    """
+    This route adds a data file whose chunks have all been received to the project,
+    the response is the same as the one of /upload_data_file
+    :return:
+    """
+    if 'uid' in session:
+        user_id = session['uid']
+        project_id = request.form['pid']
+        try:
+            upload = ChunkedUpload(get_upload_folder(user_id, project_id), request.form['upload_id'])
+        except (ValueError, KeyError):
+            return json.dumps({"error": 'Upload not found'})
+        if not upload.is_complete():
+            return json.dumps({"error": 'Upload is not complete', "receivedBytes": upload.get_received_bytes()})
+        file_extension = get_file_extension(upload.filename)
+        file_id = generate_id()
+        new_filename = file_id + "." + file_extension
+        file_path = str(Path(app.config['UPLOAD_FOLDER']) / user_id / project_id / "df" / new_filename)
+        rows = upload.finish(file_path)
+        book_dict = OrderedDict([(new_filename, rows)]) if rows is not None else None
+        data = {
+            "error": "",
+            "dataFileMapping": {new_filename: upload.filename},
+            "isCSV": file_extension.lower() == "csv",
+            "currentDataFile": new_filename
+        }
+        data.update(process_data_file(file_path, book_dict=book_dict))
+        return add_data_file_to_project(user_id, project_id, data)
     else:
         return redirect(url_for('index'))
 
@@ -350,7 +476,39 @@ def change_sheet():
             response["yamlData"] = None
 
         project.update_project_config(project_meta)
-        return json.dumps(response, indent=3)
+        return json.dumps(response)
+
+
+@app.route('/get_sheet_window', methods=['POST'])
+def get_sheet_window_data():
+    """
+    This route returns a window of the rows and columns of the current sheet so that the GUI can fetch large sheets
+    a page at a time. The values are sent as an array of rows
+    :return:
+    """
+    if 'uid' in session:
+        response = {"error": None}
+        user_id = session['uid']
+        project_id = request.form['pid']
+        project_config_path = get_project_config_path(user_id, project_id)
+        project = Project(project_config_path)
+        data_file_id, sheet_name = project.get_current_file_and_sheet()
+        if not data_file_id:
+            response["error"] = "Data file not found"
+            return json.dumps(response)
+        try:
+            row_offset = int(request.form.get('offset', 0))
+            row_limit = min(int(request.form.get('limit', SHEET_WINDOW_SIZE)), SHEET_WINDOW_SIZE)
+            column_offset = int(request.form.get('column_offset', 0))
+            column_limit = int(request.form['column_limit']) if 'column_limit' in request.form else None
+        except ValueError:
+            response["error"] = "Invalid window"
+            return json.dumps(response)
+        data_file_path = str(Path(app.config['UPLOAD_FOLDER']) / user_id / project_id / "df" / data_file_id)
+        response.update(get_sheet_window(data_file_path, sheet_name, row_offset, row_limit, column_offset, column_limit))
+        return json.dumps(response)
+    else:
+        return redirect(url_for('index'))
 
 
 @app.route('/upload_wikifier_output', methods=['POST'])
@@ -538,12 +696,12 @@ def wikify_region():
         else:
             data = wikifier(item_table, region, data_file_path, sheet_name)
             wikifier_region_file_name = project.get_or_create_wikifier_region_filename()
-            update_wikifier_region_file(user_id, project_id, wikifier_region_file_name, data)
+            append_wikifier_region_changes(user_id, project_id, wikifier_region_file_name, item_table.get_changes())
     elif action == "delete_region":
         item_table.delete_region(region)
         data = item_table.get_region_qnodes()
         wikifier_region_file_name = project.get_or_create_wikifier_region_filename()
-        update_wikifier_region_file(user_id, project_id, wikifier_region_file_name, data)
+        append_wikifier_region_changes(user_id, project_id, wikifier_region_file_name, item_table.get_changes())
     elif action == "update_qnode":
         cell = request.form["cell"]
         qnode = request.form["qnode"]
@@ -556,7 +714,7 @@ def wikify_region():
             item_table.update_all_cells_in_all_region(cell, qnode, data_file_path, sheet_name)
         data = item_table.get_region_qnodes()
         wikifier_region_file_name = project.get_or_create_wikifier_region_filename()
-        update_wikifier_region_file(user_id, project_id, wikifier_region_file_name, data)
+        append_wikifier_region_changes(user_id, project_id, wikifier_region_file_name, item_table.get_changes())
     if 'error' not in data:
         data['error'] = None
     project_meta = dict()
@@ -1,5 +1,5 @@
 from Code.ItemTable import ItemTable
-from Code.handler import build_item_table, generate_download_file, load_yaml_data
+from Code.handler import build_item_table, generate_download_file, load_yaml_data, generate_streaming_download_file
 from Code.YAMLFile import YAMLFile
 from pathlib import Path
 from etk.wikidata import serialize_change_record
@@ -58,3 +58,31 @@ def run_t2wml(data_file_path: str, wikified_output_path: str, t2wml_spec: str, o
 
     with open(str(output_path / "changes.tsv"), "w") as fp:
         serialize_change_record(fp)
+
+
+def run_streaming_t2wml(data_file_path: str, wikified_output_path: str, t2wml_spec: str, output_directory: str,
+                        sparql_endpoint: str = "http://dsbox02.isi.edu:8888/bigdata/namespace/wdq/sparql"):
+    """
+    This function runs T2WML on a csv data file which is too large to be loaded in memory,
+    the data file is streamed and the triples are written to the output file as they are generated
+    """
+    file_name = Path(data_file_path).name
+    if file_name.split(".")[-1] != "csv":
+        logging.error("Only csv data files can be streamed")
+        return
+    output_path = Path(output_directory) / '.'.join(file_name.split(".")[:-1])
+    Path.mkdir(output_path, parents=True, exist_ok=True)
+
+    try:
+        with open(str(output_path / "results.ttl"), "w") as fp:
+            errors = generate_streaming_download_file(None, None, data_file_path, wikified_output_path, t2wml_spec, fp,
+                                                      "ttl", sparql_endpoint)
+    except Exception as e:
+        traceback.print_exc()
+        logging.error("Data file cannot be streamed")
+        return
+    for error in errors:
+        logging.warning("{}: {}".format(error["cell"], error["error"]))
+
+    with open(str(output_path / "changes.tsv"), "w") as fp:
+        serialize_change_record(fp)
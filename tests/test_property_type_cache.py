@@ -0,0 +1,107 @@
+import socket
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+from Code import PropertyTypeCache as property_type_cache
+from Code.PropertyTypeCache import PropertyTypeCache, PROPERTY_NOT_FOUND, PROPERTY_QUERY_BATCH_SIZE
+from Code.LocalSparqlEndpoint import LocalSparqlEndpoint
+
+PROPERTY_TYPES = {'P{}'.format(number): 'Quantity' for number in range(1, 451)}
+PROPERTY_TYPES['P585'] = 'Time'
+
+
+def queried_properties(query: str) -> list:
+	"""
+	This function returns the properties in the VALUES clause of a query
+	:param query:
+	:return:
+	"""
+	return [wikidata_property[3:] for wikidata_property in query.split() if wikidata_property.startswith('wd:')]
+
+
+class TestPropertyTypeCache(unittest.TestCase):
+	def setUp(self):
+		self.cache_folder = Path(tempfile.mkdtemp())
+		patcher = mock.patch.object(property_type_cache, 'PROPERTY_TYPE_CACHE_FOLDER', self.cache_folder)
+		patcher.start()
+		self.addCleanup(patcher.stop)
+		self.addCleanup(shutil.rmtree, str(self.cache_folder), True)
+		self.endpoint = LocalSparqlEndpoint(PROPERTY_TYPES).start()
+		self.addCleanup(self.endpoint.stop)
+
+	def test_batches(self):
+		wikidata_properties = ['P{}'.format(number) for number in range(1, 451)]
+		property_types = PropertyTypeCache(self.endpoint.url).resolve(wikidata_properties)
+		self.assertEqual(property_types, {wikidata_property: PROPERTY_TYPES[wikidata_property] for wikidata_property in wikidata_properties})
+		self.assertEqual(len(self.endpoint.queries), 3)
+		self.assertEqual([len(queried_properties(query)) for query in self.endpoint.queries], [PROPERTY_QUERY_BATCH_SIZE, PROPERTY_QUERY_BATCH_SIZE, 50])
+
+	def test_cache_hits(self):
+		cache = PropertyTypeCache(self.endpoint.url)
+		self.assertEqual(cache.resolve(['P585', 'P1']), {'P585': 'Time', 'P1': 'Quantity'})
+		self.assertEqual(cache.resolve(['P585', 'P1', 'P585']), {'P585': 'Time', 'P1': 'Quantity'})
+		# the cache file is read by another cache of the same endpoint
+		self.assertEqual(PropertyTypeCache(self.endpoint.url).resolve(['P1', 'P585']), {'P585': 'Time', 'P1': 'Quantity'})
+		self.assertEqual(len(self.endpoint.queries), 1)
+		# only the property which is not cached is queried
+		self.assertEqual(cache.resolve(['P585', 'P2']), {'P585': 'Time', 'P2': 'Quantity'})
+		self.assertEqual([queried_properties(query) for query in self.endpoint.queries[1:]], [['P2']])
+
+	def test_ttl_expiry(self):
+		cache = PropertyTypeCache(self.endpoint.url, ttl=100)
+		resolved_time = time.time()
+		with mock.patch.object(property_type_cache.time, 'time', return_value=resolved_time):
+			cache.resolve(['P585'])
+		with mock.patch.object(property_type_cache.time, 'time', return_value=resolved_time + 99):
+			cache.resolve(['P585'])
+		self.assertEqual(len(self.endpoint.queries), 1)
+		with mock.patch.object(property_type_cache.time, 'time', return_value=resolved_time + 101):
+			self.assertEqual(cache.resolve(['P585']), {'P585': 'Time'})
+		self.assertEqual(len(self.endpoint.queries), 2)
+
+	def test_property_not_found(self):
+		cache = PropertyTypeCache(self.endpoint.url, ttl=100, not_found_ttl=10)
+		resolved_time = time.time()
+		with mock.patch.object(property_type_cache.time, 'time', return_value=resolved_time):
+			self.assertEqual(cache.resolve(['P99999', 'P585']), {'P99999': PROPERTY_NOT_FOUND, 'P585': 'Time'})
+		with mock.patch.object(property_type_cache.time, 'time', return_value=resolved_time + 9):
+			self.assertEqual(cache.resolve(['P99999']), {'P99999': PROPERTY_NOT_FOUND})
+		self.assertEqual(len(self.endpoint.queries), 1)
+		# a property which was not found expires sooner than a property type
+		with mock.patch.object(property_type_cache.time, 'time', return_value=resolved_time + 11):
+			self.assertEqual(cache.resolve(['P99999', 'P585']), {'P99999': PROPERTY_NOT_FOUND, 'P585': 'Time'})
+		self.assertEqual([queried_properties(query) for query in self.endpoint.queries[1:]], [['P99999']])
+
+	def test_unreachable_endpoint(self):
+		unused_socket = socket.socket()
+		unused_socket.bind(('127.0.0.1', 0))
+		url = 'http://127.0.0.1:{}/sparql'.format(unused_socket.getsockname()[1])
+		unused_socket.close()
+		cache = PropertyTypeCache(url)
+		with mock.patch.object(property_type_cache, 'query_property_types', wraps=property_type_cache.query_property_types) as query:
+			with self.assertRaises(Exception):
+				cache.resolve(['P585'])
+			# the endpoint is not queried again until the retry delay has passed
+			for _ in range(100):
+				with self.assertRaises(ConnectionError):
+					cache.resolve(['P585'])
+			self.assertEqual(query.call_count, 1)
+
+	def test_endpoint_which_does_not_answer(self):
+		listening_socket = socket.socket()
+		listening_socket.bind(('127.0.0.1', 0))
+		listening_socket.listen(1)
+		self.addCleanup(listening_socket.close)
+		url = 'http://127.0.0.1:{}/sparql'.format(listening_socket.getsockname()[1])
+		start = time.time()
+		with mock.patch.object(property_type_cache, 'PROPERTY_QUERY_TIMEOUT', 1):
+			with self.assertRaises(Exception):
+				PropertyTypeCache(url).resolve(['P585'])
+		self.assertLess(time.time() - start, 10)
+
+
+if __name__ == '__main__':
+	unittest.main()
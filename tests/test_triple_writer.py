@@ -0,0 +1,53 @@
+import io
+import unittest
+import rdflib
+from rdflib.namespace import XSD
+from etk.wikidata.entity import WDItem
+from etk.wikidata.value import StringValue, TimeValue, Item, Precision
+from Code.TripleWriter import TripleWriter, BOUND_NAMESPACES
+
+
+def write_item(filetype: str, value: str) -> str:
+	"""
+	This function writes an item with a string statement and a time statement
+	:param filetype:
+	:param value: value of the string statement
+	:return:
+	"""
+	output_file = io.StringIO()
+	triple_writer = TripleWriter(output_file, filetype)
+	item = WDItem('Q100', creator='http://www.isi.edu/t2wml')
+	item.add_statement('P1476', StringValue(value))
+	item.add_statement('P585', TimeValue('2020-01-01T00:00:00', Item('Q1985727'), Precision.year, 0))
+	triple_writer.add_subject(item)
+	triple_writer.close()
+	return output_file.getvalue()
+
+
+class TestTripleWriter(unittest.TestCase):
+	def test_ntriples_multi_line_literal(self):
+		value = 'line\nbreak\r with "quotes" and a \\ backslash'
+		triples = write_item('nt', value)
+		self.assertIn('"line\\nbreak\\r with \\"quotes\\" and a \\\\ backslash"', triples)
+		for line in triples.splitlines():
+			self.assertTrue(line.endswith(' .'), line)
+		graph = rdflib.Graph().parse(data=triples, format='nt')
+		self.assertIn(rdflib.Literal(value, datatype=XSD.string), set(graph.objects()))
+
+	def test_turtle_multi_line_literal(self):
+		value = 'line\nbreak'
+		triples = write_item('ttl', value)
+		graph = rdflib.Graph().parse(data=triples, format='turtle')
+		self.assertIn(rdflib.Literal(value, datatype=XSD.string), set(graph.objects()))
+		self.assertEqual(len(graph), len(rdflib.Graph().parse(data=write_item('nt', value), format='nt')))
+
+	def test_turtle_declares_only_bound_prefixes(self):
+		triples = write_item('ttl', 'value')
+		prefixes = [line.split()[1][:-1] for line in triples.splitlines() if line.startswith('@prefix')]
+		self.assertEqual(prefixes, sorted(BOUND_NAMESPACES))
+		self.assertNotIn('xsd:', triples)
+		self.assertIn('<http://www.w3.org/2001/XMLSchema#dateTime>', triples)
+
+
+if __name__ == '__main__':
+	unittest.main()